@@ -5,9 +5,14 @@ Kullanıcı dostu konsol arayüzü ile rezervasyon sistemi yönetimi.
 """
 
 import os
+import re
+import heapq
 import sys
-from datetime import datetime, timedelta, date
-from typing import Optional, Callable
+import threading
+from functools import lru_cache
+from operator import attrgetter
+from datetime import datetime, timedelta, date, time
+from typing import Optional, Callable, Dict, Iterator, List, Sequence
 
 # Proje kök dizinini path'e ekle
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -19,6 +24,81 @@ from reservation_system import (
 from data_manager import DataManager
 
 
+# ANSI renk kodlarını temizleyen derlenmiş ifade (görünür genişlik hesabı için)
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m').sub
+
+
+def _pad(text: str, width: int) -> str:
+    """Renkli metni görünür uzunluğuna göre sola hizala"""
+    return text + ' ' * max(0, width - len(_ANSI_RE('', text)))
+
+
+def _fmt_minutes(dt: datetime) -> str:
+    """Tarih-saati "YYYY-MM-DD HH:MM" biçiminde döndür (strftime'dan hızlı)"""
+    return dt.isoformat(sep=' ', timespec='minutes')
+
+
+def _fmt_hm(dt: datetime) -> str:
+    """Saati "HH:MM" biçiminde döndür (strftime'dan hızlı)"""
+    return f"{dt.hour:02d}:{dt.minute:02d}"
+
+
+# Tablo başlıkları ve satır şablonları (her satırda yeniden oluşturulmaz)
+_ROOM_TABLE_HEADER = f"{'ID':<8} {'İsim':<25} {'Kapasite':>10} {'Tür':<15} {'Kat':>5} {'Ücret':>10}"
+_ROOM_ROW_FMT = "{status} {id:<6} {name:<25} {capacity:>10} {type:<15} {floor:>5} {rate:>10.0f} TL".format
+
+_RES_TABLE_HEADER = f"{'ID':<10} {'Tarih':<12} {'Saat':<13} {'Salon':<20} {'Müşteri':<20} {'Durum':<12}"
+# Durum sütunu renkli olduğu için _pad ile önceden hizalanır (ANSI kodları genişliğe sayılır)
+_RES_ROW_FMT = "{id:<10} {date:<12} {span:<13} {room:<20} {customer:<20} {status}".format
+
+@lru_cache(maxsize=8)
+def _render_room_list(rows: tuple, color: Callable) -> str:
+    """Numaralı salon listesini oluştur (aynı satırlar için önbellekten döner)"""
+    return "\n".join(
+        f"  {color(str(i), 'cyan')}. {'●' if is_active else '○'} {name} (Kapasite: {capacity})"
+        for i, (is_active, name, capacity) in enumerate(rows, 1)
+    )
+
+
+@lru_cache(maxsize=32)
+def _render_header(title: str, color: Callable) -> str:
+    """Çerçeveli başlık bloğunu oluştur (başlık başına bir kez)"""
+    width = 60
+    bar = color("=" * width, 'cyan', bold=True)
+    return "\n".join(("", bar, color(f"{title:^{width}}", 'cyan', bold=True), bar))
+
+
+@lru_cache(maxsize=32)
+def _render_section(title: str, color: Callable) -> str:
+    """Bölüm başlığı bloğunu oluştur (başlık başına bir kez)"""
+    return "\n" + color(f"--- {title} ---", 'yellow', bold=True)
+
+
+@lru_cache(maxsize=256)
+def _colorize(text: str, color: str, bold: bool) -> str:
+    """
+    ANSI renkli metin (sınırlı önbellek)
+    
+    Mesajlar, sayılar ve kullanıcı girdisi de renklendirildiği için önbellek
+    boyutu sabittir; oturum boyunca büyümez.
+    """
+    return f"{CLI._BOLD if bold else ''}{CLI._COLOR_TBL[color]}{text}{CLI._RESET}"
+
+
+# Müsait slot aramasında kullanılan gün aralığı
+_T_START = time(8, 0)
+_T_END = time(20, 0)
+
+
+# Sabit seçenek listeleri (enum değerleri değişmez, bir kez oluşturulur)
+_ROOM_TYPE_BY_VALUE = {rt.value: rt for rt in RoomType}
+_ROOM_TYPE_VALUES = tuple(_ROOM_TYPE_BY_VALUE)
+_ROOM_TYPE_CHOICES_ALL = ("Tümü",) + _ROOM_TYPE_VALUES
+_PRIORITY_BY_LABEL = {"VIP (1)": 1, "Normal (2)": 2, "Düşük (3)": 3}
+_PRIORITY_OPTIONS = tuple(_PRIORITY_BY_LABEL)
+_PRIORITY_NAMES = {1: 'VIP', 2: 'Normal', 3: 'Düşük'}
+
+
 class CLI:
     """
     Komut Satırı Arayüzü
@@ -27,79 +107,274 @@ class CLI:
     """
     
     # ANSI renk kodları
-    COLORS = {
-        'reset': '\033[0m',
-        'bold': '\033[1m',
-        'red': '\033[91m',
-        'green': '\033[92m',
-        'yellow': '\033[93m',
-        'blue': '\033[94m',
-        'magenta': '\033[95m',
-        'cyan': '\033[96m',
-        'white': '\033[97m',
+    _RESET = '\033[0m'
+    _BOLD = '\033[1m'
+    _C_RED = '\033[91m'
+    _C_GREEN = '\033[92m'
+    _C_YELLOW = '\033[93m'
+    _C_BLUE = '\033[94m'
+    _C_MAGENTA = '\033[95m'
+    _C_CYAN = '\033[96m'
+    _C_WHITE = '\033[97m'
+    # Ekranı ve kaydırma geçmişini sil, imleci başa al
+    _CLEAR = '\033[2J\033[3J\033[H'
+    
+    # Renk adı -> ANSI kodu (doğrudan indeksleme, bilinmeyen renk KeyError verir)
+    _COLOR_TBL = {
+        'red': _C_RED,
+        'green': _C_GREEN,
+        'yellow': _C_YELLOW,
+        'blue': _C_BLUE,
+        'magenta': _C_MAGENTA,
+        'cyan': _C_CYAN,
+        'white': _C_WHITE,
     }
     
-    def __init__(self, system: ReservationSystem = None, data_manager: DataManager = None):
+    # Sabit menü tanımları: (numara, metin, numara rengi)
+    MAIN_MENU = (
+        ("1", "Salon Yönetimi", 'cyan'),
+        ("2", "Rezervasyon Yönetimi", 'cyan'),
+        ("3", "Arama ve Sorgulama", 'cyan'),
+        ("4", "Raporlar", 'cyan'),
+        ("5", "Bekleme Listesi", 'cyan'),
+        ("6", "Veri İşlemleri", 'cyan'),
+        ("7", "Geri Al / Yinele", 'cyan'),
+        ("0", "Çıkış", 'red'),
+    )
+    
+    ROOM_MENU = (
+        ("1", "Salonları Listele", 'cyan'),
+        ("2", "Yeni Salon Ekle", 'cyan'),
+        ("3", "Salon Detayı Görüntüle", 'cyan'),
+        ("4", "Salon Düzenle", 'cyan'),
+        ("5", "Salon Sil", 'cyan'),
+        ("6", "Salon Ara", 'cyan'),
+        ("7", "Salon Bağlantıları", 'cyan'),
+        ("0", "Ana Menüye Dön", 'yellow'),
+    )
+    
+    CONNECTION_MENU = (
+        ("1", "Bağlantı Ekle", 'cyan'),
+        ("2", "En Kısa Yol Bul", 'cyan'),
+        ("0", "Geri", 'yellow'),
+    )
+    
+    RESERVATION_MENU = (
+        ("1", "Yeni Rezervasyon", 'cyan'),
+        ("2", "Rezervasyonları Listele", 'cyan'),
+        ("3", "Rezervasyon Detayı", 'cyan'),
+        ("4", "Rezervasyon Güncelle", 'cyan'),
+        ("5", "Rezervasyon İptal", 'cyan'),
+        ("6", "Müsait Zamanları Gör", 'cyan'),
+        ("7", "Çakışma Kontrolü", 'cyan'),
+        ("0", "Ana Menüye Dön", 'yellow'),
+    )
+    
+    LIST_RESERVATIONS_MENU = (
+        ("1", "Bugünkü rezervasyonlar", 'cyan'),
+        ("2", "Belirli bir tarih", 'cyan'),
+        ("3", "Belirli bir salon", 'cyan'),
+        ("4", "Yaklaşan rezervasyonlar", 'cyan'),
+    )
+    
+    SEARCH_MENU = (
+        ("1", "Metin Araması", 'cyan'),
+        ("2", "Müşteri Rezervasyonları", 'cyan'),
+        ("0", "Ana Menüye Dön", 'yellow'),
+    )
+    
+    REPORT_MENU = (
+        ("1", "Günlük Rapor", 'cyan'),
+        ("2", "Salon Kullanım Oranı", 'cyan'),
+        ("3", "Sistem İstatistikleri", 'cyan'),
+        ("4", "Raporu CSV Olarak Dışa Aktar", 'cyan'),
+        ("0", "Ana Menüye Dön", 'yellow'),
+    )
+    
+    WAITING_LIST_MENU = (
+        ("1", "Listeyi Görüntüle", 'cyan'),
+        ("2", "Listeye Ekle", 'cyan'),
+        ("3", "Listeden Çıkar", 'cyan'),
+        ("4", "Sıradakini Çağır", 'cyan'),
+        ("0", "Ana Menüye Dön", 'yellow'),
+    )
+    
+    DATA_MENU = (
+        ("1", "Verileri Kaydet", 'cyan'),
+        ("2", "Yedek Oluştur", 'cyan'),
+        ("3", "Yedekten Geri Yükle", 'cyan'),
+        ("4", "CSV Dışa Aktar", 'cyan'),
+        ("5", "Örnek Veri Oluştur", 'cyan'),
+        ("0", "Ana Menüye Dön", 'yellow'),
+    )
+    
+    UNDO_REDO_MENU = (
+        ("1", "Geri Al (Undo)", 'cyan'),
+        ("2", "Yinele (Redo)", 'cyan'),
+        ("0", "Ana Menüye Dön", 'yellow'),
+    )
+    
+    # Rezervasyon durumu -> renk
+    STATUS_COLORS = {
+        ReservationStatus.CONFIRMED: 'green',
+        ReservationStatus.PENDING: 'yellow',
+        ReservationStatus.CANCELLED: 'red',
+        ReservationStatus.COMPLETED: 'blue'
+    }
+    
+    # Bu kadar değişiklik biriktiğinde arka planda otomatik kaydedilir
+    AUTOSAVE_EVERY = 10
+    
+    def __init__(self, system: ReservationSystem = None, data_manager: DataManager = None,
+                 quiet: bool = False, no_color: bool = False):
         self.system = system or ReservationSystem()
         self.data_manager = data_manager or DataManager()
         self.running = True
+        self.quiet = quiet
+        
+        # Sessiz modda mesajlar, renkler ve ekran temizleme bir kez devre dışı bırakılır
+        if quiet:
+            self.print_success = self.print_error = lambda *a, **k: None
+            self.print_warning = self.print_info = lambda *a, **k: None
+            self.clear_screen = lambda: None
+        
+        # Renk kapalıysa (bayrak, NO_COLOR veya terminal olmayan çıktı) color() hiç çalışmaz
+        if quiet or no_color or os.environ.get('NO_COLOR') or not sys.stdout.isatty():
+            self.color = lambda text, *a, **k: text
+        
+        # Menü önbellekleri
+        self._menu_cache = {}
+        self._choice_cache = {}
+        
+        # Ekran çıktısı tamponu (girdi beklenmeden önce tek seferde yazılır)
+        self._out: List[str] = []
+        # Tampondaki satırlardan önce yazılacak ham metin (ekran temizleme kodu vb.)
+        self._screen_prefix = ""
+        
+        # Girdi bir terminal değilse (betik modu) stdin ilk okumada tek seferde alınır
+        self._interactive = sys.stdin.isatty()
+        self._script_lines: Optional[Iterator[str]] = None
+        
+        # Arka plan kaydı (otomatik kaydetme)
+        self._save_thread: Optional[threading.Thread] = None
+        self._saved_version = 0
+        
+        # select_room için salon listesi ve liste satırları (_render_room_list anahtarı)
+        # (salon eklendiğinde/silindiğinde/güncellendiğinde sıfırlanır)
+        self._room_cache: Optional[List[Room]] = None
+        self._room_rows: tuple = ()
+        # Listeleme döngüleri için id -> Room eşlemesi (aynı anda sıfırlanır)
+        self._room_map: Optional[Dict[str, Room]] = None
+        
+        # Tablo satırlarında tekrar tekrar kullanılan renkli sabitler
+        self._status_dot_active = self.color("●", 'green')
+        self._status_dot_inactive = self.color("○", 'red')
+        self._status_colored = {
+            status: self.color(status.value, self.STATUS_COLORS.get(status, 'white'))
+            for status in ReservationStatus
+        }
         
         # Windows için renk desteği
         if sys.platform == 'win32':
             os.system('color')
     
     def color(self, text: str, color: str, bold: bool = False) -> str:
-        """Metni renklendir"""
-        prefix = self.COLORS.get('bold', '') if bold else ''
-        return f"{prefix}{self.COLORS.get(color, '')}{text}{self.COLORS['reset']}"
+        """Metni renklendir (sık kullanılanlar sınırlı önbellekten döner)"""
+        return _colorize(text, color, bold)
+    
+    def render_menu(self, items: tuple) -> str:
+        """Menü satırlarını oluştur (her menü bir kez renklendirilir)"""
+        cached = self._menu_cache.get(items)
+        if cached is None:
+            cached = "\n".join(self.color(f"  {num}.", color) + f" {text}"
+                               for num, text, color in items)
+            self._menu_cache[items] = cached
+        return cached
+    
+    def emit(self, line: str = "") -> None:
+        """Satırı çıktı tamponuna ekle"""
+        self._out.append(line)
+    
+    def flush_output(self) -> None:
+        """Tampondaki satırları (ve bekleyen ekran temizlemeyi) tek bir write çağrısıyla yazdır"""
+        if self._out or self._screen_prefix:
+            self._out.append("")
+            sys.stdout.write(self._screen_prefix + "\n".join(self._out))
+            self._out.clear()
+            self._screen_prefix = ""
+        sys.stdout.flush()
     
     def clear_screen(self):
-        """Ekranı temizle"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Ekranı temizle (kod tampona eklenir, menüyle birlikte tek seferde yazılır)"""
+        if self._out:
+            self._out.append("")
+            self._screen_prefix += "\n".join(self._out)
+            self._out.clear()
+        self._screen_prefix += self._CLEAR
     
     def print_header(self, title: str):
         """Başlık yazdır"""
-        width = 60
-        print()
-        print(self.color("=" * width, 'cyan', bold=True))
-        print(self.color(f"{title:^{width}}", 'cyan', bold=True))
-        print(self.color("=" * width, 'cyan', bold=True))
+        self.emit(_render_header(title, self.color))
     
     def print_section(self, title: str):
         """Bölüm başlığı yazdır"""
-        print()
-        print(self.color(f"--- {title} ---", 'yellow', bold=True))
+        self.emit(_render_section(title, self.color))
     
     def print_success(self, message: str):
         """Başarı mesajı"""
-        print(self.color(f"✓ {message}", 'green'))
+        self.emit(self.color(f"✓ {message}", 'green'))
     
     def print_error(self, message: str):
         """Hata mesajı"""
-        print(self.color(f"✗ {message}", 'red'))
+        self.emit(self.color(f"✗ {message}", 'red'))
     
     def print_warning(self, message: str):
         """Uyarı mesajı"""
-        print(self.color(f"⚠ {message}", 'yellow'))
+        self.emit(self.color(f"⚠ {message}", 'yellow'))
     
     def print_info(self, message: str):
         """Bilgi mesajı"""
-        print(self.color(f"ℹ {message}", 'blue'))
+        self.emit(self.color(f"ℹ {message}", 'blue'))
     
     def get_input(self, prompt: str, default: str = None) -> str:
         """Kullanıcıdan girdi al"""
-        if default:
-            prompt = f"{prompt} [{default}]: "
-        else:
-            prompt = f"{prompt}: "
-        
-        value = input(self.color(prompt, 'white')).strip()
+        value = self._read_line(self._format_prompt(prompt, default)).strip()
         return value if value else (default or '')
     
+    @staticmethod
+    def _format_prompt(prompt: str, default: Optional[str]) -> str:
+        """Girdi istemini varsayılan değerle birlikte oluştur"""
+        return f"{prompt} [{default}]: " if default else f"{prompt}: "
+    
+    def _read_line(self, prompt: str) -> str:
+        """Bir satır girdi oku (betik modunda renksiz istem, önceden okunmuş stdin)"""
+        self.flush_output()
+        if self._interactive:
+            sys.stdout.write(self.color(prompt, 'white'))
+            sys.stdout.flush()
+            line = sys.stdin.readline()
+            if not line:
+                raise EOFError
+            return line.rstrip('\n')
+        
+        if self._script_lines is None:
+            self._script_lines = iter(sys.stdin.read().splitlines())
+        sys.stdout.write(prompt)
+        line = next(self._script_lines, None)
+        if line is None:
+            raise EOFError
+        return line
+    
     def get_int(self, prompt: str, default: int = None, min_val: int = None, max_val: int = None) -> Optional[int]:
         """Sayısal girdi al"""
+        # İstem ve hata mesajları döngü dışında bir kez oluşturulur
+        default_str = str(default) if default else None
+        prompt_str = self._format_prompt(prompt, default_str)
+        err_min = f"Değer en az {min_val} olmalı"
+        err_max = f"Değer en fazla {max_val} olmalı"
+        
         while True:
-            value = self.get_input(prompt, str(default) if default else None)
+            value = self._read_line(prompt_str).strip() or default_str or ''
             
             if not value and default is not None:
                 return default
@@ -107,10 +382,10 @@ class CLI:
             try:
                 num = int(value)
                 if min_val is not None and num < min_val:
-                    self.print_error(f"Değer en az {min_val} olmalı")
+                    self.print_error(err_min)
                     continue
                 if max_val is not None and num > max_val:
-                    self.print_error(f"Değer en fazla {max_val} olmalı")
+                    self.print_error(err_max)
                     continue
                 return num
             except ValueError:
@@ -124,33 +399,41 @@ class CLI:
         while True:
             value = self.get_input(f"{prompt} (YYYY-MM-DD)", default.isoformat())
             
-            try:
-                return date.fromisoformat(value)
-            except ValueError:
-                self.print_error("Geçerli bir tarih girin (örn: 2024-01-15)")
+            # Ucuz ön kontrol: yıl kısmı rakam değilse ayrıştırmaya gerek yok
+            if value[:4].isdecimal():
+                try:
+                    return date.fromisoformat(value)
+                except ValueError:
+                    pass
+            self.print_error("Geçerli bir tarih girin (örn: 2024-01-15)")
     
     def get_time(self, prompt: str, default: str = "09:00") -> Optional[str]:
         """Saat girdisi al"""
         while True:
             value = self.get_input(f"{prompt} (HH:MM)", default)
             
-            try:
-                parts = value.split(':')
-                hour = int(parts[0])
-                minute = int(parts[1]) if len(parts) > 1 else 0
-                
-                if 0 <= hour <= 23 and 0 <= minute <= 59:
+            # İstisna fırlatmadan doğrula (hatalı girişte hızlı çıkış)
+            hh, sep, mm = value.partition(':')
+            if not sep:
+                mm = '0'
+            if hh.isdecimal() and mm.isdecimal():
+                hour = int(hh)
+                minute = int(mm)
+                if hour <= 23 and minute <= 59:
                     return f"{hour:02d}:{minute:02d}"
-                else:
-                    raise ValueError()
-            except (ValueError, IndexError):
-                self.print_error("Geçerli bir saat girin (örn: 14:30)")
+            self.print_error("Geçerli bir saat girin (örn: 14:30)")
     
-    def get_choice(self, prompt: str, options: list) -> Optional[str]:
+    def get_choice(self, prompt: str, options: Sequence[str]) -> Optional[str]:
         """Seçenek listesinden seçim"""
-        print()
-        for i, opt in enumerate(options, 1):
-            print(f"  {self.color(str(i), 'cyan')}. {opt}")
+        key = tuple(options)
+        block = self._choice_cache.get(key)
+        if block is None:
+            block = "\n".join(f"  {self.color(str(i), 'cyan')}. {opt}"
+                               for i, opt in enumerate(options, 1))
+            self._choice_cache[key] = block
+        
+        self.emit("")
+        self.emit(block)
         
         choice = self.get_int(prompt, min_val=1, max_val=len(options))
         return options[choice - 1] if choice else None
@@ -166,7 +449,7 @@ class CLI:
     
     def pause(self):
         """Devam etmek için bekle"""
-        input(self.color("\nDevam etmek için Enter'a basın...", 'white'))
+        self._read_line("\nDevam etmek için Enter'a basın...")
     
     # ==================== ANA MENÜ ====================
     
@@ -175,23 +458,16 @@ class CLI:
         self.print_header("SALON REZERVASYON SİSTEMİ")
         
         stats = self.system.get_statistics()
-        print()
-        print(f"  Salonlar: {self.color(str(stats['total_rooms']), 'green')}")
-        print(f"  Aktif Rezervasyonlar: {self.color(str(stats['active_reservations']), 'green')}")
-        print(f"  Bekleme Listesi: {self.color(str(stats['waiting_list_size']), 'yellow')}")
+        self.emit("")
+        self.emit(f"  Salonlar: {self.color(str(stats['total_rooms']), 'green')}")
+        self.emit(f"  Aktif Rezervasyonlar: {self.color(str(stats['active_reservations']), 'green')}")
+        self.emit(f"  Bekleme Listesi: {self.color(str(stats['waiting_list_size']), 'yellow')}")
         
         if self.system.can_undo():
-            print(f"  Geri Al: {self.color(self.system.get_undo_description(), 'blue')}")
-        
-        print()
-        print(self.color("  1.", 'cyan') + " Salon Yönetimi")
-        print(self.color("  2.", 'cyan') + " Rezervasyon Yönetimi")
-        print(self.color("  3.", 'cyan') + " Arama ve Sorgulama")
-        print(self.color("  4.", 'cyan') + " Raporlar")
-        print(self.color("  5.", 'cyan') + " Bekleme Listesi")
-        print(self.color("  6.", 'cyan') + " Veri İşlemleri")
-        print(self.color("  7.", 'cyan') + " Geri Al / Yinele")
-        print(self.color("  0.", 'red') + " Çıkış")
+            self.emit(f"  Geri Al: {self.color(self.system.get_undo_description(), 'blue')}")
+        
+        self.emit("")
+        self.emit(self.render_menu(self.MAIN_MENU))
         
         return self.get_int("\nSeçiminiz", min_val=0, max_val=7)
     
@@ -199,33 +475,59 @@ class CLI:
         """Ana döngü"""
         # Mevcut verileri yükle
         self.data_manager.load_system_state(self.system)
+        self._saved_version = self.system.version
         
-        while self.running:
-            self.clear_screen()
-            choice = self.show_main_menu()
-            
-            if choice == 0:
-                if self.confirm("Çıkmak istediğinize emin misiniz?"):
-                    self.save_and_exit()
-            elif choice == 1:
-                self.room_menu()
-            elif choice == 2:
-                self.reservation_menu()
-            elif choice == 3:
-                self.search_menu()
-            elif choice == 4:
-                self.report_menu()
-            elif choice == 5:
-                self.waiting_list_menu()
-            elif choice == 6:
-                self.data_menu()
-            elif choice == 7:
-                self.undo_redo_menu()
+        try:
+            while self.running:
+                self._autosave()
+                self.clear_screen()
+                choice = self.show_main_menu()
+                
+                if choice == 0:
+                    if self.quiet or self.confirm("Çıkmak istediğinize emin misiniz?"):
+                        self.save_and_exit()
+                elif choice == 1:
+                    self.room_menu()
+                elif choice == 2:
+                    self.reservation_menu()
+                elif choice == 3:
+                    self.search_menu()
+                elif choice == 4:
+                    self.report_menu()
+                elif choice == 5:
+                    self.waiting_list_menu()
+                elif choice == 6:
+                    self.data_menu()
+                elif choice == 7:
+                    self.undo_redo_menu()
+        finally:
+            self.flush_output()
+            self._wait_for_save()
+    
+    def _autosave(self):
+        """Yeterli değişiklik biriktiyse verileri arka planda kaydet"""
+        version = self.system.version
+        if version - self._saved_version < self.AUTOSAVE_EVERY:
+            return
+        if self._save_thread is not None and self._save_thread.is_alive():
+            return
+        
+        self._save_thread = self.data_manager.save_system_state_async(self.system)
+        self._saved_version = version
+    
+    def _wait_for_save(self):
+        """Devam eden arka plan kaydının bitmesini bekle"""
+        if self._save_thread is not None:
+            self._save_thread.join()
+            self._save_thread = None
     
     def save_and_exit(self):
         """Kaydet ve çık"""
         self.print_info("Veriler kaydediliyor...")
+        self.flush_output()
+        self._wait_for_save()
         self.data_manager.save_system_state(self.system)
+        self._saved_version = self.system.version
         self.print_success("Veriler kaydedildi. Güle güle!")
         self.running = False
     
@@ -237,15 +539,8 @@ class CLI:
             self.clear_screen()
             self.print_header("SALON YÖNETİMİ")
             
-            print()
-            print(self.color("  1.", 'cyan') + " Salonları Listele")
-            print(self.color("  2.", 'cyan') + " Yeni Salon Ekle")
-            print(self.color("  3.", 'cyan') + " Salon Detayı Görüntüle")
-            print(self.color("  4.", 'cyan') + " Salon Düzenle")
-            print(self.color("  5.", 'cyan') + " Salon Sil")
-            print(self.color("  6.", 'cyan') + " Salon Ara")
-            print(self.color("  7.", 'cyan') + " Salon Bağlantıları")
-            print(self.color("  0.", 'yellow') + " Ana Menüye Dön")
+            self.emit("")
+            self.emit(self.render_menu(self.ROOM_MENU))
             
             choice = self.get_int("\nSeçiminiz", min_val=0, max_val=7)
             
@@ -279,14 +574,15 @@ class CLI:
         if not rooms:
             self.print_warning("Kayıtlı salon yok")
         else:
-            print()
-            print(f"{'ID':<8} {'İsim':<25} {'Kapasite':>10} {'Tür':<15} {'Kat':>5} {'Ücret':>10}")
-            print("-" * 80)
+            self.emit("")
+            self.emit(_ROOM_TABLE_HEADER)
+            self.emit("-" * 80)
             
             for room in rooms:
-                status = self.color("●", 'green') if room.is_active else self.color("○", 'red')
-                print(f"{status} {room.id:<6} {room.name:<25} {room.capacity:>10} "
-                      f"{room.room_type.value:<15} {room.floor:>5} {room.hourly_rate:>10.0f} TL")
+                status = self._status_dot_active if room.is_active else self._status_dot_inactive
+                self.emit(_ROOM_ROW_FMT(status=status, id=room.id, name=room.name,
+                                        capacity=room.capacity, type=room.room_type.value,
+                                        floor=room.floor, rate=room.hourly_rate))
         
         self.pause()
     
@@ -306,8 +602,7 @@ class CLI:
         
         capacity = self.get_int("Kapasite", default=10, min_val=1, max_val=1000)
         
-        room_types = [rt.value for rt in RoomType]
-        room_type = self.get_choice("Salon Türü", room_types)
+        room_type = self.get_choice("Salon Türü", _ROOM_TYPE_VALUES)
         
         floor = self.get_int("Kat", default=1, min_val=-5, max_val=100)
         hourly_rate = self.get_int("Saatlik Ücret (TL)", default=100, min_val=0)
@@ -319,7 +614,7 @@ class CLI:
             id=room_id,
             name=name,
             capacity=capacity,
-            room_type=RoomType(room_type),
+            room_type=_ROOM_TYPE_BY_VALUE[room_type],
             floor=floor,
             amenities=amenities,
             hourly_rate=float(hourly_rate),
@@ -327,6 +622,7 @@ class CLI:
         )
         
         if self.system.add_room(room):
+            self._invalidate_room_cache()
             self.print_success(f"Salon eklendi: {name} (ID: {room_id})")
         else:
             self.print_error("Salon eklenemedi (ID zaten mevcut olabilir)")
@@ -347,23 +643,23 @@ class CLI:
             self.pause()
             return
         
-        print()
-        print(f"  ID: {self.color(room.id, 'cyan')}")
-        print(f"  İsim: {self.color(room.name, 'green', bold=True)}")
-        print(f"  Kapasite: {room.capacity} kişi")
-        print(f"  Tür: {room.room_type.value}")
-        print(f"  Kat: {room.floor}")
-        print(f"  Saatlik Ücret: {room.hourly_rate:.0f} TL")
-        print(f"  Donanımlar: {', '.join(room.amenities) if room.amenities else 'Yok'}")
-        print(f"  Durum: {self.color('Aktif', 'green') if room.is_active else self.color('Pasif', 'red')}")
+        self.emit("")
+        self.emit(f"  ID: {self.color(room.id, 'cyan')}")
+        self.emit(f"  İsim: {self.color(room.name, 'green', bold=True)}")
+        self.emit(f"  Kapasite: {room.capacity} kişi")
+        self.emit(f"  Tür: {room.room_type.value}")
+        self.emit(f"  Kat: {room.floor}")
+        self.emit(f"  Saatlik Ücret: {room.hourly_rate:.0f} TL")
+        self.emit(f"  Donanımlar: {', '.join(room.amenities) if room.amenities else 'Yok'}")
+        self.emit(f"  Durum: {self.color('Aktif', 'green') if room.is_active else self.color('Pasif', 'red')}")
         
         # Bugünkü rezervasyonlar
         today_reservations = self.system.get_reservations_by_room(room_id, date.today())
         if today_reservations:
-            print()
-            print(self.color("  Bugünkü Rezervasyonlar:", 'yellow'))
+            self.emit("")
+            self.emit(self.color("  Bugünkü Rezervasyonlar:", 'yellow'))
             for res in today_reservations:
-                print(f"    {res.start_time.strftime('%H:%M')}-{res.end_time.strftime('%H:%M')}: {res.title or res.customer_name}")
+                self.emit(f"    {_fmt_hm(res.start_time)}-{_fmt_hm(res.end_time)}: {res.title or res.customer_name}")
         
         self.pause()
     
@@ -381,8 +677,8 @@ class CLI:
             self.pause()
             return
         
-        print(f"\nDüzenlenen: {self.color(room.name, 'green')}")
-        print("(Değiştirmek istemediğiniz alanları boş bırakın)")
+        self.emit(f"\nDüzenlenen: {self.color(room.name, 'green')}")
+        self.emit("(Değiştirmek istemediğiniz alanları boş bırakın)")
         
         name = self.get_input("Yeni İsim", room.name)
         capacity = self.get_int("Yeni Kapasite", default=room.capacity, min_val=1)
@@ -398,6 +694,7 @@ class CLI:
         
         if updates:
             if self.system.update_room(room_id, **updates):
+                self._invalidate_room_cache()
                 self.print_success("Salon güncellendi")
             else:
                 self.print_error("Güncelleme başarısız")
@@ -424,6 +721,7 @@ class CLI:
         
         if self.confirm("Bu salonu silmek istediğinize emin misiniz?"):
             if self.system.delete_room(room_id):
+                self._invalidate_room_cache()
                 self.print_success("Salon silindi")
             else:
                 self.print_error("Salon silinemedi (aktif rezervasyonları olabilir)")
@@ -436,9 +734,8 @@ class CLI:
         
         capacity = self.get_int("Minimum kapasite", default=0, min_val=0)
         
-        room_types = ["Tümü"] + [rt.value for rt in RoomType]
-        type_choice = self.get_choice("Salon türü", room_types)
-        room_type = None if type_choice == "Tümü" else RoomType(type_choice)
+        type_choice = self.get_choice("Salon türü", _ROOM_TYPE_CHOICES_ALL)
+        room_type = None if type_choice == "Tümü" else _ROOM_TYPE_BY_VALUE[type_choice]
         
         results = self.system.search_rooms(
             capacity=capacity if capacity > 0 else None,
@@ -448,12 +745,12 @@ class CLI:
         if not results:
             self.print_warning("Kriterlere uygun salon bulunamadı")
         else:
-            print()
-            print(f"{'İsim':<25} {'Kapasite':>10} {'Tür':<15} {'Ücret':>10}")
-            print("-" * 65)
+            self.emit("")
+            self.emit(f"{'İsim':<25} {'Kapasite':>10} {'Tür':<15} {'Ücret':>10}")
+            self.emit("-" * 65)
             
             for room in results:
-                print(f"{room.name:<25} {room.capacity:>10} {room.room_type.value:<15} {room.hourly_rate:>10.0f} TL")
+                self.emit(f"{room.name:<25} {room.capacity:>10} {room.room_type.value:<15} {room.hourly_rate:>10.0f} TL")
         
         self.pause()
     
@@ -461,15 +758,13 @@ class CLI:
         """Salon bağlantıları"""
         self.print_section("Salon Bağlantıları ve Yol Bulma")
         
-        print()
-        print(self.color("  1.", 'cyan') + " Bağlantı Ekle")
-        print(self.color("  2.", 'cyan') + " En Kısa Yol Bul")
-        print(self.color("  0.", 'yellow') + " Geri")
+        self.emit("")
+        self.emit(self.render_menu(self.CONNECTION_MENU))
         
         choice = self.get_int("\nSeçiminiz", min_val=0, max_val=2)
         
         if choice == 1:
-            print("\nBağlantı eklenecek salonları seçin:")
+            self.emit("\nBağlantı eklenecek salonları seçin:")
             room1 = self.select_room("Salon 1")
             room2 = self.select_room("Salon 2")
             
@@ -481,15 +776,15 @@ class CLI:
                     self.print_error("Bağlantı eklenemedi")
         
         elif choice == 2:
-            print("\nYol aranacak salonları seçin:")
+            self.emit("\nYol aranacak salonları seçin:")
             start = self.select_room("Başlangıç")
             end = self.select_room("Hedef")
             
             if start and end:
                 path, distance = self.system.find_shortest_path(start, end)
                 if path:
-                    print(f"\nEn kısa yol ({distance:.0f}m):")
-                    print(f"  {' -> '.join(path)}")
+                    self.emit(f"\nEn kısa yol ({distance:.0f}m):")
+                    self.emit(f"  {' -> '.join(path)}")
                 else:
                     self.print_warning("Yol bulunamadı")
         
@@ -497,20 +792,33 @@ class CLI:
     
     def select_room(self, prompt: str = "Salon seçin") -> Optional[str]:
         """Salon seçim yardımcısı"""
-        rooms = self.system.get_all_rooms()
+        if self._room_cache is None:
+            self._room_cache = self.system.get_all_rooms()
+            self._room_rows = tuple((room.is_active, room.name, room.capacity)
+                                    for room in self._room_cache)
+        rooms = self._room_cache
         
         if not rooms:
             self.print_warning("Kayıtlı salon yok")
             return None
         
-        print()
-        for i, room in enumerate(rooms, 1):
-            status = "●" if room.is_active else "○"
-            print(f"  {self.color(str(i), 'cyan')}. {status} {room.name} (Kapasite: {room.capacity})")
+        self.emit("")
+        self.emit(_render_room_list(self._room_rows, self.color))
         
         choice = self.get_int(f"\n{prompt}", min_val=1, max_val=len(rooms))
         return rooms[choice - 1].id if choice else None
     
+    def _invalidate_room_cache(self):
+        """Salon listesi değiştiğinde select_room önbelleğini sıfırla"""
+        self._room_cache = None
+        self._room_map = None
+    
+    def _get_room_map(self) -> Dict[str, Room]:
+        """id -> Room eşlemesi (salon önbelleğiyle birlikte geçersiz kılınır)"""
+        if self._room_map is None:
+            self._room_map = {room.id: room for room in self.system.get_all_rooms()}
+        return self._room_map
+    
     # ==================== REZERVASYON MENÜSÜ ====================
     
     def reservation_menu(self):
@@ -519,15 +827,8 @@ class CLI:
             self.clear_screen()
             self.print_header("REZERVASYON YÖNETİMİ")
             
-            print()
-            print(self.color("  1.", 'cyan') + " Yeni Rezervasyon")
-            print(self.color("  2.", 'cyan') + " Rezervasyonları Listele")
-            print(self.color("  3.", 'cyan') + " Rezervasyon Detayı")
-            print(self.color("  4.", 'cyan') + " Rezervasyon Güncelle")
-            print(self.color("  5.", 'cyan') + " Rezervasyon İptal")
-            print(self.color("  6.", 'cyan') + " Müsait Zamanları Gör")
-            print(self.color("  7.", 'cyan') + " Çakışma Kontrolü")
-            print(self.color("  0.", 'yellow') + " Ana Menüye Dön")
+            self.emit("")
+            self.emit(self.render_menu(self.RESERVATION_MENU))
             
             choice = self.get_int("\nSeçiminiz", min_val=0, max_val=7)
             
@@ -576,18 +877,15 @@ class CLI:
         end_time = self.get_time("Bitiş Saati", "10:00")
         
         # Öncelik
-        priority_options = ["VIP (1)", "Normal (2)", "Düşük (3)"]
-        priority_choice = self.get_choice("Öncelik", priority_options)
-        priority = int(priority_choice.split('(')[1].rstrip(')'))
+        priority_choice = self.get_choice("Öncelik", _PRIORITY_OPTIONS)
+        priority = _PRIORITY_BY_LABEL[priority_choice]
         
-        # DateTime oluştur
-        start_parts = start_time.split(':')
-        end_parts = end_time.split(':')
+        # DateTime oluştur (get_time her zaman "HH:MM" döndürür)
+        start_h, start_m = map(int, start_time.split(':'))
+        end_h, end_m = map(int, end_time.split(':'))
         
-        start_dt = datetime.combine(res_date, datetime.min.time().replace(
-            hour=int(start_parts[0]), minute=int(start_parts[1])))
-        end_dt = datetime.combine(res_date, datetime.min.time().replace(
-            hour=int(end_parts[0]), minute=int(end_parts[1])))
+        start_dt = datetime(res_date.year, res_date.month, res_date.day, start_h, start_m)
+        end_dt = datetime(res_date.year, res_date.month, res_date.day, end_h, end_m)
         
         if end_dt <= start_dt:
             self.print_error("Bitiş saati başlangıçtan sonra olmalı")
@@ -621,11 +919,12 @@ class CLI:
                     alternatives = self.system.suggest_alternatives(room_id, start_dt, duration)
                     
                     if alternatives:
-                        print("\nAlternatif öneriler:")
+                        self.emit("\nAlternatif öneriler:")
                         for i, alt in enumerate(alternatives[:5], 1):
-                            print(f"  {i}. {alt['room_name']} - "
-                                  f"{alt['start'].strftime('%d/%m %H:%M')} - "
-                                  f"{alt['end'].strftime('%H:%M')}")
+                            alt_start = alt['start']
+                            self.emit(f"  {i}. {alt['room_name']} - "
+                                  f"{alt_start.day:02d}/{alt_start.month:02d} {_fmt_hm(alt_start)} - "
+                                  f"{_fmt_hm(alt['end'])}")
         
         self.pause()
     
@@ -633,11 +932,8 @@ class CLI:
         """Rezervasyonları listele"""
         self.print_section("Rezervasyon Listesi")
         
-        print()
-        print(self.color("  1.", 'cyan') + " Bugünkü rezervasyonlar")
-        print(self.color("  2.", 'cyan') + " Belirli bir tarih")
-        print(self.color("  3.", 'cyan') + " Belirli bir salon")
-        print(self.color("  4.", 'cyan') + " Yaklaşan rezervasyonlar")
+        self.emit("")
+        self.emit(self.render_menu(self.LIST_RESERVATIONS_MENU))
         
         choice = self.get_int("\nSeçiminiz", min_val=1, max_val=4)
         
@@ -663,27 +959,26 @@ class CLI:
         if not reservations:
             self.print_warning("Rezervasyon bulunamadı")
         else:
-            print(f"\n{self.color(title, 'yellow')} ({len(reservations)} adet)")
-            print()
-            print(f"{'ID':<10} {'Tarih':<12} {'Saat':<13} {'Salon':<20} {'Müşteri':<20} {'Durum':<12}")
-            print("-" * 90)
+            self.emit(f"\n{self.color(title, 'yellow')} ({len(reservations)} adet)")
+            self.emit("")
+            self.emit(_RES_TABLE_HEADER)
+            self.emit("-" * 90)
+            
+            # Aynı salon birçok satırda tekrarlandığı için isimleri bir kez çöz
+            room_names = {}
             
             for res in reservations:
-                room = self.system.get_room(res.room_id)
-                room_name = room.name[:18] if room else res.room_id
-                
-                status_colors = {
-                    ReservationStatus.CONFIRMED: 'green',
-                    ReservationStatus.PENDING: 'yellow',
-                    ReservationStatus.CANCELLED: 'red',
-                    ReservationStatus.COMPLETED: 'blue'
-                }
-                status_color = status_colors.get(res.status, 'white')
+                room_name = room_names.get(res.room_id)
+                if room_name is None:
+                    room = self.system.get_room(res.room_id)
+                    room_name = room.name[:18] if room else res.room_id
+                    room_names[res.room_id] = room_name
                 
-                print(f"{res.id:<10} {res.start_time.strftime('%Y-%m-%d'):<12} "
-                      f"{res.start_time.strftime('%H:%M')}-{res.end_time.strftime('%H:%M'):<7} "
-                      f"{room_name:<20} {res.customer_name[:18]:<20} "
-                      f"{self.color(res.status.value, status_color):<12}")
+                start = _fmt_minutes(res.start_time)
+                self.emit(_RES_ROW_FMT(id=res.id, date=start[:10],
+                                       span=f"{start[11:]}-{_fmt_minutes(res.end_time)[11:]}",
+                                       room=room_name, customer=res.customer_name[:18],
+                                       status=_pad(self._status_colored[res.status], 12)))
         
         self.pause()
     
@@ -703,31 +998,26 @@ class CLI:
         
         room = self.system.get_room(reservation.room_id)
         
-        print()
-        print(f"  ID: {self.color(reservation.id, 'cyan')}")
-        print(f"  Başlık: {self.color(reservation.title or 'Belirtilmemiş', 'green', bold=True)}")
-        print(f"  Salon: {room.name if room else reservation.room_id}")
-        print(f"  Müşteri: {reservation.customer_name}")
-        print(f"  E-posta: {reservation.customer_email}")
-        print(f"  Tarih: {reservation.start_time.strftime('%Y-%m-%d')}")
-        print(f"  Saat: {reservation.start_time.strftime('%H:%M')} - {reservation.end_time.strftime('%H:%M')}")
-        print(f"  Süre: {reservation.duration_minutes} dakika")
-        print(f"  Katılımcı: {reservation.attendees} kişi")
-        
-        priority_names = {1: 'VIP', 2: 'Normal', 3: 'Düşük'}
-        print(f"  Öncelik: {priority_names.get(reservation.priority, 'Normal')}")
-        
-        status_colors = {
-            ReservationStatus.CONFIRMED: 'green',
-            ReservationStatus.PENDING: 'yellow',
-            ReservationStatus.CANCELLED: 'red',
-            ReservationStatus.COMPLETED: 'blue'
-        }
-        print(f"  Durum: {self.color(reservation.status.value, status_colors.get(reservation.status, 'white'))}")
-        print(f"  Oluşturma: {reservation.created_at.strftime('%Y-%m-%d %H:%M')}")
+        self.emit("")
+        self.emit(f"  ID: {self.color(reservation.id, 'cyan')}")
+        self.emit(f"  Başlık: {self.color(reservation.title or 'Belirtilmemiş', 'green', bold=True)}")
+        self.emit(f"  Salon: {room.name if room else reservation.room_id}")
+        self.emit(f"  Müşteri: {reservation.customer_name}")
+        self.emit(f"  E-posta: {reservation.customer_email}")
+        start = _fmt_minutes(reservation.start_time)
+        self.emit(f"  Tarih: {start[:10]}")
+        self.emit(f"  Saat: {start[11:]} - {_fmt_minutes(reservation.end_time)[11:]}")
+        duration_minutes = reservation.duration_minutes
+        self.emit(f"  Süre: {duration_minutes} dakika")
+        self.emit(f"  Katılımcı: {reservation.attendees} kişi")
+        
+        self.emit(f"  Öncelik: {_PRIORITY_NAMES.get(reservation.priority, 'Normal')}")
+        
+        self.emit(f"  Durum: {self._status_colored[reservation.status]}")
+        self.emit(f"  Oluşturma: {_fmt_minutes(reservation.created_at)}")
         
         if room:
-            print(f"\n  Tahmini Ücret: {reservation.duration_hours * room.hourly_rate:.0f} TL")
+            self.emit(f"\n  Tahmini Ücret: {duration_minutes / 60 * room.hourly_rate:.0f} TL")
         
         self.pause()
     
@@ -745,8 +1035,8 @@ class CLI:
             self.pause()
             return
         
-        print(f"\nGüncellenen: {self.color(reservation.title or reservation.customer_name, 'green')}")
-        print("(Değiştirmek istemediğiniz alanları boş bırakın)")
+        self.emit(f"\nGüncellenen: {self.color(reservation.title or reservation.customer_name, 'green')}")
+        self.emit("(Değiştirmek istemediğiniz alanları boş bırakın)")
         
         title = self.get_input("Yeni Başlık", reservation.title)
         attendees = self.get_int("Yeni Katılımcı Sayısı", default=reservation.attendees, min_val=1)
@@ -782,8 +1072,8 @@ class CLI:
             self.pause()
             return
         
-        print(f"\nİptal edilecek: {reservation.title or reservation.customer_name}")
-        print(f"  Tarih: {reservation.start_time.strftime('%Y-%m-%d %H:%M')}")
+        self.emit(f"\nİptal edilecek: {reservation.title or reservation.customer_name}")
+        self.emit(f"  Tarih: {_fmt_minutes(reservation.start_time)}")
         
         if self.confirm("Bu rezervasyonu iptal etmek istediğinize emin misiniz?"):
             reason = self.get_input("İptal nedeni (opsiyonel)")
@@ -807,8 +1097,8 @@ class CLI:
         target_date = self.get_date("Tarih", date.today())
         duration = self.get_int("Minimum süre (dakika)", default=30, min_val=15)
         
-        start = datetime.combine(target_date, datetime.min.time().replace(hour=8))
-        end = datetime.combine(target_date, datetime.min.time().replace(hour=20))
+        start = datetime.combine(target_date, _T_START)
+        end = datetime.combine(target_date, _T_END)
         
         available = self.system.find_available_slots(room_id, start, end, duration)
         
@@ -817,12 +1107,12 @@ class CLI:
         if not available:
             self.print_warning(f"{room.name} için {target_date} tarihinde uygun slot yok")
         else:
-            print(f"\n{self.color(room.name, 'green')} - {target_date}")
-            print(f"Minimum {duration} dakikalık müsait aralıklar:\n")
+            self.emit(f"\n{self.color(room.name, 'green')} - {target_date}")
+            self.emit(f"Minimum {duration} dakikalık müsait aralıklar:\n")
             
             for slot in available:
-                print(f"  {self.color('●', 'green')} {slot['start'].strftime('%H:%M')} - "
-                      f"{slot['end'].strftime('%H:%M')} ({slot['duration_minutes']} dk)")
+                self.emit(f"  {self.color('●', 'green')} {_fmt_hm(slot['start'])} - "
+                      f"{_fmt_hm(slot['end'])} ({slot['duration_minutes']} dk)")
         
         self.pause()
     
@@ -838,13 +1128,8 @@ class CLI:
         start_time = self.get_time("Başlangıç Saati", "09:00")
         end_time = self.get_time("Bitiş Saati", "10:00")
         
-        start_parts = start_time.split(':')
-        end_parts = end_time.split(':')
-        
-        start_dt = datetime.combine(res_date, datetime.min.time().replace(
-            hour=int(start_parts[0]), minute=int(start_parts[1])))
-        end_dt = datetime.combine(res_date, datetime.min.time().replace(
-            hour=int(end_parts[0]), minute=int(end_parts[1])))
+        start_dt = datetime.combine(res_date, datetime.strptime(start_time, "%H:%M").time())
+        end_dt = datetime.combine(res_date, datetime.strptime(end_time, "%H:%M").time())
         
         conflicts = self.system.check_conflict(room_id, start_dt, end_dt)
         
@@ -852,11 +1137,11 @@ class CLI:
             self.print_success("Çakışma yok! Bu zaman aralığı müsait.")
         else:
             self.print_warning(f"{len(conflicts)} çakışan rezervasyon bulundu:")
-            print()
+            self.emit("")
             
             for res in conflicts:
-                print(f"  {self.color('●', 'red')} {res.start_time.strftime('%H:%M')}-"
-                      f"{res.end_time.strftime('%H:%M')}: {res.title or res.customer_name}")
+                self.emit(f"  {self.color('●', 'red')} {_fmt_hm(res.start_time)}-"
+                      f"{_fmt_hm(res.end_time)}: {res.title or res.customer_name}")
         
         self.pause()
     
@@ -867,27 +1152,27 @@ class CLI:
         self.clear_screen()
         self.print_header("ARAMA VE SORGULAMA")
         
-        print()
-        print(self.color("  1.", 'cyan') + " Metin Araması")
-        print(self.color("  2.", 'cyan') + " Müşteri Rezervasyonları")
-        print(self.color("  0.", 'yellow') + " Ana Menüye Dön")
+        self.emit("")
+        self.emit(self.render_menu(self.SEARCH_MENU))
         
         choice = self.get_int("\nSeçiminiz", min_val=0, max_val=2)
         
         if choice == 1:
             query = self.get_input("Arama terimi")
             if query:
-                results = self.system.search_reservations(query)
+                # Tüm eşleşmeler sayılır, ama sadece gösterilen en yeni 20 tanesi sıralanır
+                matches = list(self.system.iter_search_reservations(query))
                 
-                if not results:
+                if not matches:
                     self.print_warning("Sonuç bulunamadı")
                 else:
-                    print(f"\n{len(results)} sonuç bulundu:\n")
+                    self.emit(f"\n{len(matches)} sonuç bulundu:\n")
                     
-                    for res in results[:20]:
-                        room = self.system.get_room(res.room_id)
-                        print(f"  [{res.id}] {res.start_time.strftime('%Y-%m-%d')} - "
-                              f"{res.customer_name} - {room.name if room else res.room_id}")
+                    rooms_by_id = self._get_room_map()
+                    for res in heapq.nlargest(20, matches, key=lambda r: r.start_time):
+                        room = rooms_by_id.get(res.room_id)
+                        self.emit(f"  [{res.id}] {_fmt_minutes(res.start_time)[:10]} - "
+                                  f"{res.customer_name} - {room.name if room else res.room_id}")
         
         elif choice == 2:
             email = self.get_input("Müşteri E-postası")
@@ -897,13 +1182,14 @@ class CLI:
                 if not results:
                     self.print_warning("Bu müşteriye ait rezervasyon yok")
                 else:
-                    print(f"\n{email} için {len(results)} rezervasyon:\n")
+                    self.emit(f"\n{email} için {len(results)} rezervasyon:\n")
                     
+                    rooms_by_id = self._get_room_map()
                     for res in results:
-                        room = self.system.get_room(res.room_id)
+                        room = rooms_by_id.get(res.room_id)
                         status_symbol = "✓" if res.status == ReservationStatus.CONFIRMED else "○"
-                        print(f"  {status_symbol} [{res.id}] {res.start_time.strftime('%Y-%m-%d %H:%M')} - "
-                              f"{room.name if room else res.room_id} - {res.title}")
+                        self.emit(f"  {status_symbol} [{res.id}] {_fmt_minutes(res.start_time)} - "
+                                  f"{room.name if room else res.room_id} - {res.title}")
         
         self.pause()
     
@@ -914,12 +1200,8 @@ class CLI:
         self.clear_screen()
         self.print_header("RAPORLAR")
         
-        print()
-        print(self.color("  1.", 'cyan') + " Günlük Rapor")
-        print(self.color("  2.", 'cyan') + " Salon Kullanım Oranı")
-        print(self.color("  3.", 'cyan') + " Sistem İstatistikleri")
-        print(self.color("  4.", 'cyan') + " Raporu CSV Olarak Dışa Aktar")
-        print(self.color("  0.", 'yellow') + " Ana Menüye Dön")
+        self.emit("")
+        self.emit(self.render_menu(self.REPORT_MENU))
         
         choice = self.get_int("\nSeçiminiz", min_val=0, max_val=4)
         
@@ -927,16 +1209,16 @@ class CLI:
             target_date = self.get_date("Rapor tarihi", date.today())
             report = self.system.get_daily_report(target_date)
             
-            print(f"\n{self.color(f'Günlük Rapor - {target_date}', 'yellow', bold=True)}")
-            print()
-            print(f"  Toplam Rezervasyon: {self.color(str(report['total_reservations']), 'green')}")
+            self.emit(f"\n{self.color(f'Günlük Rapor - {target_date}', 'yellow', bold=True)}")
+            self.emit("")
+            self.emit(f"  Toplam Rezervasyon: {self.color(str(report['total_reservations']), 'green')}")
             revenue_str = f"{report['total_revenue']:.0f} TL"
-            print(f"  Toplam Gelir: {self.color(revenue_str, 'green')}")
+            self.emit(f"  Toplam Gelir: {self.color(revenue_str, 'green')}")
             
             if report['by_room']:
-                print(f"\n  {self.color('Salon Bazlı:', 'cyan')}")
+                self.emit(f"\n  {self.color('Salon Bazlı:', 'cyan')}")
                 for room_name, data in report['by_room'].items():
-                    print(f"    {room_name}: {data['count']} rez., {data['minutes']} dk, {data['revenue']:.0f} TL")
+                    self.emit(f"    {room_name}: {data['count']} rez., {data['minutes']} dk, {data['revenue']:.0f} TL")
         
         elif choice == 2:
             room_id = self.select_room()
@@ -947,27 +1229,27 @@ class CLI:
                 util = self.system.get_room_utilization(room_id, start, end)
                 
                 room_name = util['room_name']
-                print(f"\n{self.color(f'Kullanım Raporu - {room_name}', 'yellow', bold=True)}")
-                print(f"  Dönem: {start} - {end}")
-                print()
-                print(f"  Toplam Müsait: {util['total_available_minutes']} dk")
-                print(f"  Kullanılan: {util['used_minutes']} dk")
+                self.emit(f"\n{self.color(f'Kullanım Raporu - {room_name}', 'yellow', bold=True)}")
+                self.emit(f"  Dönem: {start} - {end}")
+                self.emit("")
+                self.emit(f"  Toplam Müsait: {util['total_available_minutes']} dk")
+                self.emit(f"  Kullanılan: {util['used_minutes']} dk")
                 util_str = f"{util['utilization_percent']}%"
-                print(f"  Kullanım Oranı: {self.color(util_str, 'green')}")
-                print(f"  Rezervasyon Sayısı: {util['reservation_count']}")
+                self.emit(f"  Kullanım Oranı: {self.color(util_str, 'green')}")
+                self.emit(f"  Rezervasyon Sayısı: {util['reservation_count']}")
         
         elif choice == 3:
             stats = self.system.get_statistics()
             
-            print(f"\n{self.color('Sistem İstatistikleri', 'yellow', bold=True)}")
-            print()
-            print(f"  Toplam Salon: {self.color(str(stats['total_rooms']), 'cyan')}")
-            print(f"  Aktif Salon: {self.color(str(stats['active_rooms']), 'green')}")
-            print(f"  Toplam Rezervasyon: {self.color(str(stats['total_reservations']), 'cyan')}")
-            print(f"  Aktif Rezervasyon: {self.color(str(stats['active_reservations']), 'green')}")
-            print(f"  Bekleme Listesi: {self.color(str(stats['waiting_list_size']), 'yellow')}")
-            print(f"  Geri Alınabilir: {stats['undo_available']}")
-            print(f"  Yinelenebilir: {stats['redo_available']}")
+            self.emit(f"\n{self.color('Sistem İstatistikleri', 'yellow', bold=True)}")
+            self.emit("")
+            self.emit(f"  Toplam Salon: {self.color(str(stats['total_rooms']), 'cyan')}")
+            self.emit(f"  Aktif Salon: {self.color(str(stats['active_rooms']), 'green')}")
+            self.emit(f"  Toplam Rezervasyon: {self.color(str(stats['total_reservations']), 'cyan')}")
+            self.emit(f"  Aktif Rezervasyon: {self.color(str(stats['active_reservations']), 'green')}")
+            self.emit(f"  Bekleme Listesi: {self.color(str(stats['waiting_list_size']), 'yellow')}")
+            self.emit(f"  Geri Alınabilir: {stats['undo_available']}")
+            self.emit(f"  Yinelenebilir: {stats['redo_available']}")
         
         elif choice == 4:
             target_date = self.get_date("Rapor tarihi", date.today())
@@ -985,29 +1267,25 @@ class CLI:
         self.clear_screen()
         self.print_header("BEKLEME LİSTESİ")
         
-        print()
-        print(self.color("  1.", 'cyan') + " Listeyi Görüntüle")
-        print(self.color("  2.", 'cyan') + " Listeye Ekle")
-        print(self.color("  3.", 'cyan') + " Listeden Çıkar")
-        print(self.color("  4.", 'cyan') + " Sıradakini Çağır")
-        print(self.color("  0.", 'yellow') + " Ana Menüye Dön")
+        self.emit("")
+        self.emit(self.render_menu(self.WAITING_LIST_MENU))
         
         choice = self.get_int("\nSeçiminiz", min_val=0, max_val=4)
         
         if choice == 1:
-            entries = self.system.get_waiting_list()
+            count = self.system.get_waiting_list_size()
             
-            if not entries:
+            if not count:
                 self.print_info("Bekleme listesi boş")
             else:
-                print(f"\n{len(entries)} kişi bekliyor:\n")
+                self.emit(f"\n{count} kişi bekliyor:\n")
                 
-                for i, entry in enumerate(entries, 1):
-                    priority_names = {1: 'VIP', 2: 'Normal', 3: 'Düşük'}
-                    priority = priority_names.get(entry.priority, 'Normal')
+                # Sadece gösterim: liste kopyalanmadan sırayla gezilir
+                for i, entry in enumerate(self.system.iter_waiting_list(), 1):
+                    priority = _PRIORITY_NAMES.get(entry.priority, 'Normal')
                     pref = entry.room_preference or "Herhangi"
                     
-                    print(f"  {self.color(str(i), 'cyan')}. {entry.customer_name} "
+                    self.emit(f"  {self.color(str(i), 'cyan')}. {entry.customer_name} "
                           f"(Öncelik: {priority}, Tercih: {pref})")
         
         elif choice == 2:
@@ -1017,9 +1295,8 @@ class CLI:
             if customer_name:
                 room_id = self.select_room("Salon Tercihi (opsiyonel)")
                 
-                priority_options = ["VIP (1)", "Normal (2)", "Düşük (3)"]
-                priority_choice = self.get_choice("Öncelik", priority_options)
-                priority = int(priority_choice.split('(')[1].rstrip(')'))
+                priority_choice = self.get_choice("Öncelik", _PRIORITY_OPTIONS)
+                priority = _PRIORITY_BY_LABEL[priority_choice]
                 
                 if self.system.add_to_waiting_list(customer_id, customer_name, room_id, priority):
                     pos = self.system.get_waiting_list_position(customer_id)
@@ -1030,9 +1307,9 @@ class CLI:
         elif choice == 3:
             entries = self.system.get_waiting_list()
             if entries:
-                print("\nÇıkarılacak müşteriyi seçin:")
+                self.emit("\nÇıkarılacak müşteriyi seçin:")
                 for i, entry in enumerate(entries, 1):
-                    print(f"  {i}. {entry.customer_name}")
+                    self.emit(f"  {i}. {entry.customer_name}")
                 
                 idx = self.get_int("Seçim", min_val=1, max_val=len(entries))
                 if idx:
@@ -1042,13 +1319,12 @@ class CLI:
                 self.print_info("Bekleme listesi boş")
         
         elif choice == 4:
-            entries = self.system.get_waiting_list()
-            if entries:
-                next_customer = entries[0]
+            next_customer = self.system.get_next_waiting()
+            if next_customer:
                 self.print_info(f"Sıradaki: {next_customer.customer_name}")
                 
                 if self.confirm("Bu müşteriyi çağırmak istiyor musunuz?"):
-                    self.system.remove_from_waiting_list(next_customer.customer_id)
+                    self.system.serve_next_waiting()
                     self.print_success(f"{next_customer.customer_name} çağrıldı ve listeden çıkarıldı")
             else:
                 self.print_info("Bekleme listesi boş")
@@ -1062,18 +1338,18 @@ class CLI:
         self.clear_screen()
         self.print_header("VERİ İŞLEMLERİ")
         
-        print()
-        print(self.color("  1.", 'cyan') + " Verileri Kaydet")
-        print(self.color("  2.", 'cyan') + " Yedek Oluştur")
-        print(self.color("  3.", 'cyan') + " Yedekten Geri Yükle")
-        print(self.color("  4.", 'cyan') + " CSV Dışa Aktar")
-        print(self.color("  5.", 'cyan') + " Örnek Veri Oluştur")
-        print(self.color("  0.", 'yellow') + " Ana Menüye Dön")
+        self.emit("")
+        self.emit(self.render_menu(self.DATA_MENU))
         
         choice = self.get_int("\nSeçiminiz", min_val=0, max_val=5)
         
+        # Veri işlemleri devam eden arka plan kaydıyla çakışmamalı
+        if choice:
+            self._wait_for_save()
+        
         if choice == 1:
             if self.data_manager.save_system_state(self.system):
+                self._saved_version = self.system.version
                 self.print_success(f"Veriler kaydedildi: {self.data_manager.data_dir}")
             else:
                 self.print_error("Kaydetme başarısız")
@@ -1085,17 +1361,25 @@ class CLI:
         elif choice == 3:
             backup_dir = self.data_manager.data_dir / "backups"
             if backup_dir.exists():
-                backups = list(backup_dir.glob("backup_*.json"))
+                # En yeni 10 yedek bir kez seçilir; hem listeleme hem seçim bunu kullanır.
+                # DirEntry stat sonucunu önbellekler, her dosya için Path nesnesi kurulmaz.
+                with os.scandir(backup_dir) as it:
+                    entries = [e for e in it
+                               if e.name.startswith("backup_")
+                               and e.name.endswith((".json", ".json.gz"))
+                               and e.is_file()]
+                backups = heapq.nlargest(10, entries, key=lambda e: e.stat().st_mtime)
                 if backups:
-                    print("\nMevcut yedekler:")
-                    for i, b in enumerate(sorted(backups, reverse=True)[:10], 1):
-                        print(f"  {i}. {b.name}")
+                    self.emit("\nMevcut yedekler:")
+                    for i, b in enumerate(backups, 1):
+                        self.emit(f"  {i}. {b.name}")
                     
                     idx = self.get_int("Seçim", min_val=1, max_val=len(backups))
                     if idx:
-                        backup_file = sorted(backups, reverse=True)[idx-1]
+                        backup_file = backups[idx-1]
                         if self.confirm("Mevcut veriler silinecek. Devam?"):
-                            if self.data_manager.restore_from_backup(str(backup_file), self.system):
+                            if self.data_manager.restore_from_backup(backup_file.path, self.system):
+                                self._invalidate_room_cache()
                                 self.print_success("Yedekten geri yüklendi")
                             else:
                                 self.print_error("Geri yükleme başarısız")
@@ -1106,7 +1390,8 @@ class CLI:
         
         elif choice == 4:
             rooms = self.system.get_all_rooms()
-            reservations = list(self.system._reservations.values())
+            # Tek geçişte listeye alınıp C seviyesinde sıralanır; dışa aktarma bu sırayı korur
+            reservations = sorted(self.system._reservations.values(), key=attrgetter('start_time'))
             room_dict = {r.id: r for r in rooms}
             
             self.data_manager.export_rooms_csv(rooms)
@@ -1116,6 +1401,7 @@ class CLI:
         elif choice == 5:
             if self.confirm("Mevcut verilere örnek veriler eklenecek. Devam?"):
                 self.data_manager.create_sample_data(self.system)
+                self._invalidate_room_cache()
                 self.print_success("Örnek veriler oluşturuldu")
         
         self.pause()
@@ -1127,27 +1413,26 @@ class CLI:
         self.clear_screen()
         self.print_header("GERİ AL / YİNELE")
         
-        print()
+        self.emit("")
         
         if self.system.can_undo():
-            print(f"  Geri alınabilir: {self.color(self.system.get_undo_description(), 'yellow')}")
+            self.emit(f"  Geri alınabilir: {self.color(self.system.get_undo_description(), 'yellow')}")
         else:
-            print(f"  Geri alınabilir işlem yok")
+            self.emit(f"  Geri alınabilir işlem yok")
         
         if self.system.can_redo():
-            print(f"  Yinelenebilir: {self.color(self.system.get_redo_description(), 'blue')}")
+            self.emit(f"  Yinelenebilir: {self.color(self.system.get_redo_description(), 'blue')}")
         else:
-            print(f"  Yinelenebilir işlem yok")
+            self.emit(f"  Yinelenebilir işlem yok")
         
-        print()
-        print(self.color("  1.", 'cyan') + " Geri Al (Undo)")
-        print(self.color("  2.", 'cyan') + " Yinele (Redo)")
-        print(self.color("  0.", 'yellow') + " Ana Menüye Dön")
+        self.emit("")
+        self.emit(self.render_menu(self.UNDO_REDO_MENU))
         
         choice = self.get_int("\nSeçiminiz", min_val=0, max_val=2)
         
         if choice == 1:
             result = self.system.undo()
+            self._invalidate_room_cache()
             if result:
                 self.print_success(result)
             else:
@@ -1155,6 +1440,7 @@ class CLI:
         
         elif choice == 2:
             result = self.system.redo()
+            self._invalidate_room_cache()
             if result:
                 self.print_success(result)
             else:
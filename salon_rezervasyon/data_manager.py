@@ -5,23 +5,291 @@ Veri kaydetme, yükleme ve dışa aktarma işlemleri.
 
 Desteklenen formatlar:
 - JSON: Tam sistem verisi
+- JSON satırları (state.wal): Son tam kayıttan beri değişen kayıtlar
+- JSONL: Satır başına bir rezervasyon (programlar arası toplu aktarım için tercih edilir)
 - CSV: Tablo formatında raporlar
 """
 
 import json
 import csv
+import copy
+import gzip
+import io
+import logging
 import os
-from datetime import datetime, date
-from typing import Dict, List, Any, Optional
+import threading
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from operator import itemgetter
+from datetime import datetime, date, timedelta
+from enum import Enum
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
 import sys
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Modül dizini yalnızca bir kez eklenir; tekrar içe aktarmada sys.path büyümez
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+if _MODULE_DIR not in sys.path:
+    sys.path.insert(0, _MODULE_DIR)
 
 from reservation_system import (
     ReservationSystem, Room, Reservation, 
     RoomType, ReservationStatus
 )
+from data_structures.interval_tree import Interval
+
+logger = logging.getLogger(__name__)
+
+
+# Opsiyonel hızlı JSON kütüphanesi; kurulu değilse standart json kullanılır
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Opsiyonel artımlı JSON ayrıştırıcı; büyük dosyalar kayıt kayıt okunur
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+PRIORITY_NAMES = {1: 'VIP', 2: 'Normal', 3: 'Düşük'}
+
+# JSON ve CSV okuma/yazma tampon boyutu (varsayılan 8 KiB yerine daha az sistem çağrısı)
+IO_BUFFER_SIZE = 1 << 16
+
+
+def _fmt_dt(dt: datetime) -> str:
+    """Tarih-saati "YYYY-MM-DD HH:MM" biçiminde döndür (strftime'dan hızlı)"""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+
+def _fmt_hm(dt: datetime) -> str:
+    """Saati "HH:MM" biçiminde döndür (strftime'dan hızlı)"""
+    return f"{dt.hour:02d}:{dt.minute:02d}"
+
+
+def _parse_dt(text: str) -> datetime:
+    """
+    "YYYY-MM-DD HH:MM" metnini ayrıştır
+    
+    Sabit konumlu alanlar doğrudan okunur; biçim farklıysa strptime'a düşülür
+    (sıfırsız yazımlar ve hata mesajı için).
+    """
+    if (len(text) == 16 and text[4] == '-' and text[7] == '-'
+            and text[10] == ' ' and text[13] == ':'):
+        return datetime(int(text[0:4]), int(text[5:7]), int(text[8:10]),
+                        int(text[11:13]), int(text[14:16]))
+    return datetime.strptime(text, '%Y-%m-%d %H:%M')
+
+
+def _csv_field_reader(header: List[str],
+                      fields: List[Tuple[Tuple[str, ...], Any]]) -> Callable[[List[str]], tuple]:
+    """
+    CSV başlığını bir kez eşleyip satırdan alanları tuple olarak okuyan fonksiyon
+    
+    Her alan için (Türkçe/İngilizce sütun adları, varsayılan) verilir. Sütun yoksa
+    varsayılan döner; eksik hücreler DictReader'daki gibi None olur.
+    
+    Args:
+        header: Başlık satırı
+        fields: [(sütun adları, varsayılan), ...]
+    """
+    # Tekrarlanan başlıkta DictReader gibi sonuncusu geçerlidir
+    positions = {name: i for i, name in enumerate(header)}
+    width = len(header)
+    
+    indices = []
+    for k, (names, _) in enumerate(fields):
+        index = next((positions[name] for name in names if name in positions), None)
+        indices.append(width + k if index is None else index)
+    
+    # Varsayılanlar satırın sonuna eklenir; tüm alanlar tek itemgetter çağrısıyla okunur
+    defaults = [default for _, default in fields]
+    getter = itemgetter(*indices)
+    
+    def read(row: List[str]) -> tuple:
+        if len(row) != width:
+            row = (row + [None] * (width - len(row)))[:width]
+        return getter(row + defaults)
+    
+    return read
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON'a doğrudan yazılamayan değerleri dönüştür"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"JSON'a dönüştürülemiyor: {type(obj).__name__}")
+
+
+@contextmanager
+def _atomic_open(filepath: Path, mode: str = 'wb', newline: str = None,
+                 buffering: int = IO_BUFFER_SIZE):
+    """
+    Dosyayı atomik yazma için aç ('w' veya 'wb')
+    
+    Yazma yanındaki .tmp dosyasına yapılır; blok hatasız biterse tek bir fsync
+    ve os.replace ile hedefin yerine geçer. Yarıda kalan yazma hedefi bozmaz.
+    .gz uzantılı dosyalar gzip ile (hızlı, seviye 1) sıkıştırılır.
+    """
+    tmp = filepath.with_name(filepath.name + '.tmp')
+    raw = open(tmp, 'wb', buffering=buffering)
+    try:
+        f = raw
+        if filepath.suffix == '.gz':
+            f = gzip.GzipFile(filename=filepath.name, mode='wb', compresslevel=1, fileobj=raw)
+        if 'b' not in mode:
+            f = io.TextIOWrapper(f, encoding='utf-8', newline=newline)
+        
+        yield f
+        
+        # Katmanlar alttaki dosyayı kapatmadan boşaltılır
+        if 'b' not in mode:
+            f = f.detach()
+        if f is not raw:
+            f.close()
+        raw.flush()
+        os.fsync(raw.fileno())
+        raw.close()
+        os.replace(tmp, filepath)
+    except BaseException:
+        raw.close()
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _open_json(filepath: Path, mode: str):
+    """
+    JSON dosyasını aç ('r', 'w', 'rb' veya 'wb')
+    
+    Yazma modları _atomic_open ile atomik yazılır.
+    .gz uzantılı dosyalar gzip ile (hızlı, seviye 1) sıkıştırılır/açılır.
+    """
+    if 'w' in mode:
+        return _atomic_open(filepath, mode)
+    if filepath.suffix == '.gz':
+        if 'b' in mode:
+            return gzip.open(filepath, mode, compresslevel=1)
+        return gzip.open(filepath, mode + 't', compresslevel=1, encoding='utf-8')
+    if 'b' in mode:
+        return open(filepath, mode, buffering=IO_BUFFER_SIZE)
+    return open(filepath, mode, encoding='utf-8', buffering=IO_BUFFER_SIZE)
+
+
+def _dump_json(data: Any, filepath: Path, pretty: bool = False) -> None:
+    """
+    Veriyi JSON dosyasına yaz (varsa orjson ile)
+    
+    Varsayılan çıktı tek satırlık sıkışık JSON'dur; pretty=True girintili yazar.
+    Üst seviye sözlükteki üreteç (iterator) değerler dizi olarak, eleman eleman
+    kodlanarak yazılır; kayıtların tamamı bellekte liste olarak kurulmaz.
+    """
+    if not pretty and isinstance(data, dict):
+        _stream_dump_json(data, filepath)
+        return
+    if isinstance(data, dict):
+        data = {key: list(value) if isinstance(value, Iterator) else value
+                for key, value in data.items()}
+    
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        with _open_json(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, default=_json_default, option=option))
+    else:
+        with _open_json(filepath, 'w') as f:
+            if pretty:
+                json.dump(data, f, ensure_ascii=False, indent=2, default=_json_default)
+            else:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'),
+                          default=_json_default)
+
+
+def _stream_dump_json(data: dict, filepath: Path) -> None:
+    """Sözlüğü sıkışık JSON olarak yaz; üreteç değerleri eleman eleman kodla"""
+    if orjson is not None:
+        def encode(obj: Any) -> bytes:
+            return orjson.dumps(obj, default=_json_default)
+    else:
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'),
+                                   default=_json_default)
+        
+        def encode(obj: Any) -> bytes:
+            return encoder.encode(obj).encode('utf-8')
+    
+    with _open_json(filepath, 'wb') as f:
+        write = f.write
+        write(b'{')
+        for i, (key, value) in enumerate(data.items()):
+            if i:
+                write(b',')
+            write(encode(key))
+            write(b':')
+            if isinstance(value, Iterator):
+                write(b'[')
+                for j, item in enumerate(value):
+                    if j:
+                        write(b',')
+                    write(encode(item))
+                write(b']')
+            else:
+                write(encode(value))
+        write(b'}')
+
+
+def _iter_json_items(filepath: Path, prefix: str) -> Iterator:
+    """Dosyadaki bir dizinin elemanlarını ijson ile tek tek oku"""
+    with _open_json(filepath, 'rb') as f:
+        yield from ijson.items(f, prefix, use_float=True)
+
+
+def _iter_json_kvitems(filepath: Path) -> Iterator:
+    """Dosyanın üst seviye anahtar/değer çiftleri - dosya tek kez okunur"""
+    if ijson is None:
+        yield from _load_json(filepath).items()
+        return
+    with _open_json(filepath, 'rb') as f:
+        yield from ijson.kvitems(f, "", use_float=True)
+
+
+def _load_json(filepath: Path) -> Any:
+    """
+    JSON dosyasını oku (varsa orjson ile)
+    
+    Anahtarlar ve kısa metin değerleri (oda id, durum, e-posta...) dosya boyunca
+    tek bir nesne olarak paylaşılır. orjson anahtarları kendi önbelleğinde tutar;
+    kayıt dizilerindeki değerler okuma sonrası tek geçişte paylaştırılır.
+    """
+    pool: Dict[str, str] = {}
+    intern = pool.setdefault
+    
+    if orjson is not None:
+        with _open_json(filepath, 'rb') as f:
+            data = orjson.loads(f.read())
+        if isinstance(data, dict):
+            for records in data.values():
+                if not isinstance(records, list):
+                    continue
+                for record in records:
+                    if isinstance(record, dict):
+                        for key, value in record.items():
+                            if value.__class__ is str and len(value) < 64:
+                                record[key] = intern(value, value)
+        return data
+    
+    def _pairs_hook(pairs):
+        return {intern(key, key): (intern(value, value)
+                                   if value.__class__ is str and len(value) < 64 else value)
+                for key, value in pairs}
+    
+    with _open_json(filepath, 'r') as f:
+        return json.load(f, object_pairs_hook=_pairs_hook)
 
 
 class DataManager:
@@ -29,6 +297,16 @@ class DataManager:
     Veri Yöneticisi - JSON/CSV okuma-yazma işlemleri
     """
     
+    # CSV dışa aktarma: büyük dosya tamponu ve writerows parti boyutu
+    CSV_BUFFER_SIZE = 1 << 20
+    CSV_BATCH_SIZE = 1000
+    
+    # Günlükte (WAL) bu kadar kayıt birikince tam anlık görüntü alınır
+    WAL_MAX_OPS = 500
+    
+    # ijson kuruluysa bu boyuttan büyük dosyalar tamamı belleğe alınmadan okunur
+    JSON_STREAM_THRESHOLD = 4 << 20
+    
     def __init__(self, data_dir: str = None):
         """
         Args:
@@ -44,37 +322,85 @@ class DataManager:
         self.rooms_file = self.data_dir / "rooms.json"
         self.reservations_file = self.data_dir / "reservations.json"
         self.config_file = self.data_dir / "config.json"
+        self.wal_file = self.data_dir / "state.wal"
+        
+        # Artımlı kayıt durumu: anlık görüntüsü diskteki dosyalarla eşleşen
+        # sistem ve günlükteki kayıt sayısı
+        self._wal_system: Optional[ReservationSystem] = None
+        self._wal_ops = 0
+        # Yedekten geri yüklemede artar; önceden hazırlanmış kayıt işi eşleşmeyi geri kurmaz
+        self._wal_generation = 0
+        
+        # to_dict önbelleği: id -> (revizyon, sözlük); değişmeyen kayıt yeniden dönüştürülmez
+        self._room_dict_memo: Dict[str, Tuple[int, dict]] = {}
+        self._res_dict_memo: Dict[str, Tuple[int, dict]] = {}
     
     # ==================== JSON İŞLEMLERİ ====================
     
-    def save_rooms(self, rooms: List[Room], filepath: str = None) -> bool:
+    def save_rooms(self, rooms: List[Room], filepath: str = None,
+                   pretty: bool = False, now: datetime = None) -> bool:
         """
         Salonları JSON dosyasına kaydet
         
         Args:
             rooms: Salon listesi
             filepath: Dosya yolu (opsiyonel)
+            pretty: Girintili (elle okunabilir) JSON yaz
+            now: Kayıt zamanı (toplu kayıtlarda bir kez alınıp geçirilir)
         """
-        filepath = Path(filepath) if filepath else self.rooms_file
+        filepath = self._as_path(filepath, self.rooms_file)
         
         try:
             data = {
                 "metadata": {
                     "version": "1.0",
-                    "created_at": datetime.now().isoformat(),
+                    "created_at": (now or datetime.now()).isoformat(),
                     "count": len(rooms)
                 },
-                "rooms": [room.to_dict() for room in rooms]
+                "rooms": self._iter_dicts(rooms, '_room_dict_memo')
             }
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            _dump_json(data, filepath, pretty)
             
             return True
         except Exception as e:
-            print(f"Hata: Salonlar kaydedilemedi - {e}")
+            logger.error("Hata: Salonlar kaydedilemedi - %s", e)
             return False
     
+    @staticmethod
+    def _as_path(filepath, default: Path) -> Path:
+        """Verilen yolu Path'e çevir (zaten Path ise aynen kullan), yoksa varsayılan"""
+        if not filepath:
+            return default
+        return filepath if isinstance(filepath, Path) else Path(filepath)
+    
+    def _iter_dicts(self, records, memo_attr: str) -> Iterator:
+        """
+        Kayıtların to_dict çıktısını üret - revizyonu değişmeyenler önbellekten
+        
+        Önbellek her tam geçişte yenilenir, silinen kayıtlar böylece düşer.
+        """
+        memo = getattr(self, memo_attr)
+        fresh = {}
+        for record in records:
+            cached = memo.get(record.id)
+            if cached is None or cached[0] != record._rev:
+                cached = (record._rev, record.to_dict())
+            fresh[record.id] = cached
+            yield cached[1]
+        setattr(self, memo_attr, fresh)
+    
+    def _iter_records(self, filepath: Path, key: str) -> Iterator:
+        """
+        JSON dosyasındaki kayıt dizisinin elemanları
+        
+        ijson kuruluysa büyük dosyalar artımlı ayrıştırılır,
+        aksi halde dosya bir kerede okunur.
+        """
+        if ijson is not None and filepath.stat().st_size > self.JSON_STREAM_THRESHOLD:
+            return _iter_json_items(filepath, f"{key}.item")
+        return iter(_load_json(filepath).get(key, []))
+    
     def load_rooms(self, filepath: str = None) -> List[Room]:
         """
         Salonları JSON dosyasından yükle
@@ -85,99 +411,216 @@ class DataManager:
         Returns:
             Salon listesi
         """
-        filepath = Path(filepath) if filepath else self.rooms_file
+        filepath = self._as_path(filepath, self.rooms_file)
         
         if not filepath.exists():
             return []
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
             rooms = []
-            for room_data in data.get("rooms", []):
+            for room_data in self._iter_records(filepath, "rooms"):
                 try:
                     room = Room.from_dict(room_data)
                     rooms.append(room)
                 except Exception as e:
-                    print(f"Uyarı: Salon yüklenemedi - {e}")
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning("Uyarı: Salon yüklenemedi - %s", e)
             
             return rooms
         except Exception as e:
-            print(f"Hata: Salonlar yüklenemedi - {e}")
+            logger.error("Hata: Salonlar yüklenemedi - %s", e)
             return []
     
-    def save_reservations(self, reservations: List[Reservation], filepath: str = None) -> bool:
+    def save_reservations(self, reservations: List[Reservation], filepath: str = None,
+                          pretty: bool = False, now: datetime = None) -> bool:
         """
         Rezervasyonları JSON dosyasına kaydet
+        
+        Args:
+            pretty: Girintili (elle okunabilir) JSON yaz
+            now: Kayıt zamanı (toplu kayıtlarda bir kez alınıp geçirilir)
         """
-        filepath = Path(filepath) if filepath else self.reservations_file
+        filepath = self._as_path(filepath, self.reservations_file)
         
         try:
             data = {
                 "metadata": {
                     "version": "1.0",
-                    "created_at": datetime.now().isoformat(),
+                    "created_at": (now or datetime.now()).isoformat(),
                     "count": len(reservations)
                 },
-                "reservations": [res.to_dict() for res in reservations]
+                "reservations": self._iter_dicts(reservations, '_res_dict_memo')
             }
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            _dump_json(data, filepath, pretty)
             
             return True
         except Exception as e:
-            print(f"Hata: Rezervasyonlar kaydedilemedi - {e}")
+            logger.error("Hata: Rezervasyonlar kaydedilemedi - %s", e)
             return False
     
     def load_reservations(self, filepath: str = None) -> List[Reservation]:
         """
         Rezervasyonları JSON dosyasından yükle
         """
-        filepath = Path(filepath) if filepath else self.reservations_file
+        filepath = self._as_path(filepath, self.reservations_file)
         
         if not filepath.exists():
             return []
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
             reservations = []
-            for res_data in data.get("reservations", []):
+            for res_data in self._iter_records(filepath, "reservations"):
                 try:
                     res = Reservation.from_dict(res_data)
                     reservations.append(res)
                 except Exception as e:
-                    print(f"Uyarı: Rezervasyon yüklenemedi - {e}")
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning("Uyarı: Rezervasyon yüklenemedi - %s", e)
             
             return reservations
         except Exception as e:
-            print(f"Hata: Rezervasyonlar yüklenemedi - {e}")
+            logger.error("Hata: Rezervasyonlar yüklenemedi - %s", e)
             return []
     
     def save_system_state(self, system: ReservationSystem, prefix: str = "") -> bool:
         """
         Tüm sistem durumunu kaydet
         
+        Sistem diskteki anlık görüntüden yüklendiyse sadece değişen kayıtlar
+        günlüğe (state.wal) eklenir; günlük WAL_MAX_OPS'u aşınca tam kayıt yapılır.
+        
         Args:
             system: Rezervasyon sistemi
             prefix: Dosya adı öneki (yedekleme için)
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if prefix:
+            now = datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            rooms_path = self.data_dir / f"{prefix}rooms_{timestamp}.json"
+            res_path = self.data_dir / f"{prefix}reservations_{timestamp}.json"
+            
+            return self._save_rooms_and_reservations(
+                system.get_all_rooms(), list(system._reservations.values()),
+                rooms_path, res_path, now)
         
-        rooms_path = self.data_dir / f"{prefix}rooms_{timestamp}.json" if prefix else self.rooms_file
-        res_path = self.data_dir / f"{prefix}reservations_{timestamp}.json" if prefix else self.reservations_file
+        return self._prepare_state_save(system)()
+    
+    def save_system_state_async(self, system: ReservationSystem) -> threading.Thread:
+        """
+        Sistem durumunu arka planda kaydet
         
-        rooms_saved = self.save_rooms(system.get_all_rooms(), rooms_path)
+        Kaydedilecek veri çağıran iş parçacığında hazırlanır,
+        JSON dönüştürme ve dosya yazma ayrı bir iş parçacığında yapılır.
         
-        # Tüm rezervasyonları al
-        all_reservations = list(system._reservations.values())
-        res_saved = self.save_reservations(all_reservations, res_path)
+        Returns:
+            Başlatılan iş parçacığı (bitmesini beklemek için join edilebilir)
+        """
+        thread = threading.Thread(target=self._prepare_state_save(system), daemon=True)
+        thread.start()
+        return thread
+    
+    def _prepare_state_save(self, system: ReservationSystem) -> Callable[[], bool]:
+        """
+        Kaydetme işini hazırla: değişen kayıtlar günlüğe ya da tam anlık görüntü
+        
+        Sistemden okunan her şey burada kopyalanır; dönen fonksiyon sadece yazar.
+        Günlük sayacı ve anlık görüntü bilgisi yazma başarılı olunca güncellenir;
+        yazma başarısız olursa alınan id'ler sisteme geri işaretlenir ve bir
+        sonraki kayıt tam anlık görüntü olur.
+        """
+        room_ids, reservation_ids = system.take_dirty_ids()
+        op_count = len(room_ids) + len(reservation_ids)
         
+        def _failed() -> bool:
+            system.restore_dirty_ids(room_ids, reservation_ids)
+            self._wal_system = None
+            return False
+        
+        if self._wal_system is system and self._wal_ops + op_count <= self.WAL_MAX_OPS:
+            # Silinen kayıtlar None olarak yazılır
+            lines = []
+            for kind, ids, records in (("room", room_ids, system._rooms),
+                                       ("reservation", reservation_ids, system._reservations)):
+                for entity_id in ids:
+                    record = records.get(entity_id)
+                    lines.append(json.dumps({
+                        "type": kind,
+                        "id": entity_id,
+                        "data": record.to_dict() if record is not None else None
+                    }, ensure_ascii=False) + "\n")
+            
+            def _append() -> bool:
+                if not self._append_wal(lines):
+                    return _failed()
+                self._wal_ops += op_count
+                return True
+            
+            return _append
+        
+        rooms = [copy.copy(room) for room in system.get_all_rooms()]
+        reservations = [copy.copy(res) for res in system._reservations.values()]
+        now = datetime.now()
+        generation = self._wal_generation
+        
+        def _save() -> bool:
+            if not self._save_rooms_and_reservations(rooms, reservations, now=now):
+                return _failed()
+            self.wal_file.unlink(missing_ok=True)
+            # Bu arada geri yükleme yapıldıysa yazılan anlık görüntü artık eski
+            if generation == self._wal_generation:
+                self._wal_system = system
+                self._wal_ops = 0
+            return True
+        
+        return _save
+    
+    def _save_rooms_and_reservations(self, rooms: List[Room], reservations: List[Reservation],
+                                     rooms_path: Path = None, res_path: Path = None,
+                                     now: datetime = None) -> bool:
+        """Salon ve rezervasyon dosyalarını iki iş parçacığında aynı anda yaz"""
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            rooms_future = pool.submit(self.save_rooms, rooms, rooms_path, now=now)
+            res_future = pool.submit(self.save_reservations, reservations, res_path, now=now)
+            rooms_saved = rooms_future.result()
+            res_saved = res_future.result()
         return rooms_saved and res_saved
     
+    def _append_wal(self, lines: List[str]) -> bool:
+        """Değişen kayıtları günlüğün sonuna ekle"""
+        if not lines:
+            return True
+        try:
+            with open(self.wal_file, 'a', encoding='utf-8') as f:
+                f.writelines(lines)
+            return True
+        except Exception as e:
+            logger.error("Hata: Değişiklik günlüğü yazılamadı - %s", e)
+            return False
+    
+    def _read_wal(self) -> Tuple[Dict[str, Optional[dict]], Dict[str, Optional[dict]]]:
+        """
+        Günlüğü oku - kayıt başına son durum (silinenler None)
+        
+        Yarım kalmış son satır (yazma sırasında kesinti) atlanır.
+        """
+        rooms: Dict[str, Optional[dict]] = {}
+        reservations: Dict[str, Optional[dict]] = {}
+        self._wal_ops = 0
+        if not self.wal_file.exists():
+            return rooms, reservations
+        
+        with open(self.wal_file, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+            for line in f:
+                try:
+                    op = json.loads(line)
+                except ValueError:
+                    continue
+                target = rooms if op["type"] == "room" else reservations
+                target[op["id"]] = op["data"]
+                self._wal_ops += 1
+        return rooms, reservations
+    
     def load_system_state(self, system: ReservationSystem) -> bool:
         """
         Sistem durumunu dosyalardan yükle
@@ -185,67 +628,122 @@ class DataManager:
         Args:
             system: Doldurulacak rezervasyon sistemi
         """
+        # Sistemde kaydedilmemiş kayıtlar varsa yükleme sonrası durum diskle aynı değildir
+        was_empty = not system._rooms and not system._reservations
+        
+        # Anlık görüntü üzerine günlükteki değişiklikleri uygula
+        room_ops, res_ops = self._read_wal()
+        rooms = self._apply_wal(self.load_rooms(), room_ops, Room)
+        reservations = self._apply_wal(self.load_reservations(), res_ops, Reservation)
+        
         # Salonları yükle
-        rooms = self.load_rooms()
         for room in rooms:
             system.add_room(room)
         
-        # Rezervasyonları yükle
-        reservations = self.load_reservations()
+        # Rezervasyonları yükle (geçmişler dahil, çakışma kontrolü atlanır).
+        # Ağaçlar sıralı listelerden toplu kurulur; arama indeksi ilk aramada kurulur.
+        to_minutes = system._datetime_to_minutes
+        intervals_by_room: Dict[str, List[Interval]] = {}
         for res in reservations:
-            # Geçmiş rezervasyonları da yükle (çakışma kontrolü atla)
             system._reservations[res.id] = res
-            system._reservation_tree.insert(res.id, res)
-            
             if res.room_id in system._room_intervals:
-                from data_structures.interval_tree import Interval
-                interval = Interval(
-                    int(res.start_time.timestamp() / 60),
-                    int(res.end_time.timestamp() / 60),
+                intervals_by_room.setdefault(res.room_id, []).append(Interval(
+                    to_minutes(res.start_time),
+                    to_minutes(res.end_time),
                     res
-                )
-                system._room_intervals[res.room_id].insert(interval)
+                ))
+        
+        system._reservation_tree.bulk_load(
+            sorted(((res.id, res) for res in reservations), key=lambda pair: pair[0]))
+        system._search_index_stale = True
+        for room_id, intervals in intervals_by_room.items():
+            intervals.sort(key=lambda interval: (interval.start, interval.end))
+            system._room_intervals[room_id].bulk_load(intervals)
+        
+        if was_empty:
+            # Sistem artık diskteki durumla aynı; sonraki kayıtlar günlüğe eklenebilir
+            system.take_dirty_ids()
+            self._wal_system = system
+        else:
+            # Önceden eklenmiş kayıtlar diskte yok; sonraki kayıt tam anlık görüntü olmalı
+            self._wal_system = None
         
         print(f"Yüklendi: {len(rooms)} salon, {len(reservations)} rezervasyon")
         return True
     
-    def create_backup(self, system: ReservationSystem) -> str:
+    @staticmethod
+    def _apply_wal(records: list, ops: Dict[str, Optional[dict]], cls) -> list:
+        """Günlükteki son durumları kayıt listesine uygula"""
+        if not ops:
+            return records
+        by_id = {record.id: record for record in records}
+        for entity_id, data in ops.items():
+            if data is None:
+                by_id.pop(entity_id, None)
+            else:
+                by_id[entity_id] = cls.from_dict(data)
+        return list(by_id.values())
+    
+    def create_backup(self, system: ReservationSystem, pretty: bool = False,
+                      compress: bool = True) -> str:
         """
         Sistem yedeği oluştur
         
+        Args:
+            pretty: Girintili (elle okunabilir) JSON yaz
+            compress: gzip ile sıkıştırılmış yedek yaz (backup_*.json.gz)
+        
         Returns:
             Yedek dosya adı
         """
         backup_dir = self.data_dir / "backups"
         backup_dir.mkdir(exist_ok=True)
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         
-        backup_file = backup_dir / f"backup_{timestamp}.json"
+        suffix = ".json.gz" if compress else ".json"
+        backup_file = backup_dir / f"backup_{timestamp}{suffix}"
         
         data = {
             "metadata": {
                 "version": "1.0",
-                "created_at": datetime.now().isoformat(),
+                "created_at": now.isoformat(),
                 "type": "full_backup"
             },
-            "rooms": [room.to_dict() for room in system.get_all_rooms()],
-            "reservations": [res.to_dict() for res in system._reservations.values()],
+            "rooms": self._iter_dicts(system.get_all_rooms(), '_room_dict_memo'),
+            "reservations": self._iter_dicts(system._reservations.values(), '_res_dict_memo'),
             "statistics": system.get_statistics()
         }
         
-        with open(backup_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        _dump_json(data, backup_file, pretty)
         
         return str(backup_file)
     
     def restore_from_backup(self, backup_file: str, system: ReservationSystem) -> bool:
         """
-        Yedekten geri yükle
+        Yedekten geri yükle (.json veya gzip'li .json.gz)
+        
+        Dosya tek geçişte okunur (ijson kuruluysa artımlı). Sistem ancak yedeğin
+        tamamı ayrıştırılıp kayıtlar oluşturulduktan sonra değiştirilir; bozuk
+        bir yedek mevcut veriyi silmez.
         """
         try:
-            with open(backup_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            backup_file = Path(backup_file)
+            rooms: List[Room] = []
+            reservations: List[Reservation] = []
+            for key, items in _iter_json_kvitems(backup_file):
+                if key == "rooms":
+                    rooms = [Room.from_dict(room_data) for room_data in items]
+                elif key == "reservations":
+                    reservations = [Reservation.from_dict(res_data) for res_data in items]
+            
+            # Sistem toplu değişiyor; sonraki kayıt tam anlık görüntü olmalı
+            if self._wal_system is system:
+                self._wal_system = None
+            self._wal_generation += 1
+            self._room_dict_memo.clear()
+            self._res_dict_memo.clear()
             
             # Sistemi temizle
             system._rooms.clear()
@@ -253,24 +751,36 @@ class DataManager:
             system._reservations.clear()
             system._reservation_tree.clear()
             system._room_intervals.clear()
+            system._clear_search_index()
             
             # Salonları yükle
-            for room_data in data.get("rooms", []):
-                room = Room.from_dict(room_data)
+            for room in rooms:
                 system.add_room(room)
             
             # Rezervasyonları yükle
-            for res_data in data.get("reservations", []):
-                res = Reservation.from_dict(res_data)
+            for res in reservations:
                 system.create_reservation(res)
             
             return True
         except Exception as e:
-            print(f"Hata: Yedekten geri yükleme başarısız - {e}")
+            logger.error("Hata: Yedekten geri yükleme başarısız - %s", e)
             return False
     
     # ==================== CSV İŞLEMLERİ ====================
     
+    def _open_csv_for_write(self, filepath: Path):
+        """CSV dosyasını büyük yazma tamponuyla atomik yazma için aç"""
+        return _atomic_open(filepath, 'w', newline='', buffering=self.CSV_BUFFER_SIZE)
+    
+    def _write_rows_batched(self, writer, rows) -> None:
+        """Satırları CSV_BATCH_SIZE'lık partiler halinde writerows ile yaz"""
+        rows = iter(rows)
+        while True:
+            batch = list(islice(rows, self.CSV_BATCH_SIZE))
+            if not batch:
+                break
+            writer.writerows(batch)
+    
     def export_rooms_csv(self, rooms: List[Room], filepath: str = None) -> bool:
         """
         Salonları CSV formatında dışa aktar
@@ -278,7 +788,7 @@ class DataManager:
         filepath = Path(filepath) if filepath else self.data_dir / "rooms_export.csv"
         
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            with self._open_csv_for_write(filepath) as f:
                 writer = csv.writer(f)
                 
                 # Başlık satırı
@@ -288,21 +798,20 @@ class DataManager:
                 ])
                 
                 # Veriler
-                for room in rooms:
-                    writer.writerow([
-                        room.id,
-                        room.name,
-                        room.capacity,
-                        room.room_type.value,
-                        room.floor,
-                        ', '.join(room.amenities),
-                        room.hourly_rate,
-                        'Evet' if room.is_active else 'Hayır'
-                    ])
+                self._write_rows_batched(writer, ((
+                    room.id,
+                    room.name,
+                    room.capacity,
+                    room.room_type.value,
+                    room.floor,
+                    ', '.join(room.amenities),
+                    room.hourly_rate,
+                    'Evet' if room.is_active else 'Hayır'
+                ) for room in rooms))
             
             return True
         except Exception as e:
-            print(f"Hata: CSV dışa aktarma başarısız - {e}")
+            logger.error("Hata: CSV dışa aktarma başarısız - %s", e)
             return False
     
     def export_reservations_csv(self, reservations: List[Reservation], 
@@ -310,11 +819,13 @@ class DataManager:
                                  filepath: str = None) -> bool:
         """
         Rezervasyonları CSV formatında dışa aktar
+        
+        Liste yeniden sıralanmaz, verildiği sırayla tek geçişte yazılır.
         """
         filepath = Path(filepath) if filepath else self.data_dir / "reservations_export.csv"
         
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            with self._open_csv_for_write(filepath) as f:
                 writer = csv.writer(f)
                 
                 # Başlık satırı
@@ -325,62 +836,80 @@ class DataManager:
                 ])
                 
                 # Veriler
-                for res in reservations:
-                    room_name = res.room_id
-                    if rooms and res.room_id in rooms:
-                        room_name = rooms[res.room_id].name
-                    
-                    priority_map = {1: 'VIP', 2: 'Normal', 3: 'Düşük'}
-                    
-                    writer.writerow([
-                        res.id,
-                        room_name,
-                        res.customer_name,
-                        res.customer_email,
-                        res.start_time.strftime('%Y-%m-%d %H:%M'),
-                        res.end_time.strftime('%Y-%m-%d %H:%M'),
-                        res.duration_minutes,
-                        res.status.value,
-                        priority_map.get(res.priority, 'Normal'),
-                        res.title,
-                        res.attendees,
-                        res.created_at.strftime('%Y-%m-%d %H:%M')
-                    ])
+                room_names = {room_id: room.name for room_id, room in rooms.items()} if rooms else {}
+                room_name = room_names.get
+                priority_name = PRIORITY_NAMES.get
+                
+                self._write_rows_batched(writer, ((
+                    res.id,
+                    room_name(res.room_id, res.room_id),
+                    res.customer_name,
+                    res.customer_email,
+                    _fmt_dt(res.start_time),
+                    _fmt_dt(res.end_time),
+                    res.duration_minutes,
+                    res.status.value,
+                    priority_name(res.priority, 'Normal'),
+                    res.title,
+                    res.attendees,
+                    _fmt_dt(res.created_at)
+                ) for res in reservations))
             
             return True
         except Exception as e:
-            print(f"Hata: CSV dışa aktarma başarısız - {e}")
+            logger.error("Hata: CSV dışa aktarma başarısız - %s", e)
             return False
     
     def import_rooms_csv(self, filepath: str) -> List[Room]:
         """
         CSV dosyasından salonları içe aktar
+        
+        Sütunlar başlıktan bir kez eşlenir, satırlar csv.reader ile liste olarak okunur.
         """
         rooms = []
+        active_values = {'evet', 'yes', 'true', '1'}
+        # Enum çağrısı yerine değer -> üye sözlüğünden doğrudan arama
+        room_types = RoomType._value2member_map_
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            with open(filepath, 'r', newline='', encoding='utf-8',
+                      buffering=IO_BUFFER_SIZE) as f:
+                reader = csv.reader(f)
+                read = _csv_field_reader(next(reader, []), [
+                    (('ID',), ''),
+                    (('İsim', 'Name'), ''),
+                    (('Kapasite', 'Capacity'), 10),
+                    (('Tür', 'Type'), 'meeting'),
+                    (('Kat', 'Floor'), 1),
+                    (('Donanımlar', 'Amenities'), ''),
+                    (('Saatlik Ücret', 'HourlyRate'), 0),
+                    (('Aktif', 'Active'), 'Evet'),
+                ])
                 
                 for row in reader:
+                    if not row:
+                        continue
                     try:
+                        (room_id, name, capacity, room_type, floor,
+                         amenities, hourly_rate, active) = read(row)
                         room = Room(
-                            id=row.get('ID', '').strip(),
-                            name=row.get('İsim', row.get('Name', '')).strip(),
-                            capacity=int(row.get('Kapasite', row.get('Capacity', 10))),
-                            room_type=RoomType(row.get('Tür', row.get('Type', 'meeting')).lower()),
-                            floor=int(row.get('Kat', row.get('Floor', 1))),
-                            amenities=row.get('Donanımlar', row.get('Amenities', '')).split(','),
-                            hourly_rate=float(row.get('Saatlik Ücret', row.get('HourlyRate', 0))),
-                            is_active=row.get('Aktif', row.get('Active', 'Evet')).lower() in ['evet', 'yes', 'true', '1']
+                            id=room_id.strip(),
+                            name=name.strip(),
+                            capacity=int(capacity),
+                            room_type=room_types[room_type.lower()],
+                            floor=int(floor),
+                            amenities=amenities.split(','),
+                            hourly_rate=float(hourly_rate),
+                            is_active=active.lower() in active_values
                         )
                         rooms.append(room)
                     except Exception as e:
-                        print(f"Uyarı: Satır atlandı - {e}")
+                        if logger.isEnabledFor(logging.WARNING):
+                            logger.warning("Uyarı: Satır atlandı - %s", e)
             
             return rooms
         except Exception as e:
-            print(f"Hata: CSV içe aktarma başarısız - {e}")
+            logger.error("Hata: CSV içe aktarma başarısız - %s", e)
             return []
     
     def import_reservations_csv(self, filepath: str, room_mapping: Dict[str, str] = None) -> List[Reservation]:
@@ -390,51 +919,121 @@ class DataManager:
         Args:
             filepath: CSV dosya yolu
             room_mapping: Salon adı -> ID eşlemesi
+        
+        Sütunlar başlıktan bir kez eşlenir, satırlar csv.reader ile liste olarak okunur.
         """
         reservations = []
+        priority_map = {'vip': 1, 'normal': 2, 'düşük': 3, 'low': 3}
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            with open(filepath, 'r', newline='', encoding='utf-8',
+                      buffering=IO_BUFFER_SIZE) as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                # ID sütunu yoksa her satıra yeni id üretilir
+                has_id = 'ID' in header
+                read = _csv_field_reader(header, [
+                    (('ID',), None),
+                    (('Salon', 'Room'), ''),
+                    (('Müşteri', 'Customer'), ''),
+                    (('E-posta', 'Email'), ''),
+                    (('Başlangıç', 'Start'), ''),
+                    (('Bitiş', 'End'), ''),
+                    (('Öncelik', 'Priority'), 'normal'),
+                    (('Başlık', 'Title'), ''),
+                    (('Katılımcı', 'Attendees'), 1),
+                ])
                 
                 for row in reader:
+                    if not row:
+                        continue
                     try:
-                        room_id = row.get('Salon', row.get('Room', ''))
+                        (res_id, room_id, customer_name, customer_email, start, end,
+                         priority, title, attendees) = read(row)
                         if room_mapping and room_id in room_mapping:
                             room_id = room_mapping[room_id]
                         
-                        priority_map = {'vip': 1, 'normal': 2, 'düşük': 3, 'low': 3}
-                        priority = priority_map.get(
-                            row.get('Öncelik', row.get('Priority', 'normal')).lower(), 
-                            2
-                        )
-                        
                         res = Reservation(
-                            id=row.get('ID', ReservationSystem.generate_id()),
+                            id=res_id if has_id else ReservationSystem.generate_id(),
                             room_id=room_id,
-                            customer_name=row.get('Müşteri', row.get('Customer', '')).strip(),
-                            customer_email=row.get('E-posta', row.get('Email', '')).strip(),
-                            start_time=datetime.strptime(
-                                row.get('Başlangıç', row.get('Start', '')), 
-                                '%Y-%m-%d %H:%M'
-                            ),
-                            end_time=datetime.strptime(
-                                row.get('Bitiş', row.get('End', '')), 
-                                '%Y-%m-%d %H:%M'
-                            ),
-                            priority=priority,
-                            title=row.get('Başlık', row.get('Title', '')).strip(),
-                            attendees=int(row.get('Katılımcı', row.get('Attendees', 1)))
+                            customer_name=customer_name.strip(),
+                            customer_email=customer_email.strip(),
+                            start_time=_parse_dt(start),
+                            end_time=_parse_dt(end),
+                            priority=priority_map.get(priority.lower(), 2),
+                            title=title.strip(),
+                            attendees=int(attendees)
                         )
                         reservations.append(res)
                     except Exception as e:
-                        print(f"Uyarı: Satır atlandı - {e}")
+                        if logger.isEnabledFor(logging.WARNING):
+                            logger.warning("Uyarı: Satır atlandı - %s", e)
             
             return reservations
         except Exception as e:
-            print(f"Hata: CSV içe aktarma başarısız - {e}")
+            logger.error("Hata: CSV içe aktarma başarısız - %s", e)
             return []
     
+    def _write_daily_report(self, writer, system: ReservationSystem,
+                            target_date: date, reservations: List[Reservation]) -> None:
+        """Bir günün özet ve detay bölümlerini CSV'ye yaz"""
+        report = system.get_daily_report(target_date, reservations)
+        
+        # Özet bilgiler
+        writer.writerow(['Günlük Rapor', target_date.isoformat()])
+        writer.writerow([])
+        writer.writerow(['Toplam Rezervasyon', report['total_reservations']])
+        writer.writerow(['Toplam Gelir (TL)', report['total_revenue']])
+        writer.writerow([])
+        
+        # Salon bazlı özet
+        writer.writerow(['Salon Bazlı Özet'])
+        writer.writerow(['Salon', 'Rezervasyon Sayısı', 'Toplam Süre (dk)', 'Gelir (TL)'])
+        writer.writerows((room_name, data['count'], data['minutes'], data['revenue'])
+                         for room_name, data in report['by_room'].items())
+        
+        writer.writerow([])
+        
+        # Detaylı liste
+        writer.writerow(['Detaylı Rezervasyon Listesi'])
+        writer.writerow(['Saat', 'Salon', 'Müşteri', 'Başlık', 'Süre (dk)', 'Durum'])
+        
+        get_room = system.get_room
+        
+        def _detail_rows():
+            for res in reservations:
+                room = get_room(res.room_id)
+                yield (
+                    _fmt_hm(res.start_time),
+                    room.name if room else res.room_id,
+                    res.customer_name,
+                    res.title,
+                    res.duration_minutes,
+                    res.status.value
+                )
+        
+        self._write_rows_batched(writer, _detail_rows())
+    
+    @staticmethod
+    def _group_by_day(system: ReservationSystem) -> Dict[date, List[Reservation]]:
+        """
+        İptal edilmemiş rezervasyonları tek geçişte güne göre grupla
+        
+        Her günün listesi get_reservations_by_date ile aynı sırada (salon, başlangıç) döner.
+        """
+        by_day = defaultdict(list)
+        cancelled = ReservationStatus.CANCELLED
+        
+        for res in system._reservations.values():
+            if res.status != cancelled:
+                by_day[res.start_time.date()].append(res)
+        
+        sort_key = lambda r: (r.room_id, r.start_time)
+        for day_reservations in by_day.values():
+            day_reservations.sort(key=sort_key)
+        
+        return dict(by_day)
+    
     def export_daily_report_csv(self, system: ReservationSystem, 
                                 target_date: date, filepath: str = None) -> bool:
         """
@@ -442,46 +1041,43 @@ class DataManager:
         """
         filepath = Path(filepath) if filepath else self.data_dir / f"report_{target_date}.csv"
         
-        report = system.get_daily_report(target_date)
         reservations = system.get_reservations_by_date(target_date)
         
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            with self._open_csv_for_write(filepath) as f:
+                self._write_daily_report(csv.writer(f), system, target_date, reservations)
+            
+            return True
+        except Exception as e:
+            logger.error("Hata: Rapor dışa aktarma başarısız - %s", e)
+            return False
+    
+    def export_daily_report_range_csv(self, system: ReservationSystem,
+                                      start_date: date, end_date: date,
+                                      filepath: str = None) -> bool:
+        """
+        Tarih aralığındaki her gün için günlük raporu tek CSV'ye aktar
+        
+        Rezervasyonlar bir kez güne göre gruplanır; gün başına indeks taranmaz.
+        """
+        filepath = Path(filepath) if filepath else self.data_dir / f"report_{start_date}_{end_date}.csv"
+        
+        by_day = self._group_by_day(system)
+        
+        try:
+            with self._open_csv_for_write(filepath) as f:
                 writer = csv.writer(f)
                 
-                # Özet bilgiler
-                writer.writerow(['Günlük Rapor', target_date.isoformat()])
-                writer.writerow([])
-                writer.writerow(['Toplam Rezervasyon', report['total_reservations']])
-                writer.writerow(['Toplam Gelir (TL)', report['total_revenue']])
-                writer.writerow([])
-                
-                # Salon bazlı özet
-                writer.writerow(['Salon Bazlı Özet'])
-                writer.writerow(['Salon', 'Rezervasyon Sayısı', 'Toplam Süre (dk)', 'Gelir (TL)'])
-                for room_name, data in report['by_room'].items():
-                    writer.writerow([room_name, data['count'], data['minutes'], data['revenue']])
-                
-                writer.writerow([])
-                
-                # Detaylı liste
-                writer.writerow(['Detaylı Rezervasyon Listesi'])
-                writer.writerow(['Saat', 'Salon', 'Müşteri', 'Başlık', 'Süre (dk)', 'Durum'])
-                
-                for res in reservations:
-                    room = system.get_room(res.room_id)
-                    writer.writerow([
-                        res.start_time.strftime('%H:%M'),
-                        room.name if room else res.room_id,
-                        res.customer_name,
-                        res.title,
-                        res.duration_minutes,
-                        res.status.value
-                    ])
+                day = start_date
+                while day <= end_date:
+                    if day != start_date:
+                        writer.writerow([])
+                    self._write_daily_report(writer, system, day, by_day.get(day, []))
+                    day += timedelta(days=1)
             
             return True
         except Exception as e:
-            print(f"Hata: Rapor dışa aktarma başarısız - {e}")
+            logger.error("Hata: Rapor dışa aktarma başarısız - %s", e)
             return False
     
     def export_utilization_report_csv(self, system: ReservationSystem,
@@ -493,7 +1089,7 @@ class DataManager:
         filepath = Path(filepath) if filepath else self.data_dir / f"utilization_{start_date}_{end_date}.csv"
         
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            with self._open_csv_for_write(filepath) as f:
                 writer = csv.writer(f)
                 
                 writer.writerow(['Salon Kullanım Oranı Raporu'])
@@ -505,29 +1101,85 @@ class DataManager:
                     'Kullanım Oranı (%)', 'Rezervasyon Sayısı'
                 ])
                 
-                for room in system.get_all_rooms():
-                    util = system.get_room_utilization(room.id, start_date, end_date)
-                    writer.writerow([
-                        util['room_name'],
-                        util['total_available_minutes'],
-                        util['used_minutes'],
-                        util['utilization_percent'],
-                        util['reservation_count']
-                    ])
+                utilizations = (system.get_room_utilization(room.id, start_date, end_date)
+                                for room in system.get_all_rooms())
+                self._write_rows_batched(writer, ((
+                    util['room_name'],
+                    util['total_available_minutes'],
+                    util['used_minutes'],
+                    util['utilization_percent'],
+                    util['reservation_count']
+                ) for util in utilizations))
             
             return True
         except Exception as e:
-            print(f"Hata: Kullanım raporu dışa aktarma başarısız - {e}")
+            logger.error("Hata: Kullanım raporu dışa aktarma başarısız - %s", e)
             return False
     
+    # ==================== JSONL İŞLEMLERİ ====================
+    
+    def export_reservations_jsonl(self, reservations: List[Reservation],
+                                  filepath: str = None) -> bool:
+        """
+        Rezervasyonları JSONL (satır başına bir JSON nesnesi) olarak dışa aktar
+        
+        Kayıtlar tek tek kodlanıp yazılır; çıktı satır satır okunabilir.
+        """
+        filepath = Path(filepath) if filepath else self.data_dir / "reservations_export.jsonl"
+        
+        if orjson is not None:
+            def encode(obj: dict) -> bytes:
+                return orjson.dumps(obj) + b"\n"
+        else:
+            encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+            
+            def encode(obj: dict) -> bytes:
+                return (encoder.encode(obj) + "\n").encode('utf-8')
+        
+        try:
+            with _open_json(filepath, 'wb') as f:
+                f.writelines(encode(res.to_dict()) for res in reservations)
+            return True
+        except Exception as e:
+            logger.error("Hata: JSONL dışa aktarma başarısız - %s", e)
+            return False
+    
+    def import_reservations_jsonl(self, filepath: str) -> List[Reservation]:
+        """
+        JSONL dosyasından rezervasyonları içe aktar
+        
+        Args:
+            filepath: JSONL dosya yolu
+        """
+        loads = orjson.loads if orjson is not None else json.loads
+        reservations = []
+        
+        try:
+            with _open_json(Path(filepath), 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        reservations.append(Reservation.from_dict(loads(line)))
+                    except Exception as e:
+                        if logger.isEnabledFor(logging.WARNING):
+                            logger.warning("Uyarı: Satır atlandı - %s", e)
+            
+            return reservations
+        except Exception as e:
+            logger.error("Hata: JSONL içe aktarma başarısız - %s", e)
+            return []
+    
     # ==================== ÖRNEK VERİ ====================
     
     def create_sample_data(self, system: ReservationSystem) -> None:
         """
         Örnek veri oluştur (demo amaçlı)
-        """
-        from datetime import timedelta
         
+        Örnek rezervasyonlar kendi aralarında çakışmasızdır; örnek salonların hepsi
+        yeni eklendiyse ve sistemde rezervasyon yoksa kontrolsüz toplu eklenir,
+        aksi halde her biri kontrol edilir (mevcut salon pasif veya küçük olabilir).
+        """
         # Örnek salonlar
         sample_rooms = [
             Room("R001", "Toplantı Salonu A", 10, RoomType.MEETING, 1,
@@ -544,8 +1196,7 @@ class DataManager:
                  ["projeksiyon", "sahne", "mikrofon", "kayıt sistemi"], 500.0),
         ]
         
-        for room in sample_rooms:
-            system.add_room(room)
+        rooms_added = all([system.add_room(room) for room in sample_rooms])
         
         # Salon bağlantıları
         connections = [
@@ -582,25 +1233,32 @@ class DataManager:
             ("R004", "Burak Demir", "burak@example.com", 8, 9, 12, 0, "Teknik Eğitim", 12),
         ]
         
+        # Gün tarihleri bir kez hesaplanır
+        day_dates = {day_offset: base_date + timedelta(days=day_offset)
+                     for day_offset in {row[3] for row in sample_reservations}}
+        generate_id = system.generate_id
+        
+        reservations = []
         for room_id, name, email, day_offset, start_h, end_h, end_m, title, attendees in sample_reservations:
-            res_date = base_date + timedelta(days=day_offset)
+            day = day_dates[day_offset]
+            year, month, dom = day.year, day.month, day.day
             
-            res = Reservation(
-                id=system.generate_id(),
+            reservations.append(Reservation(
+                id=generate_id(),
                 room_id=room_id,
                 customer_name=name,
                 customer_email=email,
-                start_time=res_date.replace(hour=start_h, minute=0),
-                end_time=res_date.replace(hour=end_h, minute=end_m),
+                start_time=datetime(year, month, dom, start_h, 0),
+                end_time=datetime(year, month, dom, end_h, end_m),
                 status=ReservationStatus.CONFIRMED,
                 priority=2,
                 title=title,
                 attendees=attendees
-            )
-            
-            success, _ = system.create_reservation(res)
-            if not success:
-                print(f"Uyarı: Örnek rezervasyon oluşturulamadı - {title}")
+            ))
+        
+        verify = not rooms_added or bool(system._reservations)
+        for res in system.bulk_create_reservations(reservations, verify=verify):
+            logger.warning("Uyarı: Örnek rezervasyon oluşturulamadı - %s", res.title)
         
         # Bekleme listesi
         system.add_to_waiting_list("W001", "Hakan Yılmaz", "R001", priority=2)
@@ -641,6 +1299,9 @@ if __name__ == "__main__":
     if data_manager.export_reservations_csv(reservations, room_dict):
         print(f"  Rezervasyonlar CSV: {data_manager.data_dir / 'reservations_export.csv'}")
     
+    if data_manager.export_reservations_jsonl(reservations):
+        print(f"  Rezervasyonlar JSONL: {data_manager.data_dir / 'reservations_export.jsonl'}")
+    
     # Günlük rapor
     today = datetime.now().date()
     if data_manager.export_daily_report_csv(system, today):
@@ -1,9 +1,9 @@
 # Veri Yapıları Modülü
 # Salon Rezervasyon Sistemi için özel veri yapıları
 
-from .avl_tree import AVLTree
+from .avl_tree import AVLTree, AVLTreeSoA
 from .interval_tree import IntervalTree
-from .heap import MinHeap, MaxHeap, PriorityQueue
+from .heap import MinHeap, MaxHeap, FourAryHeap, PriorityQueue
 from .graph import Graph
 from .stack_queue import Stack, Queue, CircularQueue, Deque, UndoRedoManager
 from .linked_list import LinkedList, WaitingList
@@ -11,9 +11,11 @@ from .sorting import quicksort, mergesort, heapsort, binary_search
 
 __all__ = [
     'AVLTree',
+    'AVLTreeSoA',
     'IntervalTree', 
     'MinHeap',
     'MaxHeap',
+    'FourAryHeap',
     'PriorityQueue',
     'Graph',
     'Stack',
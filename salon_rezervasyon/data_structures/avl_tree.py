@@ -12,18 +12,33 @@ Zaman Karmaşıklığı:
 Uzay Karmaşıklığı: O(n)
 """
 
-from typing import Any, Optional, List, Callable
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from functools import cmp_to_key, lru_cache
+from io import StringIO
+from operator import lt
+from typing import Any, Iterable, Iterator, Optional, List, Callable, Sequence, Tuple
+
+
+# Çift rotasyonda ortadaki (yeni kök olan) düğümün eski denge faktörüne göre
+# yeni sol ve sağ çocukların denge faktörleri; yeni kökün faktörü her zaman 0'dır
+_DOUBLE_ROTATION_BF = {1: (0, -1), 0: (0, 0), -1: (1, 0)}
 
 
 class AVLNode:
     """AVL Ağacı düğümü"""
     
+    # Düğüm başına __dict__ tutulmaz; büyük ağaçlarda bellek ve gezinti maliyeti düşer
+    __slots__ = ('key', 'value', 'left', 'right', 'bf')
+    
     def __init__(self, key: Any, value: Any = None):
         self.key = key
         self.value = value if value is not None else key
         self.left: Optional['AVLNode'] = None
         self.right: Optional['AVLNode'] = None
-        self.height: int = 1
+        # Denge faktörü: sol yükseklik - sağ yükseklik, {-1, 0, +1}
+        self.bf: int = 0
     
     def __repr__(self):
         return f"AVLNode(key={self.key}, value={self.value})"
@@ -38,28 +53,65 @@ class AVLTree:
     - Otomatik dengeleme (rotation) ile her zaman O(log n) performans
     """
     
-    def __init__(self, compare_func: Callable = None):
+    # Silinen düğümlerin yeniden kullanım listesi için üst sınır
+    FREE_LIST_MAX = 4096
+    
+    # Önbellekli karşılaştırmada tutulacak en fazla (a, b) çifti
+    COMPARE_CACHE_SIZE = 4096
+    
+    def __init__(self, compare_func: Callable = None, cache_compares: bool = False):
         """
         Args:
             compare_func: Özel karşılaştırma fonksiyonu (varsayılan: < operatörü)
+            cache_compares: Özel karşılaştırma sonuçlarını LRU önbellekte tut.
+                Yalnızca anahtarlar hashlenebilir ve karşılaştırma pahalıysa
+                (ör. her çağrıda tarih ayrıştırma) açılmalıdır.
         """
+        if compare_func is not None and cache_compares:
+            compare_func = lru_cache(maxsize=self.COMPARE_CACHE_SIZE)(compare_func)
+        
         self.root: Optional[AVLNode] = None
         self.size: int = 0
         self._compare = compare_func if compare_func else lambda a, b: (a > b) - (a < b)
+        self._free: List[AVLNode] = []
+        
+        # Okuma ağırlıklı aralık sorguları için sıralı dizi görüntüsü; her yazma
+        # _version'ı artırır, görüntü sürümü tutmazsa geçersizdir
+        self._version = 0
+        self._snapshot: Optional[Tuple[int, List[Any], List[Tuple[Any, Any]]]] = None
+        self._last_range_version = -1
+        self._default_order = compare_func is None
+        
+        # Varsayılan anahtarlarda iniş döngüleri < ile doğrudan karşılaştırır,
+        # adım başına karşılaştırma fonksiyonu çağrılmaz
+        if compare_func is None:
+            self._search_node = self._search_node_default
+            self._find_path = self._find_path_default
+            self._iter_range = self._iter_range_default
+        else:
+            self._search_node = self._search_node_custom
+            self._find_path = self._find_path_custom
+            self._iter_range = self._iter_range_custom
+    
+    def _new_node(self, key: Any, value: Any) -> AVLNode:
+        """Düğüm oluştur; varsa silinmiş bir düğümü yeniden kullan"""
+        if not self._free:
+            return AVLNode(key, value)
+        node = self._free.pop()
+        node.key = key
+        node.value = value if value is not None else key
+        node.bf = 0
+        return node
     
-    def _height(self, node: Optional[AVLNode]) -> int:
-        """Düğüm yüksekliğini döndür"""
-        return node.height if node else 0
+    def _release_node(self, node: AVLNode) -> None:
+        """Ağaçtan çıkarılan düğümü referanslarını bırakıp yeniden kullanıma ayır"""
+        if len(self._free) < self.FREE_LIST_MAX:
+            node.key = node.value = node.left = node.right = None
+            self._free.append(node)
     
     def _balance_factor(self, node: Optional[AVLNode]) -> int:
-        """Denge faktörünü hesapla (sol yükseklik - sağ yükseklik)"""
-        if not node:
-            return 0
-        return self._height(node.left) - self._height(node.right)
-    
-    def _update_height(self, node: AVLNode) -> None:
-        """Düğüm yüksekliğini güncelle"""
-        node.height = 1 + max(self._height(node.left), self._height(node.right))
+        """Denge faktörünü döndür (sol yükseklik - sağ yükseklik)"""
+        return node.bf if node else 0
     
     def _rotate_right(self, y: AVLNode) -> AVLNode:
         """
@@ -77,8 +129,9 @@ class AVLTree:
         x.right = y
         y.left = B
         
-        self._update_height(y)
-        self._update_height(x)
+        # Denge faktörleri yükseklik hesaplanmadan eski değerlerden bulunur
+        y.bf = y.bf - 1 - max(x.bf, 0)
+        x.bf = x.bf - 1 + min(y.bf, 0)
         
         return x
     
@@ -98,34 +151,136 @@ class AVLTree:
         y.left = x
         x.right = B
         
-        self._update_height(x)
-        self._update_height(y)
+        x.bf = x.bf + 1 - min(y.bf, 0)
+        y.bf = y.bf + 1 + max(x.bf, 0)
         
         return y
     
-    def _rebalance(self, node: AVLNode, key: Any) -> AVLNode:
-        """Düğümü dengele"""
+    def _rebalance(self, node: AVLNode) -> AVLNode:
+        """Düğümü dengele, alt ağacın yeni kökünü döndür"""
         balance = self._balance_factor(node)
         
-        # Sol-Sol durumu (Left-Left Case)
-        if balance > 1 and self._compare(key, node.left.key) < 0:
+        if balance > 1:
+            # Sol-Sağ durumu (Left-Right Case)
+            if self._balance_factor(node.left) < 0:
+                return self._rotate_left_right(node)
+            # Sol-Sol durumu (Left-Left Case)
             return self._rotate_right(node)
         
-        # Sağ-Sağ durumu (Right-Right Case)
-        if balance < -1 and self._compare(key, node.right.key) > 0:
+        if balance < -1:
+            # Sağ-Sol durumu (Right-Left Case)
+            if self._balance_factor(node.right) > 0:
+                return self._rotate_right_left(node)
+            # Sağ-Sağ durumu (Right-Right Case)
             return self._rotate_left(node)
         
-        # Sol-Sağ durumu (Left-Right Case)
-        if balance > 1 and self._compare(key, node.left.key) > 0:
-            node.left = self._rotate_left(node.left)
-            return self._rotate_right(node)
+        return node
+    
+    def _rotate_left_right(self, z: AVLNode) -> AVLNode:
+        """
+        Sol-sağ çift rotasyon (iki ayrı rotasyon yerine tek adımda)
         
-        # Sağ-Sol durumu (Right-Left Case)
-        if balance < -1 and self._compare(key, node.right.key) < 0:
-            node.right = self._rotate_right(node.right)
-            return self._rotate_left(node)
+              z              y
+             / \\           /   \\
+            x   D   =>     x     z
+           / \\           / \\   / \\
+          A   y         A   B C   D
+             / \\
+            B   C
+        """
+        x = z.left
+        y = x.right
         
-        return node
+        x.right = y.left
+        z.left = y.right
+        y.left = x
+        y.right = z
+        
+        x.bf, z.bf = _DOUBLE_ROTATION_BF[y.bf]
+        y.bf = 0
+        
+        return y
+    
+    def _rotate_right_left(self, z: AVLNode) -> AVLNode:
+        """
+        Sağ-sol çift rotasyon (iki ayrı rotasyon yerine tek adımda)
+        
+            z                  y
+           / \\               /   \\
+          A   x      =>      z     x
+             / \\           / \\   / \\
+            y   D         A   B C   D
+           / \\
+          B   C
+        """
+        x = z.right
+        y = x.left
+        
+        z.right = y.left
+        x.left = y.right
+        y.left = z
+        y.right = x
+        
+        z.bf, x.bf = _DOUBLE_ROTATION_BF[y.bf]
+        y.bf = 0
+        
+        return y
+    
+    def _relink(self, path: List[Tuple[AVLNode, int]], i: int, subtree: AVLNode) -> None:
+        """Yoldaki i. düğümün yerine geçen alt ağacı ebeveynine (veya köke) bağla"""
+        if i == 0:
+            self.root = subtree
+        else:
+            parent, direction = path[i - 1]
+            if direction < 0:
+                parent.left = subtree
+            else:
+                parent.right = subtree
+    
+    def _rebalance_after_insert(self, path: List[Tuple[AVLNode, int]]) -> None:
+        """
+        Ekleme sonrası yolu alttan üste geri sar
+        
+        Büyüyen taraf denge faktörüne işlenir. Faktör 0 olursa alt ağacın
+        yüksekliği değişmemiştir; ±2 olursa döndürülür ve yükseklik eski
+        haline döner. Her iki durumda da yukarı çıkmak gerekmez; yalnızca
+        faktörü 0'dan ±1'e geçen (büyüyen) atalar için devam edilir, bu
+        nedenle yürüyüş ortalamada birkaç düzeyde biter.
+        
+        Args:
+            path: (düğüm, yön) çiftleri; yön < 0 sol, > 0 sağ çocuğa inildiğini gösterir
+        """
+        for i in range(len(path) - 1, -1, -1):
+            node, direction = path[i]
+            bf = node.bf + (1 if direction < 0 else -1)
+            node.bf = bf
+            
+            if bf == 0:
+                return
+            if bf == 2 or bf == -2:
+                self._relink(path, i, self._rebalance(node))
+                return
+    
+    def _rebalance_after_delete(self, path: List[Tuple[AVLNode, int]]) -> None:
+        """
+        Silme sonrası yolu alttan üste geri sar
+        
+        Küçülen taraf denge faktörüne işlenir. Faktör ±1 olursa alt ağacın
+        yüksekliği değişmemiştir; döndürmeden sonra kök faktörü 0 değilse
+        yükseklik yine aynıdır. Diğer durumlarda bir üst düğüme geçilir.
+        """
+        for i in range(len(path) - 1, -1, -1):
+            node, direction = path[i]
+            bf = node.bf + (-1 if direction < 0 else 1)
+            node.bf = bf
+            
+            if bf == 1 or bf == -1:
+                return
+            if bf == 2 or bf == -2:
+                subtree = self._rebalance(node)
+                self._relink(path, i, subtree)
+                if subtree.bf != 0:
+                    return
     
     def insert(self, key: Any, value: Any = None) -> bool:
         """
@@ -138,29 +293,175 @@ class AVLTree:
         Returns:
             bool: Ekleme başarılı ise True
             
+        Anahtar zaten varsa değeri güncellenir ve False döner.
+        İniş özyinelemesiz yapılır; geçilen düğümler yol yığınına kaydedilir.
+        
         Zaman Karmaşıklığı: O(log n)
         """
-        def _insert(node: Optional[AVLNode], key: Any, value: Any) -> AVLNode:
-            if not node:
-                return AVLNode(key, value)
-            
-            cmp = self._compare(key, node.key)
+        self._version += 1
+        path, node = self._find_path(key)
+        if node:
+            node.value = value
+            return False
+        
+        new_node = self._new_node(key, value)
+        self.size += 1
+        
+        if not path:
+            self.root = new_node
+            return True
+        
+        parent, direction = path[-1]
+        if direction < 0:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+        
+        self._rebalance_after_insert(path)
+        return True
+    
+    def bulk_load(self, items: Sequence[Tuple[Any, Any]]) -> None:
+        """
+        Sıralı (anahtar, değer) çiftlerinden ağacı kur
+        
+        Boş ağaçta ortadaki eleman kök seçilerek dengeli ağaç tek geçişte
+        kurulur; ağaç boş değilse çiftler tek tek eklenir.
+        
+        Args:
+            items: Anahtara göre artan sırada, anahtarları tekil çiftler
             
-            if cmp < 0:
-                node.left = _insert(node.left, key, value)
-            elif cmp > 0:
-                node.right = _insert(node.right, key, value)
+        Zaman Karmaşıklığı: O(n) (boş ağaçta)
+        """
+        if self.root is not None:
+            for key, value in items:
+                self.insert(key, value)
+            return
+        
+        # Ortadan bölmede m elemanlı alt ağacın yüksekliği m.bit_length()'tir;
+        # denge faktörü kapalı formdan hesaplanır, yığınla özyinelemesiz kurulur.
+        # Yığın öğesi: (aralık başı, aralık sonu, ebeveyn, yön)
+        self.root = None
+        stack = [(0, len(items), None, 0)]
+        while stack:
+            lo, hi, parent, direction = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            node = AVLNode(*items[mid])
+            node.bf = (mid - lo).bit_length() - (hi - mid - 1).bit_length()
+            if parent is None:
+                self.root = node
+            elif direction < 0:
+                parent.left = node
             else:
-                node.value = value
-                return node
-            
-            self._update_height(node)
-            return self._rebalance(node, key)
+                parent.right = node
+            stack.append((mid + 1, hi, node, 1))
+            stack.append((lo, mid, node, -1))
         
-        old_size = self.size
-        self.root = _insert(self.root, key, value)
-        self.size += 1
-        return self.size > old_size
+        self.size = len(items)
+        self._version += 1
+    
+    @classmethod
+    def from_sorted(cls, items: Sequence[Tuple[Any, Any]],
+                    compare_func: Callable = None) -> 'AVLTree':
+        """
+        Sıralı, anahtarları tekil (anahtar, değer) çiftlerinden dengeli ağaç kur - O(n)
+        
+        Kurulum özyinelemesizdir (bkz. bulk_load).
+        """
+        tree = cls(compare_func)
+        tree.bulk_load(items)
+        return tree
+    
+    @classmethod
+    def from_iterable(cls, items: Iterable[Tuple[Any, Any]],
+                      compare_func: Callable = None) -> 'AVLTree':
+        """
+        Sırasız (anahtar, değer) çiftlerinden ağaç kur - O(n log n) sıralama + O(n) kurulum
+        
+        Tekrarlanan anahtarlarda insert'teki gibi son değer geçerlidir.
+        """
+        return cls.from_sorted(cls._sorted_unique(items, compare_func), compare_func)
+    
+    @staticmethod
+    def _sorted_unique(items: Iterable[Tuple[Any, Any]],
+                       compare_func: Callable = None) -> List[Tuple[Any, Any]]:
+        """Çiftleri anahtara göre sırala; tekrarlanan anahtarlarda son çifti tut"""
+        if compare_func is None:
+            ordered = sorted(items, key=lambda pair: pair[0])
+            same = lambda a, b: not (a < b or b < a)
+        else:
+            key_func = cmp_to_key(compare_func)
+            ordered = sorted(items, key=lambda pair: key_func(pair[0]))
+            same = lambda a, b: compare_func(a, b) == 0
+        
+        # Sıralama kararlı; eşit anahtarlardan en son gelen tutulur
+        unique: List[Tuple[Any, Any]] = []
+        for pair in ordered:
+            if unique and same(unique[-1][0], pair[0]):
+                unique[-1] = pair
+            else:
+                unique.append(pair)
+        return unique
+    
+    def _merge_sorted(self, old: List[Tuple[Any, Any]],
+                      new: List[Tuple[Any, Any]]) -> List[Tuple[Any, Any]]:
+        """
+        İki sıralı çift listesini birleştir; eşit anahtarda yeni çift geçerli
+        
+        Varsayılan sıralamada operator.lt (C seviyesinde <) kullanılır; üç yönlü
+        karşılaştırma fonksiyonu yalnızca özel sıralamada çağrılır.
+        """
+        if self._default_order:
+            less = lt
+        else:
+            compare = self._compare
+            less = lambda a, b: compare(a, b) < 0
+        
+        merged: List[Tuple[Any, Any]] = []
+        i = j = 0
+        
+        while i < len(old) and j < len(new):
+            old_key = old[i][0]
+            new_key = new[j][0]
+            if less(old_key, new_key):
+                merged.append(old[i])
+                i += 1
+            elif less(new_key, old_key):
+                merged.append(new[j])
+                j += 1
+            else:
+                merged.append(new[j])
+                i += 1
+                j += 1
+        
+        merged.extend(old[i:])
+        merged.extend(new[j:])
+        return merged
+    
+    def bulk_insert(self, items: Iterable[Tuple[Any, Any]]) -> None:
+        """
+        Çok sayıda (anahtar, değer) çiftini ekle
+        
+        Eklenecekler mevcut ağaca göre büyükse (4m > n) ağaç sıralı birleştirme
+        ile O(n + m log m) yeniden kurulur; küçükse çiftler tek tek eklenir.
+        Tekrarlanan anahtarlarda insert'teki gibi son değer geçerlidir.
+        """
+        items = list(items)
+        if not items:
+            return
+        
+        if len(items) * 4 <= self.size:
+            for key, value in items:
+                self.insert(key, value)
+            return
+        
+        compare_func = None if self._default_order else self._compare
+        merged = self._merge_sorted(list(self._iter_inorder()),
+                                    self._sorted_unique(items, compare_func))
+        self.root = None
+        self.size = 0
+        self.bulk_load(merged)
     
     def search(self, key: Any) -> Optional[Any]:
         """
@@ -177,11 +478,25 @@ class AVLTree:
         node = self._search_node(key)
         return node.value if node else None
     
-    def _search_node(self, key: Any) -> Optional[AVLNode]:
-        """Anahtara göre düğüm ara"""
+    def _search_node_default(self, key: Any) -> Optional[AVLNode]:
+        """Anahtara göre düğüm ara (varsayılan < karşılaştırması)"""
         current = self.root
         while current:
-            cmp = self._compare(key, current.key)
+            current_key = current.key
+            if key < current_key:
+                current = current.left
+            elif current_key < key:
+                current = current.right
+            else:
+                return current
+        return None
+    
+    def _search_node_custom(self, key: Any) -> Optional[AVLNode]:
+        """Anahtara göre düğüm ara (özel karşılaştırma fonksiyonu)"""
+        compare = self._compare
+        current = self.root
+        while current:
+            cmp = compare(key, current.key)
             if cmp < 0:
                 current = current.left
             elif cmp > 0:
@@ -190,6 +505,42 @@ class AVLTree:
                 return current
         return None
     
+    def _find_path_default(self, key: Any) -> Tuple[List[Tuple[AVLNode, int]], Optional[AVLNode]]:
+        """
+        Kökten anahtara in (varsayılan < karşılaştırması)
+        
+        Returns:
+            (yol, düğüm): geçilen (düğüm, yön) çiftleri ve bulunan düğüm (yoksa None)
+        """
+        path: List[Tuple[AVLNode, int]] = []
+        append = path.append
+        node = self.root
+        while node:
+            node_key = node.key
+            if key < node_key:
+                append((node, -1))
+                node = node.left
+            elif node_key < key:
+                append((node, 1))
+                node = node.right
+            else:
+                break
+        return path, node
+    
+    def _find_path_custom(self, key: Any) -> Tuple[List[Tuple[AVLNode, int]], Optional[AVLNode]]:
+        """Kökten anahtara in (özel karşılaştırma fonksiyonu)"""
+        compare = self._compare
+        path: List[Tuple[AVLNode, int]] = []
+        append = path.append
+        node = self.root
+        while node:
+            cmp = compare(key, node.key)
+            if cmp == 0:
+                break
+            append((node, cmp))
+            node = node.left if cmp < 0 else node.right
+        return path, node
+    
     def contains(self, key: Any) -> bool:
         """Anahtar ağaçta var mı kontrol et"""
         return self._search_node(key) is not None
@@ -197,15 +548,19 @@ class AVLTree:
     def _find_min(self, node: AVLNode) -> AVLNode:
         """Alt ağaçtaki en küçük düğümü bul"""
         current = node
-        while current.left:
-            current = current.left
+        left = current.left
+        while left is not None:
+            current = left
+            left = current.left
         return current
     
     def _find_max(self, node: AVLNode) -> AVLNode:
         """Alt ağaçtaki en büyük düğümü bul"""
         current = node
-        while current.right:
-            current = current.right
+        right = current.right
+        while right is not None:
+            current = right
+            right = current.right
         return current
     
     def delete(self, key: Any) -> bool:
@@ -218,62 +573,40 @@ class AVLTree:
         Returns:
             bool: Silme başarılı ise True
             
+        İniş özyinelemesiz yapılır; yol yığını geri sarılarak dengelenir.
+        
         Zaman Karmaşıklığı: O(log n)
         """
-        def _delete(node: Optional[AVLNode], key: Any) -> Optional[AVLNode]:
-            if not node:
-                return None
-            
-            cmp = self._compare(key, node.key)
-            
-            if cmp < 0:
-                node.left = _delete(node.left, key)
-            elif cmp > 0:
-                node.right = _delete(node.right, key)
-            else:
-                # Silinecek düğüm bulundu
-                if not node.left:
-                    return node.right
-                elif not node.right:
-                    return node.left
-                else:
-                    # İki çocuklu düğüm: sağ alt ağacın en küçüğünü al
-                    successor = self._find_min(node.right)
-                    node.key = successor.key
-                    node.value = successor.value
-                    node.right = _delete(node.right, successor.key)
-            
-            # Yüksekliği güncelle
-            self._update_height(node)
-            
-            # Dengeyi kontrol et
-            balance = self._balance_factor(node)
-            
-            # Sol-Sol durumu
-            if balance > 1 and self._balance_factor(node.left) >= 0:
-                return self._rotate_right(node)
-            
-            # Sol-Sağ durumu
-            if balance > 1 and self._balance_factor(node.left) < 0:
-                node.left = self._rotate_left(node.left)
-                return self._rotate_right(node)
-            
-            # Sağ-Sağ durumu
-            if balance < -1 and self._balance_factor(node.right) <= 0:
-                return self._rotate_left(node)
-            
-            # Sağ-Sol durumu
-            if balance < -1 and self._balance_factor(node.right) > 0:
-                node.right = self._rotate_right(node.right)
-                return self._rotate_left(node)
-            
-            return node
-        
-        if not self.contains(key):
+        path, node = self._find_path(key)
+        if node is None:
             return False
         
-        self.root = _delete(self.root, key)
+        if node.left and node.right:
+            # İki çocuklu düğüm: sağ alt ağacın en küçüğü yerine taşınır,
+            # o düğüm (sol çocuğu yok) ağaçtan çıkarılır
+            path.append((node, 1))
+            successor = node.right
+            while successor.left:
+                path.append((successor, -1))
+                successor = successor.left
+            node.key = successor.key
+            node.value = successor.value
+            node = successor
+        
+        child = node.left if node.left else node.right
+        if not path:
+            self.root = child
+        else:
+            parent, direction = path[-1]
+            if direction < 0:
+                parent.left = child
+            else:
+                parent.right = child
+        
+        self._release_node(node)
         self.size -= 1
+        self._version += 1
+        self._rebalance_after_delete(path)
         return True
     
     def get_min(self) -> Optional[Any]:
@@ -288,43 +621,62 @@ class AVLTree:
             return None
         return self._find_max(self.root).value
     
+    def _iter_inorder(self) -> Iterator[Tuple[Any, Any]]:
+        """
+        Inorder (sıralı) gezinti üreteci
+        
+        Özyineleme yerine açık yığın kullanılır; ek bellek O(yükseklik).
+        """
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        node = self.root
+        while stack or node:
+            while node:
+                push(node)
+                node = node.left
+            node = pop()
+            yield node.key, node.value
+            node = node.right
+    
     def inorder_traversal(self) -> List[Any]:
         """Inorder (sıralı) gezinti - O(n)"""
-        result = []
-        
-        def _inorder(node: Optional[AVLNode]):
-            if node:
-                _inorder(node.left)
-                result.append((node.key, node.value))
-                _inorder(node.right)
-        
-        _inorder(self.root)
-        return result
+        return list(self._iter_inorder())
     
     def preorder_traversal(self) -> List[Any]:
         """Preorder gezinti - O(n)"""
         result = []
+        stack = [self.root] if self.root else []
         
-        def _preorder(node: Optional[AVLNode]):
-            if node:
-                result.append((node.key, node.value))
-                _preorder(node.left)
-                _preorder(node.right)
+        while stack:
+            node = stack.pop()
+            result.append((node.key, node.value))
+            # Sol çocuk önce işlensin diye sağ çocuk önce yığına konur
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
         
-        _preorder(self.root)
         return result
     
     def postorder_traversal(self) -> List[Any]:
-        """Postorder gezinti - O(n)"""
+        """
+        Postorder gezinti - O(n)
+        
+        Kök-sağ-sol sırası yığınla üretilip ters çevrilir (sol-sağ-kök).
+        """
         result = []
+        stack = [self.root] if self.root else []
         
-        def _postorder(node: Optional[AVLNode]):
-            if node:
-                _postorder(node.left)
-                _postorder(node.right)
-                result.append((node.key, node.value))
+        while stack:
+            node = stack.pop()
+            result.append((node.key, node.value))
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
         
-        _postorder(self.root)
+        result.reverse()
         return result
     
     def level_order_traversal(self) -> List[List[Any]]:
@@ -333,14 +685,14 @@ class AVLTree:
             return []
         
         result = []
-        queue = [self.root]
+        queue = deque((self.root,))
         
         while queue:
             level = []
             level_size = len(queue)
             
             for _ in range(level_size):
-                node = queue.pop(0)
+                node = queue.popleft()
                 level.append((node.key, node.value))
                 
                 if node.left:
@@ -363,51 +715,140 @@ class AVLTree:
         Returns:
             Aralıktaki değerlerin listesi
             
+        Varsayılan sıralamada, araya yazma girmeden gelen ikinci sorgudan itibaren
+        sıralı dizi görüntüsü kurulur; sorgu iki ikili arama ve bir dilimdir.
+        
         Zaman Karmaşıklığı: O(log n + k) - k: sonuç sayısı
+        (görüntü yazmadan sonra bir kez O(n) ile kurulur)
         """
-        result = []
+        if not self._default_order:
+            return list(self._iter_range(low, high))
         
-        def _range_query(node: Optional[AVLNode]):
-            if not node:
-                return
-            
-            # Sol alt ağaç low'dan büyük olabilir
-            if self._compare(node.key, low) > 0:
-                _range_query(node.left)
+        snapshot = self._snapshot
+        if snapshot is None or snapshot[0] != self._version:
+            # Yazmadan sonraki ilk sorgu ağaçta yürür; tek sorguluk yazma-okuma
+            # döngülerinde her seferinde O(n) görüntü kurulmaz
+            if self._last_range_version != self._version:
+                self._last_range_version = self._version
+                return list(self._iter_range(low, high))
             
-            # Mevcut düğüm aralıkta mı?
-            if self._compare(node.key, low) >= 0 and self._compare(node.key, high) <= 0:
-                result.append((node.key, node.value))
-            
-            # Sağ alt ağaç high'dan küçük olabilir
-            if self._compare(node.key, high) < 0:
-                _range_query(node.right)
+            pairs = list(self._iter_inorder())
+            snapshot = self._snapshot = (self._version, [key for key, _ in pairs], pairs)
         
-        _range_query(self.root)
-        return result
+        _, keys, pairs = snapshot
+        return pairs[bisect_left(keys, low):bisect_right(keys, high)]
+    
+    def iter_range(self, low: Any, high: Any) -> Iterator[Tuple[Any, Any]]:
+        """
+        Aralıktaki (anahtar, değer) çiftlerini sıralı üret
+        
+        Liste kurulmaz; ilk k sonuçla yetinen çağıran yalnızca onların bedelini öder.
+        """
+        return self._iter_range(low, high)
+    
+    def _iter_range_default(self, low: Any, high: Any) -> Iterator[Tuple[Any, Any]]:
+        """
+        Aralık gezintisi (varsayılan < karşılaştırması)
+        
+        low'dan küçük düğümlerin sol alt ağaçlarına inilmez; high'ı aşan ilk
+        düğümde gezinti biter. Düğüm başına her sınır en fazla bir kez karşılaştırılır.
+        """
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        node = self.root
+        while True:
+            while node:
+                key = node.key
+                if key < low:
+                    node = node.right
+                else:
+                    push(node)
+                    node = node.left if low < key else None
+            if not stack:
+                return
+            node = pop()
+            if high < node.key:
+                return
+            yield node.key, node.value
+            node = node.right
+    
+    def _iter_range_custom(self, low: Any, high: Any) -> Iterator[Tuple[Any, Any]]:
+        """Aralık gezintisi (özel karşılaştırma fonksiyonu)"""
+        compare = self._compare
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        node = self.root
+        while True:
+            while node:
+                c_low = compare(node.key, low)
+                if c_low < 0:
+                    node = node.right
+                else:
+                    push(node)
+                    node = node.left if c_low > 0 else None
+            if not stack:
+                return
+            node = pop()
+            if compare(node.key, high) > 0:
+                return
+            yield node.key, node.value
+            node = node.right
     
     def get_height(self) -> int:
-        """Ağacın yüksekliğini döndür"""
-        return self._height(self.root)
+        """
+        Ağacın yüksekliğini döndür
+        
+        Denge faktörüne göre hep daha yüksek alt ağaca inilir - O(log n)
+        """
+        height = 0
+        node = self.root
+        while node:
+            height += 1
+            node = node.left if node.bf > 0 else node.right
+        return height
     
     def is_balanced(self) -> bool:
-        """Ağacın dengeli olup olmadığını kontrol et"""
-        def _check_balance(node: Optional[AVLNode]) -> bool:
-            if not node:
-                return True
+        """
+        Ağacın dengeli olup olmadığını kontrol et
+        
+        Yükseklikler yeniden hesaplanır; saklanan denge faktörleri de doğrulanır.
+        Özyinelemesiz sonsıra (postorder) gezinti ilk dengesizlikte durur.
+        """
+        if not self.root:
+            return True
+        
+        # (düğüm, çocukları işlendi mi); alt ağaç yükseklikleri ayrı yığında
+        stack = [(self.root, False)]
+        heights: List[int] = []
+        
+        while stack:
+            node, children_done = stack.pop()
+            if not children_done:
+                stack.append((node, True))
+                if node.right:
+                    stack.append((node.right, False))
+                if node.left:
+                    stack.append((node.left, False))
+                continue
             
-            balance = self._balance_factor(node)
-            if abs(balance) > 1:
-                return False
+            # Çocukların yükseklikleri yığının üstündedir (önce sol, sonra sağ)
+            right_height = heights.pop() if node.right else 0
+            left_height = heights.pop() if node.left else 0
             
-            return _check_balance(node.left) and _check_balance(node.right)
+            balance = left_height - right_height
+            if balance > 1 or balance < -1 or balance != node.bf:
+                return False
+            heights.append(1 + (left_height if left_height > right_height else right_height))
         
-        return _check_balance(self.root)
+        return True
     
     def clear(self) -> None:
         """Ağacı temizle"""
         self.root = None
         self.size = 0
+        self._version += 1
     
     def __len__(self) -> int:
         return self.size
@@ -416,41 +857,431 @@ class AVLTree:
         return self.contains(key)
     
     def __iter__(self):
-        """Inorder sırasıyla iterasyon"""
-        for key, value in self.inorder_traversal():
-            yield key, value
+        """Inorder sırasıyla iterasyon (liste kurulmadan)"""
+        return self._iter_inorder()
     
     def __repr__(self):
         return f"AVLTree(size={self.size}, height={self.get_height()})"
     
     def visualize(self, max_depth: int = 5) -> str:
-        """Ağacı görselleştir (konsol için)"""
+        """
+        Ağacı görselleştir (konsol için)
+        
+        Yığıt tabanlı ön-sıra gezinme; derinlik sınırı çocuk yığıta
+        eklenmeden önce kontrol edilir, satırlar StringIO'ya yazılır.
+        """
         if not self.root:
             return "Empty tree"
+        if max_depth < 0:
+            return ""
+        
+        buffer = StringIO()
+        write = buffer.write
+        # (düğüm, önek, son çocuk mu, derinlik)
+        stack = [(self.root, "", True, 0)]
+        pop = stack.pop
+        push = stack.append
+        first = True
         
-        lines = []
-        self._visualize_node(self.root, "", True, lines, 0, max_depth)
-        return "\n".join(lines)
+        while stack:
+            node, prefix, is_last, depth = pop()
+            if not first:
+                write("\n")
+            first = False
+            write(prefix)
+            write("└── " if is_last else "├── ")
+            write(str(node.key))
+            write(" (bf=")
+            write(str(node.bf))
+            write(")")
+            
+            if depth >= max_depth:
+                continue
+            
+            child_prefix = prefix + ("    " if is_last else "│   ")
+            left, right = node.left, node.right
+            # Sol önce yazılsın diye sağ çocuk yığıta önce eklenir
+            if right is not None:
+                push((right, child_prefix, True, depth + 1))
+            if left is not None:
+                push((left, child_prefix, right is None, depth + 1))
+        
+        return buffer.getvalue()
+
+
+class AVLTreeSoA:
+    """
+    Tamsayı anahtarlı AVL ağacı - dizi yapısı (structure of arrays) düzeni
     
-    def _visualize_node(self, node: Optional[AVLNode], prefix: str, is_last: bool, 
-                        lines: List[str], depth: int, max_depth: int):
-        if not node or depth > max_depth:
-            return
+    Düğüm nesnesi yoktur; i numaralı düğümün anahtarı keys[i], çocukları
+    left[i] / right[i] (yoksa -1), denge faktörü bf[i], değeri values[i]'dir.
+    İniş döngüsü Python nesne özellikleri yerine array.array okumalarıyla
+    ilerler. Silinen yuvalar left[] üzerinden zincirlenen boş listeye eklenir.
+    
+    Tamsayı anahtarlar için isteğe bağlı bir yapıdır; anahtarlar 64-bit işaretli
+    tamsayı olmalıdır ve özel karşılaştırma fonksiyonu desteklenmez. Rezervasyon
+    ID'leri 8 karakterlik onaltılık metin olduğundan bu ağaçta tutulamaz; onlar
+    için AVLTree kullanılır.
+    """
+    
+    def __init__(self):
+        self.keys = array('q')
+        self.left = array('q')
+        self.right = array('q')
+        self.bf = array('b')
+        self.values: List[Any] = []
+        self.free_head = -1
+        self.root = -1
+        self.size = 0
+    
+    def _alloc(self, key: int, value: Any) -> int:
+        """Yeni düğüm yuvası; varsa boş listeden yeniden kullanılır"""
+        value = value if value is not None else key
+        i = self.free_head
+        if i >= 0:
+            self.free_head = self.left[i]
+            self.keys[i] = key
+            self.left[i] = -1
+            self.right[i] = -1
+            self.bf[i] = 0
+            self.values[i] = value
+            return i
         
-        connector = "└── " if is_last else "├── "
-        lines.append(f"{prefix}{connector}{node.key} (h={node.height})")
+        self.keys.append(key)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.bf.append(0)
+        self.values.append(value)
+        return len(self.values) - 1
+    
+    def _release(self, i: int) -> None:
+        """Yuvayı boş listeye ekle; değer referansı bırakılır"""
+        self.values[i] = None
+        self.right[i] = -1
+        self.left[i] = self.free_head
+        self.free_head = i
+    
+    def _rotate_right(self, y: int) -> int:
+        """Sağa rotasyon (bkz. AVLTree._rotate_right)"""
+        left, right, bf = self.left, self.right, self.bf
+        x = left[y]
+        left[y] = right[x]
+        right[x] = y
         
-        new_prefix = prefix + ("    " if is_last else "│   ")
+        y_bf = bf[y] - 1 - max(bf[x], 0)
+        bf[y] = y_bf
+        bf[x] = bf[x] - 1 + min(y_bf, 0)
+        return x
+    
+    def _rotate_left(self, x: int) -> int:
+        """Sola rotasyon (bkz. AVLTree._rotate_left)"""
+        left, right, bf = self.left, self.right, self.bf
+        y = right[x]
+        right[x] = left[y]
+        left[y] = x
         
-        children = []
-        if node.left:
-            children.append(("L", node.left))
-        if node.right:
-            children.append(("R", node.right))
+        x_bf = bf[x] + 1 - min(bf[y], 0)
+        bf[x] = x_bf
+        bf[y] = bf[y] + 1 + max(x_bf, 0)
+        return y
+    
+    def _rotate_left_right(self, z: int) -> int:
+        """Sol-sağ çift rotasyon (bkz. AVLTree._rotate_left_right)"""
+        left, right, bf = self.left, self.right, self.bf
+        x = left[z]
+        y = right[x]
+        right[x] = left[y]
+        left[z] = right[y]
+        left[y] = x
+        right[y] = z
+        
+        bf[x], bf[z] = _DOUBLE_ROTATION_BF[bf[y]]
+        bf[y] = 0
+        return y
+    
+    def _rotate_right_left(self, z: int) -> int:
+        """Sağ-sol çift rotasyon (bkz. AVLTree._rotate_right_left)"""
+        left, right, bf = self.left, self.right, self.bf
+        x = right[z]
+        y = left[x]
+        right[z] = left[y]
+        left[x] = right[y]
+        left[y] = z
+        right[y] = x
         
-        for i, (side, child) in enumerate(children):
-            is_last_child = (i == len(children) - 1)
-            self._visualize_node(child, new_prefix, is_last_child, lines, depth + 1, max_depth)
+        bf[z], bf[x] = _DOUBLE_ROTATION_BF[bf[y]]
+        bf[y] = 0
+        return y
+    
+    def _rebalance(self, i: int) -> int:
+        """Düğümü dengele, alt ağacın yeni kökünü döndür"""
+        bf = self.bf
+        if bf[i] > 1:
+            if bf[self.left[i]] < 0:
+                return self._rotate_left_right(i)
+            return self._rotate_right(i)
+        if bf[i] < -1:
+            if bf[self.right[i]] > 0:
+                return self._rotate_right_left(i)
+            return self._rotate_left(i)
+        return i
+    
+    def _relink(self, path: List[Tuple[int, int]], i: int, subtree: int) -> None:
+        """Yoldaki i. düğümün yerine geçen alt ağacı ebeveynine (veya köke) bağla"""
+        if i == 0:
+            self.root = subtree
+        else:
+            parent, direction = path[i - 1]
+            if direction < 0:
+                self.left[parent] = subtree
+            else:
+                self.right[parent] = subtree
+    
+    def _find_path(self, key: int) -> Tuple[List[Tuple[int, int]], int]:
+        """Kökten anahtara in; (yol, düğüm indisi veya -1)"""
+        keys, left, right = self.keys, self.left, self.right
+        path: List[Tuple[int, int]] = []
+        append = path.append
+        i = self.root
+        while i >= 0:
+            k = keys[i]
+            if key < k:
+                append((i, -1))
+                i = left[i]
+            elif k < key:
+                append((i, 1))
+                i = right[i]
+            else:
+                break
+        return path, i
+    
+    def insert(self, key: int, value: Any = None) -> bool:
+        """
+        Ekle; anahtar varsa değeri güncelle ve False döndür
+        
+        Zaman Karmaşıklığı: O(log n)
+        """
+        path, i = self._find_path(key)
+        if i >= 0:
+            self.values[i] = value
+            return False
+        
+        new = self._alloc(key, value)
+        self.size += 1
+        if not path:
+            self.root = new
+            return True
+        
+        parent, direction = path[-1]
+        if direction < 0:
+            self.left[parent] = new
+        else:
+            self.right[parent] = new
+        
+        # Geri sarma AVLTree._rebalance_after_insert ile aynıdır
+        bf = self.bf
+        for j in range(len(path) - 1, -1, -1):
+            node, direction = path[j]
+            bf[node] += 1 if direction < 0 else -1
+            if bf[node] == 0:
+                break
+            if bf[node] in (2, -2):
+                self._relink(path, j, self._rebalance(node))
+                break
+        return True
+    
+    def delete(self, key: int) -> bool:
+        """
+        Anahtarı sil; yoksa False
+        
+        Zaman Karmaşıklığı: O(log n)
+        """
+        path, i = self._find_path(key)
+        if i < 0:
+            return False
+        
+        keys, left, right, values = self.keys, self.left, self.right, self.values
+        if left[i] >= 0 and right[i] >= 0:
+            # İki çocuklu düğüm: sağ alt ağacın en küçüğü yerine taşınır
+            path.append((i, 1))
+            successor = right[i]
+            while left[successor] >= 0:
+                path.append((successor, -1))
+                successor = left[successor]
+            keys[i] = keys[successor]
+            values[i] = values[successor]
+            i = successor
+        
+        child = left[i] if left[i] >= 0 else right[i]
+        if not path:
+            self.root = child
+        else:
+            parent, direction = path[-1]
+            if direction < 0:
+                left[parent] = child
+            else:
+                right[parent] = child
+        
+        self._release(i)
+        self.size -= 1
+        
+        # Geri sarma AVLTree._rebalance_after_delete ile aynıdır
+        bf = self.bf
+        for j in range(len(path) - 1, -1, -1):
+            node, direction = path[j]
+            bf[node] += -1 if direction < 0 else 1
+            if bf[node] in (1, -1):
+                break
+            if bf[node] in (2, -2):
+                subtree = self._rebalance(node)
+                self._relink(path, j, subtree)
+                if bf[subtree] != 0:
+                    break
+        return True
+    
+    def _search_index(self, key: int) -> int:
+        """Anahtarın düğüm indisi; yoksa -1"""
+        keys, left, right = self.keys, self.left, self.right
+        i = self.root
+        while i >= 0:
+            k = keys[i]
+            if key < k:
+                i = left[i]
+            elif k < key:
+                i = right[i]
+            else:
+                return i
+        return -1
+    
+    def search(self, key: int) -> Optional[Any]:
+        """Anahtara göre değer ara - O(log n)"""
+        i = self._search_index(key)
+        return self.values[i] if i >= 0 else None
+    
+    def contains(self, key: int) -> bool:
+        """Anahtar ağaçta var mı kontrol et"""
+        return self._search_index(key) >= 0
+    
+    def get_min(self) -> Optional[Any]:
+        """En küçük anahtarlı değeri döndür"""
+        i = self.root
+        if i < 0:
+            return None
+        left = self.left
+        while left[i] >= 0:
+            i = left[i]
+        return self.values[i]
+    
+    def get_max(self) -> Optional[Any]:
+        """En büyük anahtarlı değeri döndür"""
+        i = self.root
+        if i < 0:
+            return None
+        right = self.right
+        while right[i] >= 0:
+            i = right[i]
+        return self.values[i]
+    
+    def iter_range(self, low: int, high: int) -> Iterator[Tuple[int, Any]]:
+        """Aralıktaki (anahtar, değer) çiftlerini sıralı üret"""
+        keys, left, right, values = self.keys, self.left, self.right, self.values
+        stack: List[int] = []
+        push = stack.append
+        pop = stack.pop
+        i = self.root
+        while True:
+            while i >= 0:
+                k = keys[i]
+                if k < low:
+                    i = right[i]
+                else:
+                    push(i)
+                    i = left[i] if low < k else -1
+            if not stack:
+                return
+            i = pop()
+            if high < keys[i]:
+                return
+            yield keys[i], values[i]
+            i = right[i]
+    
+    def range_query(self, low: int, high: int) -> List[Tuple[int, Any]]:
+        """Belirli aralıktaki (anahtar, değer) çiftleri - O(log n + k)"""
+        return list(self.iter_range(low, high))
+    
+    def _iter_inorder(self) -> Iterator[Tuple[int, Any]]:
+        """Inorder (sıralı) gezinti üreteci"""
+        keys, left, right, values = self.keys, self.left, self.right, self.values
+        stack: List[int] = []
+        push = stack.append
+        pop = stack.pop
+        i = self.root
+        while stack or i >= 0:
+            while i >= 0:
+                push(i)
+                i = left[i]
+            i = pop()
+            yield keys[i], values[i]
+            i = right[i]
+    
+    def inorder_traversal(self) -> List[Tuple[int, Any]]:
+        """Inorder (sıralı) gezinti - O(n)"""
+        return list(self._iter_inorder())
+    
+    def get_height(self) -> int:
+        """Ağacın yüksekliği; hep daha yüksek alt ağaca inilir - O(log n)"""
+        left, right, bf = self.left, self.right, self.bf
+        height = 0
+        i = self.root
+        while i >= 0:
+            height += 1
+            i = left[i] if bf[i] > 0 else right[i]
+        return height
+    
+    def is_balanced(self) -> bool:
+        """Yükseklikleri yeniden hesaplayıp denge faktörlerini doğrula"""
+        if self.root < 0:
+            return True
+        
+        left, right, bf = self.left, self.right, self.bf
+        stack = [(self.root, False)]
+        heights: List[int] = []
+        
+        while stack:
+            i, children_done = stack.pop()
+            if not children_done:
+                stack.append((i, True))
+                if right[i] >= 0:
+                    stack.append((right[i], False))
+                if left[i] >= 0:
+                    stack.append((left[i], False))
+                continue
+            
+            right_height = heights.pop() if right[i] >= 0 else 0
+            left_height = heights.pop() if left[i] >= 0 else 0
+            balance = left_height - right_height
+            if balance > 1 or balance < -1 or balance != bf[i]:
+                return False
+            heights.append(1 + (left_height if left_height > right_height else right_height))
+        
+        return True
+    
+    def clear(self) -> None:
+        """Ağacı ve tüm dizileri temizle"""
+        self.__init__()
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __contains__(self, key: int) -> bool:
+        return self.contains(key)
+    
+    def __iter__(self):
+        """Inorder sırasıyla iterasyon (liste kurulmadan)"""
+        return self._iter_inorder()
+    
+    def __repr__(self):
+        return f"AVLTreeSoA(size={self.size}, height={self.get_height()})"
 
 
 # Kullanım örneği ve test
@@ -13,14 +13,60 @@ Uzay Karmaşıklığı: O(V + E)
 """
 
 from typing import Any, Dict, List, Optional, Set, Tuple, Callable
-from collections import defaultdict
+from array import array
+from collections import defaultdict, deque
+from heapq import heappush, heappop
 import math
 
-# Heap modülünden import
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from heap import MinHeap, PriorityQueue
+# Opsiyonel JIT derleme; kurulu değilse Dijkstra saf Python döngüsüyle çalışır
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _dijkstra_numba(indptr, indices, weights, source, target):
+        """
+        CSR dizileri üzerinde derlenmiş Dijkstra çekirdeği
+        
+        Graph.dijkstra'daki döngünün aynısıdır; yığın öğesi (mesafe, sıra, düğüm).
+        Returns:
+            (dist, pred) numpy dizileri; ulaşılamayan düğümde inf / -1
+        """
+        n = indptr.shape[0] - 1
+        dist = np.full(n, np.inf)
+        pred = np.full(n, -1, np.int64)
+        done = np.zeros(n, np.uint8)
+        dist[source] = 0.0
+        
+        heap = [(0.0, 0, source)]
+        counter = 1
+        while len(heap) > 0:
+            current_dist, _, u = heappop(heap)
+            if done[u]:
+                continue
+            done[u] = 1
+            if u == target:
+                break
+            
+            for j in range(indptr[u], indptr[u + 1]):
+                v = indices[j]
+                if done[v]:
+                    continue
+                new_dist = current_dist + weights[j]
+                if new_dist < dist[v]:
+                    dist[v] = new_dist
+                    pred[v] = u
+                    heappush(heap, (new_dist, counter, v))
+                    counter += 1
+        
+        return dist, pred
+else:
+    _dijkstra_numba = None
 
 
 class Graph:
@@ -33,15 +79,159 @@ class Graph:
     - Salon öneri sistemi (benzer salonları bulma)
     """
     
+    # Derlenmiş Dijkstra çekirdeğinin kullanılacağı en küçük düğüm sayısı;
+    # küçük graflarda dizi dönüşümü kazancı aşar
+    NUMBA_MIN_VERTICES = 1000
+    
+    # Yön değiştiren BFS eşikleri (Beamer): sınır kümesi büyüdüğünde
+    # (|sınır| * ALPHA > |ziyaret edilmemiş|) aşağıdan yukarıya, küçüldüğünde
+    # (|sınır| * BETA < V) yukarıdan aşağıya geçilir
+    BFS_ALPHA = 14
+    BFS_BETA = 24
+    
     def __init__(self, directed: bool = False):
         """
         Args:
             directed: Yönlü graf mı?
         """
         self.directed = directed
-        self.adjacency_list: Dict[Any, List[Tuple[Any, float]]] = defaultdict(list)
+        self._adjacency: Dict[Any, List[Tuple[Any, float]]] = defaultdict(list)
+        # add_edge kenarları önce bu listeye yazar; komşuluk listeleri ilk
+        # erişimde (gezinti, komşu sorgusu, silme) topluca doldurulur
+        self._pending_edges: List[Tuple[Any, Any, float]] = []
         self.vertices: Set[Any] = set()
         self.vertex_data: Dict[Any, Any] = {}  # Düğüm verileri (salon bilgileri)
+        # Ters komşuluk: düğüme kenarı olan düğümler; silme yalnızca gerçek
+        # komşuların listelerine dokunur
+        self._reverse_adj: Dict[Any, Set[Any]] = defaultdict(set)
+        
+        # Gezinti için sıkıştırılmış satır (CSR) görünümü; ilk gezintide kurulur,
+        # her yapısal değişiklikte geçersiz kılınır
+        self._csr: Optional[Tuple[List[Any], Dict[Any, int], array, array, List[float]]] = None
+        # CSR görünümüne ait numpy dizileri: (csr, (indptr, indices, weights, int_weights))
+        self._csr_arrays: Optional[Tuple[tuple, Optional[tuple]]] = None
+        # Yönlü grafta gelen kenarların CSR'si: (csr, (in_ptr, in_indices))
+        self._reverse_csr: Optional[Tuple[tuple, Tuple[array, array]]] = None
+    
+    @property
+    def adjacency_list(self) -> Dict[Any, List[Tuple[Any, float]]]:
+        """Komşuluk listeleri; bekleyen kenarlar varsa önce işlenir"""
+        if self._pending_edges:
+            self._build_adjacency()
+        return self._adjacency
+    
+    def _build_adjacency(self) -> None:
+        """
+        Bekleyen kenarları komşuluk listelerine ekle - O(bekleyen kenar)
+        
+        Kenarlar eklenme sırasıyla işlenir; komşu sırası hemen eklenmiş
+        olsalardı oluşacak sırayla aynıdır.
+        """
+        adjacency = self._adjacency
+        reverse_adj = self._reverse_adj
+        directed = self.directed
+        
+        for u, v, weight in self._pending_edges:
+            adjacency[u].append((v, weight))
+            reverse_adj[v].add(u)
+            if not directed:
+                adjacency[v].append((u, weight))
+                reverse_adj[u].add(v)
+        
+        self._pending_edges = []
+    
+    def _build_csr(self) -> Tuple[List[Any], Dict[Any, int], array, array, List[float]]:
+        """
+        Komşuluk listesinden CSR görünümü kur - O(V + E)
+        
+        Düğümler 0..V-1 arası tamsayılarla numaralanır; i düğümünün komşuları
+        indices[indptr[i]:indptr[i + 1]], ağırlıkları weights'in aynı dilimidir.
+        Komşu sırası komşuluk listesiyle aynıdır. Ağırlıklar toplanan
+        mesafelerin türü korunsun diye (int/float) listede tutulur.
+        
+        Returns:
+            (ids, index, indptr, indices, weights)
+        """
+        ids = list(self.vertices)
+        index = {vertex: i for i, vertex in enumerate(ids)}
+        indptr = array('q', [0])
+        indices = array('q')
+        weights: List[float] = []
+        
+        for vertex in ids:
+            for neighbor, weight in self.adjacency_list[vertex]:
+                indices.append(index[neighbor])
+                weights.append(weight)
+            indptr.append(len(indices))
+        
+        self._csr = (ids, index, indptr, indices, weights)
+        return self._csr
+    
+    def _get_csr(self) -> Tuple[List[Any], Dict[Any, int], array, array, List[float]]:
+        """Geçerli CSR görünümü; gerekirse yeniden kur"""
+        return self._csr if self._csr is not None else self._build_csr()
+    
+    def _get_reverse_csr(self, csr: tuple) -> Tuple[array, array]:
+        """
+        Gelen kenarların CSR görünümü (in_ptr, in_indices) - O(V + E)
+        
+        Yönsüz grafta gelen ve giden kenarlar aynıdır, CSR'nin kendisi döner.
+        """
+        _, _, indptr, indices, _ = csr
+        if not self.directed:
+            return indptr, indices
+        
+        cached = self._reverse_csr
+        if cached is not None and cached[0] is csr:
+            return cached[1]
+        
+        n = len(indptr) - 1
+        in_ptr = array('q', [0]) * (n + 1)
+        for v in indices:
+            in_ptr[v + 1] += 1
+        for i in range(n):
+            in_ptr[i + 1] += in_ptr[i]
+        
+        in_indices = array('q', [0]) * len(indices)
+        position = in_ptr[:-1]
+        for u in range(n):
+            for j in range(indptr[u], indptr[u + 1]):
+                v = indices[j]
+                in_indices[position[v]] = u
+                position[v] += 1
+        
+        self._reverse_csr = (csr, (in_ptr, in_indices))
+        return in_ptr, in_indices
+    
+    def _get_csr_arrays(self, csr: tuple) -> Optional[tuple]:
+        """
+        Derlenmiş çekirdek için CSR'nin numpy dizileri
+        
+        indptr/indices kopyalanmadan sarılır. Ağırlıklar karışık türdeyse
+        (int ve float bir arada) None döner: saf Python yolu mesafe türlerini
+        düğüm bazında korur, float64 çekirdek koruyamaz.
+        """
+        cached = self._csr_arrays
+        if cached is not None and cached[0] is csr:
+            return cached[1]
+        
+        weights = csr[4]
+        kinds = set(map(type, weights))
+        if kinds <= {int}:
+            int_weights = True
+        elif kinds <= {float}:
+            int_weights = False
+        else:
+            int_weights = None
+        
+        arrays = None
+        if int_weights is not None:
+            arrays = (np.frombuffer(csr[2], dtype=np.int64),
+                      np.frombuffer(csr[3], dtype=np.int64),
+                      np.array(weights, dtype=np.float64),
+                      int_weights)
+        self._csr_arrays = (csr, arrays)
+        return arrays
     
     def add_vertex(self, vertex: Any, data: Any = None) -> None:
         """
@@ -53,9 +243,11 @@ class Graph:
             
         Zaman Karmaşıklığı: O(1)
         """
-        self.vertices.add(vertex)
-        if vertex not in self.adjacency_list:
-            self.adjacency_list[vertex] = []
+        if vertex not in self.vertices:
+            self.vertices.add(vertex)
+            self._csr = None
+        if vertex not in self._adjacency:
+            self._adjacency[vertex] = []
         if data is not None:
             self.vertex_data[vertex] = data
     
@@ -72,28 +264,36 @@ class Graph:
         """
         self.add_vertex(u)
         self.add_vertex(v)
+        self._csr = None
         
-        self.adjacency_list[u].append((v, weight))
-        
-        if not self.directed:
-            self.adjacency_list[v].append((u, weight))
+        # Komşuluk listelerine ilk erişimde işlenir (bkz. adjacency_list)
+        self._pending_edges.append((u, v, weight))
     
     def remove_vertex(self, vertex: Any) -> bool:
         """
         Düğümü ve bağlı kenarları kaldır
         
-        Zaman Karmaşıklığı: O(V + E)
+        Yalnızca düğüme kenarı olan düğümlerin listeleri süzülür; komşu
+        sırası korunur (BFS/DFS sırası ve eşit yollarda seçim buna bağlıdır).
+        
+        Zaman Karmaşıklığı: O(deg(v) + komşuların dereceleri toplamı)
         """
         if vertex not in self.vertices:
             return False
         
         # Düğümü kaldır
         self.vertices.remove(vertex)
-        del self.adjacency_list[vertex]
+        self._csr = None
         
-        # Diğer düğümlerden bu düğüme giden kenarları kaldır
-        for v in self.vertices:
-            self.adjacency_list[v] = [(n, w) for n, w in self.adjacency_list[v] if n != vertex]
+        # Düğümün gittiği komşuların ters kayıtlarını temizle
+        for neighbor, _ in self.adjacency_list.pop(vertex):
+            if neighbor != vertex:
+                self._reverse_adj[neighbor].discard(vertex)
+        
+        # Bu düğüme kenarı olan düğümlerden o kenarları kaldır
+        for u in self._reverse_adj.pop(vertex, ()):
+            if u != vertex:
+                self.adjacency_list[u] = [(n, w) for n, w in self.adjacency_list[u] if n != vertex]
         
         if vertex in self.vertex_data:
             del self.vertex_data[vertex]
@@ -104,16 +304,19 @@ class Graph:
         """
         Kenarı kaldır
         
-        Zaman Karmaşıklığı: O(E)
+        Zaman Karmaşıklığı: O(deg(u) + deg(v))
         """
         if u not in self.vertices or v not in self.vertices:
             return False
         
+        self._csr = None
         original_len = len(self.adjacency_list[u])
         self.adjacency_list[u] = [(n, w) for n, w in self.adjacency_list[u] if n != v]
+        self._reverse_adj[v].discard(u)
         
         if not self.directed:
             self.adjacency_list[v] = [(n, w) for n, w in self.adjacency_list[v] if n != u]
+            self._reverse_adj[u].discard(v)
         
         return len(self.adjacency_list[u]) < original_len
     
@@ -141,9 +344,11 @@ class Graph:
         return len(self.vertices)
     
     def edge_count(self) -> int:
-        """Kenar sayısı"""
-        total = sum(len(neighbors) for neighbors in self.adjacency_list.values())
-        return total if self.directed else total // 2
+        """Kenar sayısı (bekleyen kenarlar listeler doldurulmadan sayılır)"""
+        total = sum(len(neighbors) for neighbors in self._adjacency.values())
+        if self.directed:
+            return total + len(self._pending_edges)
+        return total // 2 + len(self._pending_edges)
     
     # ==================== BFS (Breadth-First Search) ====================
     
@@ -157,28 +362,112 @@ class Graph:
         Returns:
             Ziyaret sırasına göre düğüm listesi
             
+        CSR görünümü üzerinde tamsayı kimliklerle çalışır; düğüm kuyruğa
+        eklenirken işaretlenir, böylece kuyrukta tekrar bulunmaz.
+            
         Zaman Karmaşıklığı: O(V + E)
         Uzay Karmaşıklığı: O(V)
         """
         if start not in self.vertices:
             return []
         
-        visited = set()
-        queue = [start]
-        result = []
+        ids, index, indptr, indices, _ = self._get_csr()
+        visited = bytearray(len(ids))
+        return [ids[u] for u in self._bfs_ids(index[start], visited, indptr, indices)]
+    
+    @staticmethod
+    def _bfs_ids(source: int, visited: bytearray, indptr: array, indices: array) -> List[int]:
+        """
+        CSR üzerinde tamsayı kimliklerle BFS
+        
+        visited düğüm başına bir baytlık işaret dizisidir ve çağıranla
+        paylaşılır; birden çok kaynaktan yapılan gezintilerde (bağlı
+        bileşenler) her seferinde yeniden ayrılmaz.
+        """
+        visited[source] = 1
+        queue = deque([source])
+        order = []
         
         while queue:
-            vertex = queue.pop(0)  # FIFO
+            u = queue.popleft()  # FIFO, O(1)
+            order.append(u)
             
-            if vertex not in visited:
-                visited.add(vertex)
-                result.append(vertex)
-                
-                for neighbor, _ in self.adjacency_list[vertex]:
-                    if neighbor not in visited:
-                        queue.append(neighbor)
+            for j in range(indptr[u], indptr[u + 1]):
+                v = indices[j]
+                if not visited[v]:
+                    visited[v] = 1
+                    queue.append(v)
         
-        return result
+        return order
+    
+    def bfs_levels(self, start: Any) -> Dict[Any, int]:
+        """
+        Erişilebilir her düğümün başlangıca kenar sayısı cinsinden uzaklığı
+        
+        Yön değiştiren (direction-optimizing) düzey düzey BFS: sınır küçükken
+        sınırdaki düğümlerin giden kenarları taranır (yukarıdan aşağıya);
+        sınır büyüdüğünde her ziyaret edilmemiş düğüm gelen kenarlarında
+        sınırdan bir komşu arar ve ilkinde durur (aşağıdan yukarıya). Orta
+        düzeylerde kenarların çoğu zaten ziyaret edilmiş düğümlere gittiği
+        için incelenen kenar sayısı belirgin düşer. Düzey içi sıra
+        tanımsız olduğundan ziyaret sırası değil uzaklıklar döndürülür.
+        
+        Args:
+            start: Başlangıç düğümü
+            
+        Returns:
+            {düğüm: uzaklık} - başlangıç 0, erişilemeyenler yok
+            
+        Zaman Karmaşıklığı: O(V + E), her aşağıdan yukarıya düzey O(V) ek tarama
+        """
+        if start not in self.vertices:
+            return {}
+        
+        csr = self._get_csr()
+        ids, index, indptr, indices, _ = csr
+        in_ptr, in_indices = self._get_reverse_csr(csr)
+        n = len(ids)
+        alpha, beta = self.BFS_ALPHA, self.BFS_BETA
+        
+        level = [-1] * n
+        source = index[start]
+        level[source] = 0
+        frontier = [source]
+        unvisited = n - 1
+        depth = 0
+        bottom_up = False
+        
+        while frontier:
+            depth += 1
+            if bottom_up:
+                bottom_up = len(frontier) * beta >= n
+            else:
+                bottom_up = len(frontier) * alpha > unvisited
+            
+            next_frontier = []
+            if bottom_up:
+                in_frontier = bytearray(n)
+                for u in frontier:
+                    in_frontier[u] = 1
+                for v in range(n):
+                    if level[v] < 0:
+                        for j in range(in_ptr[v], in_ptr[v + 1]):
+                            if in_frontier[in_indices[j]]:
+                                level[v] = depth
+                                next_frontier.append(v)
+                                break
+            else:
+                for u in frontier:
+                    for j in range(indptr[u], indptr[u + 1]):
+                        v = indices[j]
+                        if level[v] < 0:
+                            level[v] = depth
+                            next_frontier.append(v)
+            
+            unvisited -= len(next_frontier)
+            frontier = next_frontier
+        
+        return {ids[v]: d for v, d in enumerate(level) if d >= 0}
     
     def bfs_shortest_path(self, start: Any, end: Any) -> Tuple[List[Any], int]:
         """
@@ -191,6 +480,10 @@ class Graph:
         Returns:
             (yol, mesafe) tuple - yol bulunamazsa ([], -1)
             
+        Kuyrukta yol kopyaları tutulmaz; CSR görünümü üzerinde her düğümün
+        ebeveyni tamsayı listesinde saklanır ve yol hedef bulunduğunda bir
+        kez geri izlenir.
+            
         Zaman Karmaşıklığı: O(V + E)
         """
         if start not in self.vertices or end not in self.vertices:
@@ -199,21 +492,33 @@ class Graph:
         if start == end:
             return [start], 0
         
-        visited = {start}
-        queue = [(start, [start])]
+        ids, index, indptr, indices, _ = self._get_csr()
+        source = index[start]
+        target = index[end]
+        
+        # Ebeveyn listesi aynı zamanda ziyaret işaretidir (-1: ziyaret edilmedi)
+        parents = [-1] * len(ids)
+        parents[source] = source
+        queue = deque([source])
         
         while queue:
-            vertex, path = queue.pop(0)
+            u = queue.popleft()
             
-            for neighbor, _ in self.adjacency_list[vertex]:
-                if neighbor not in visited:
-                    new_path = path + [neighbor]
+            for j in range(indptr[u], indptr[u + 1]):
+                v = indices[j]
+                if parents[v] < 0:
+                    parents[v] = u
                     
-                    if neighbor == end:
-                        return new_path, len(new_path) - 1
+                    if v == target:
+                        path = [end]
+                        while u != source:
+                            path.append(ids[u])
+                            u = parents[u]
+                        path.append(start)
+                        path.reverse()
+                        return path, len(path) - 1
                     
-                    visited.add(neighbor)
-                    queue.append((neighbor, new_path))
+                    queue.append(v)
         
         return [], -1
     
@@ -229,23 +534,30 @@ class Graph:
         Returns:
             Ziyaret sırasına göre düğüm listesi
             
+        Özyineleme yerine (düğüm komşu iteratörü) yığını kullanılır; ziyaret
+        sırası özyinelemeli DFS ile aynıdır, derinlik sınırı yoktur.
+            
         Zaman Karmaşıklığı: O(V + E)
         """
         if start not in self.vertices:
             return []
         
-        visited = set()
-        result = []
+        adjacency = self.adjacency_list
+        visited = {start}
+        result = [start]
+        stack = [iter(adjacency[start])]
         
-        def _dfs(vertex: Any):
-            visited.add(vertex)
-            result.append(vertex)
-            
-            for neighbor, _ in self.adjacency_list[vertex]:
+        while stack:
+            for neighbor, _ in stack[-1]:
                 if neighbor not in visited:
-                    _dfs(neighbor)
+                    visited.add(neighbor)
+                    result.append(neighbor)
+                    stack.append(iter(adjacency[neighbor]))
+                    break
+            else:
+                # Komşular bitti: bir üst düğüme dön
+                stack.pop()
         
-        _dfs(start)
         return result
     
     def dfs_iterative(self, start: Any) -> List[Any]:
@@ -286,50 +598,83 @@ class Graph:
             - distances: Her düğüme olan en kısa mesafe
             - predecessors: En kısa yoldaki önceki düğüm
             
+        CSR görünümü üzerinde tamsayı kimliklerle çalışır. Yığın öğesi
+        (mesafe, sıra, düğüm) olduğundan eşit mesafelerde PriorityQueue gibi
+        ekleme sırası (FIFO) geçerlidir.
+        
         Zaman Karmaşıklığı: O((V + E) log V) - binary heap ile
         Uzay Karmaşıklığı: O(V)
         """
         if start not in self.vertices:
             return {}, {}
         
-        # Mesafeler (başlangıçta sonsuz)
-        distances = {v: float('inf') for v in self.vertices}
-        distances[start] = 0
-        
-        # Yol izleme için önceki düğümler
-        predecessors = {v: None for v in self.vertices}
-        
-        # Min-heap: (mesafe, düğüm)
-        pq = PriorityQueue(min_priority=True)
-        pq.enqueue(start, 0)
-        
-        visited = set()
-        
-        while pq:
-            current, current_dist = pq.dequeue()
+        csr = self._get_csr()
+        ids, index, indptr, indices, weights = csr
+        n = len(ids)
+        source = index[start]
+        # Hedefe ulaşınca erken dur (hedef yoksa -1, hiç eşleşmez)
+        target = index.get(end, -1) if end else -1
+        
+        if _dijkstra_numba is not None and n >= self.NUMBA_MIN_VERTICES:
+            arrays = self._get_csr_arrays(csr)
+            if arrays is not None:
+                return self._dijkstra_compiled(ids, arrays, source, target)
+        
+        # Mesafeler (başlangıçta sonsuz) ve yol izleme için önceki düğümler
+        dist: List[float] = [float('inf')] * n
+        dist[source] = 0
+        pred = [-1] * n
+        done = bytearray(n)
+        
+        # Min-heap: (mesafe, ekleme sırası, düğüm)
+        heap = [(0, 0, source)]
+        counter = 1
+        
+        while heap:
+            current_dist, _, u = heappop(heap)
             
             # Zaten işlendiyse atla
-            if current in visited:
+            if done[u]:
                 continue
-            
-            visited.add(current)
+            done[u] = 1
             
             # Hedefe ulaştıysak dur
-            if end and current == end:
+            if u == target:
                 break
             
             # Komşuları kontrol et
-            for neighbor, weight in self.adjacency_list[current]:
-                if neighbor in visited:
+            for j in range(indptr[u], indptr[u + 1]):
+                v = indices[j]
+                if done[v]:
                     continue
                 
-                new_dist = current_dist + weight
-                
-                if new_dist < distances[neighbor]:
-                    distances[neighbor] = new_dist
-                    predecessors[neighbor] = current
-                    pq.enqueue(neighbor, new_dist)
-        
+                new_dist = current_dist + weights[j]
+                if new_dist < dist[v]:
+                    dist[v] = new_dist
+                    pred[v] = u
+                    heappush(heap, (new_dist, counter, v))
+                    counter += 1
+        
+        distances = dict(zip(ids, dist))
+        predecessors = {vertex: (ids[p] if p >= 0 else None) for vertex, p in zip(ids, pred)}
+        return distances, predecessors
+    
+    def _dijkstra_compiled(self, ids: List[Any], arrays: tuple, source: int,
+                           target: int) -> Tuple[Dict[Any, float], Dict[Any, Any]]:
+        """numba çekirdeğini çalıştır, sonuçları saf Python yolunun türlerine çevir"""
+        indptr, indices, weights, int_weights = arrays
+        dist_array, pred_array = _dijkstra_numba(indptr, indices, weights, source, target)
+        
+        inf = float('inf')
+        dist = dist_array.tolist()
+        if int_weights:
+            dist = [d if d == inf else int(d) for d in dist]
+        # Başlangıç mesafesi saf Python yolunda olduğu gibi int 0
+        dist[source] = 0
+        
+        distances = dict(zip(ids, dist))
+        predecessors = {vertex: (ids[p] if p >= 0 else None)
+                        for vertex, p in zip(ids, pred_array.tolist())}
         return distances, predecessors
     
     def dijkstra_path(self, start: Any, end: Any) -> Tuple[List[Any], float]:
@@ -379,48 +724,58 @@ class Graph:
         if start not in self.vertices or end not in self.vertices:
             return [], float('inf')
         
-        # g(n): başlangıçtan n'e gerçek maliyet
-        g_score = {v: float('inf') for v in self.vertices}
-        g_score[start] = 0
+        ids, index, indptr, indices, weights = self._get_csr()
+        n = len(ids)
+        source = index[start]
+        target = index[end]
         
-        # f(n) = g(n) + h(n): toplam tahmini maliyet
-        f_score = {v: float('inf') for v in self.vertices}
-        f_score[start] = heuristic(start, end)
+        # g(n): başlangıçtan n'e gerçek maliyet
+        g_score: List[float] = [float('inf')] * n
+        g_score[source] = 0
         
         # Yol izleme
-        predecessors = {}
+        pred = [-1] * n
         
-        # Open set: (f_score, düğüm)
-        open_set = PriorityQueue(min_priority=True)
-        open_set.enqueue(start, f_score[start])
+        # h(n) düğüm başına bir kez hesaplanır; düğüm açık kümeye tekrar
+        # girdiğinde önbellekten okunur
+        h_cache: List[Optional[float]] = [None] * n
+        h_cache[source] = heuristic(start, end)
         
-        in_open_set = {start}
+        # Open set: (f_score, ekleme sırası, düğüm); f(n) = g(n) + h(n)
+        open_set = [(h_cache[source], 0, source)]
+        counter = 1
+        in_open_set = bytearray(n)
+        in_open_set[source] = 1
         
         while open_set:
-            current, _ = open_set.dequeue()
-            in_open_set.discard(current)
+            _, _, u = heappop(open_set)
+            in_open_set[u] = 0
             
-            if current == end:
+            if u == target:
                 # Yolu oluştur
                 path = []
-                while current in predecessors:
-                    path.append(current)
-                    current = predecessors[current]
+                while pred[u] >= 0:
+                    path.append(ids[u])
+                    u = pred[u]
                 path.append(start)
                 path.reverse()
-                return path, g_score[end]
+                return path, g_score[target]
             
-            for neighbor, weight in self.adjacency_list[current]:
-                tentative_g = g_score[current] + weight
+            for j in range(indptr[u], indptr[u + 1]):
+                v = indices[j]
+                tentative_g = g_score[u] + weights[j]
                 
-                if tentative_g < g_score[neighbor]:
-                    predecessors[neighbor] = current
-                    g_score[neighbor] = tentative_g
-                    f_score[neighbor] = tentative_g + heuristic(neighbor, end)
+                if tentative_g < g_score[v]:
+                    pred[v] = u
+                    g_score[v] = tentative_g
                     
-                    if neighbor not in in_open_set:
-                        open_set.enqueue(neighbor, f_score[neighbor])
-                        in_open_set.add(neighbor)
+                    if not in_open_set[v]:
+                        h = h_cache[v]
+                        if h is None:
+                            h = h_cache[v] = heuristic(ids[v], end)
+                        heappush(open_set, (tentative_g + h, counter, v))
+                        counter += 1
+                        in_open_set[v] = 1
         
         return [], float('inf')
     
@@ -432,48 +787,77 @@ class Graph:
             return True
         
         start = next(iter(self.vertices))
-        visited = set(self.bfs(start))
-        
-        return len(visited) == len(self.vertices)
+        # BFS her düğümü bir kez döndürür; küme kurmaya gerek yok
+        return len(self.bfs(start)) == len(self.vertices)
     
     def find_connected_components(self) -> List[Set[Any]]:
-        """Bağlı bileşenleri bul"""
-        visited = set()
+        """
+        Bağlı bileşenleri bul
+        
+        Yönsüz grafta bileşenler ayrıktır; tüm gezintiler tek bir ziyaret
+        dizisini paylaşır ve toplam iş O(V + E)'dir. Yönlü grafta bir
+        düğümün bileşeni ondan erişilebilen tüm düğümlerdir (önceki
+        bileşenlerle örtüşebilir); her gezinti kendi dizisini kullanır.
+        """
+        ids, _, indptr, indices, _ = self._get_csr()
+        n = len(ids)
+        seen = bytearray(n)
         components = []
         
-        for vertex in self.vertices:
-            if vertex not in visited:
-                component = set(self.bfs(vertex))
-                visited.update(component)
-                components.append(component)
+        # ids self.vertices ile aynı sırada kurulur; bileşen sırası değişmez
+        for source in range(n):
+            if seen[source]:
+                continue
+            
+            if self.directed:
+                visited = bytearray(n)
+                order = self._bfs_ids(source, visited, indptr, indices)
+                for u in order:
+                    seen[u] = 1
+            else:
+                order = self._bfs_ids(source, seen, indptr, indices)
+            components.append({ids[u] for u in order})
         
         return components
     
     def has_cycle(self) -> bool:
-        """Graf döngü içeriyor mu?"""
+        """
+        Graf döngü içeriyor mu?
+        
+        Özyinelemesiz DFS: yığın öğesi (düğüm, ebeveyn, komşu iteratörü)
+        çağrı yığınının yerini tutar. Yönlü grafta o an yığında olan bir
+        düğüme (rec_stack) dönen kenar, yönsüz grafta ebeveyn dışındaki
+        ziyaret edilmiş bir komşu döngü demektir.
+        """
+        adjacency = self.adjacency_list
+        directed = self.directed
         visited = set()
         rec_stack = set()
         
-        def _has_cycle(v: Any, parent: Any = None) -> bool:
-            visited.add(v)
-            rec_stack.add(v)
+        for root in self.vertices:
+            if root in visited:
+                continue
             
-            for neighbor, _ in self.adjacency_list[v]:
-                if neighbor not in visited:
-                    if _has_cycle(neighbor, v):
-                        return True
-                elif self.directed and neighbor in rec_stack:
-                    return True
-                elif not self.directed and neighbor != parent:
-                    return True
+            visited.add(root)
+            rec_stack.add(root)
+            stack = [(root, None, iter(adjacency[root]))]
             
-            rec_stack.remove(v)
-            return False
-        
-        for vertex in self.vertices:
-            if vertex not in visited:
-                if _has_cycle(vertex):
-                    return True
+            while stack:
+                v, parent, neighbors = stack[-1]
+                for neighbor, _ in neighbors:
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        rec_stack.add(neighbor)
+                        stack.append((neighbor, v, iter(adjacency[neighbor])))
+                        break
+                    if directed:
+                        if neighbor in rec_stack:
+                            return True
+                    elif neighbor != parent:
+                        return True
+                else:
+                    rec_stack.remove(v)
+                    stack.pop()
         
         return False
     
@@ -493,11 +877,11 @@ class Graph:
             for neighbor, _ in self.adjacency_list[v]:
                 in_degree[neighbor] += 1
         
-        queue = [v for v in self.vertices if in_degree[v] == 0]
+        queue = deque(v for v in self.vertices if in_degree[v] == 0)
         result = []
         
         while queue:
-            vertex = queue.pop(0)
+            vertex = queue.popleft()
             result.append(vertex)
             
             for neighbor, _ in self.adjacency_list[vertex]:
@@ -533,7 +917,22 @@ class Graph:
 # 2D koordinatlar için A* heuristic fonksiyonları
 def euclidean_distance(pos1: Tuple[float, float], pos2: Tuple[float, float]) -> float:
     """Öklid mesafesi (kuş uçuşu)"""
-    return math.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
+    dx = pos1[0] - pos2[0]
+    dy = pos1[1] - pos2[1]
+    return math.sqrt(dx * dx + dy * dy)
+
+
+def euclidean_distance_sq(pos1: Tuple[float, float], pos2: Tuple[float, float]) -> float:
+    """
+    Öklid mesafesinin karesi (karekök alınmaz)
+    
+    Sıralama euclidean_distance ile aynıdır; yalnızca mesafeleri
+    karşılaştırmak yeterliyse kullanılmalıdır. Kenar ağırlıklarıyla
+    toplandığında kabul edilebilir (admissible) bir A* sezgiseli değildir.
+    """
+    dx = pos1[0] - pos2[0]
+    dy = pos1[1] - pos2[1]
+    return dx * dx + dy * dy
 
 
 def manhattan_distance(pos1: Tuple[float, float], pos2: Tuple[float, float]) -> float:
@@ -222,6 +222,58 @@ class MinHeap:
         return f"MinHeap({self.heap})"
 
 
+class FourAryHeap(MinHeap):
+    """
+    4'lü (4-ary) Min-Heap - her düğümün en fazla 4 çocuğu vardır
+    
+    Yükseklik log₄ n olduğundan sift-down daha az düzey iner ve daha az
+    takas yapar; ekleme/çıkarma yoğun öncelik kuyruklarında ikili heap'ten
+    hızlıdır. Arayüz MinHeap ile aynıdır.
+    """
+    
+    def _parent(self, i: int) -> int:
+        """Ebeveyn indeksini döndür"""
+        return (i - 1) >> 2
+    
+    def _sift_down(self, i: int) -> None:
+        """
+        Elemanı en küçük çocukla yer değiştirerek aşağı taşı
+        
+        Zaman Karmaşıklığı: O(log₄ n) düzey, düzey başına en fazla 4 karşılaştırma
+        """
+        heap = self.heap
+        key = self.key_func
+        size = len(heap)
+        item_key = key(heap[i])
+        
+        while True:
+            first = (i << 2) + 1
+            if first >= size:
+                break
+            
+            smallest = first
+            smallest_key = key(heap[first])
+            for child in range(first + 1, min(first + 4, size)):
+                child_key = key(heap[child])
+                if child_key < smallest_key:
+                    smallest, smallest_key = child, child_key
+            
+            if not smallest_key < item_key:
+                break
+            heap[i], heap[smallest] = heap[smallest], heap[i]
+            i = smallest
+    
+    def heapify(self, items: List[Any]) -> None:
+        """Listeyi 4'lü heap'e dönüştür - O(n)"""
+        self.heap = list(items)
+        # Son iç düğüm (n - 2) // 4
+        for i in range((len(self.heap) - 2) >> 2, -1, -1):
+            self._sift_down(i)
+    
+    def __repr__(self):
+        return f"FourAryHeap({self.heap})"
+
+
 class MaxHeap(MinHeap):
     """
     Max-Heap - En büyük eleman her zaman kökte
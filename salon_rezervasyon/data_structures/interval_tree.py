@@ -13,7 +13,7 @@ Zaman Karmaşıklığı:
 Uzay Karmaşıklığı: O(n)
 """
 
-from typing import Any, Optional, List, Tuple
+from typing import Any, Optional, List, Sequence, Tuple
 from datetime import datetime, timedelta
 
 
@@ -188,6 +188,40 @@ class IntervalTree:
         self.size += 1
         return True
     
+    def bulk_load(self, intervals: Sequence[Interval]) -> None:
+        """
+        Başlangıca göre sıralı aralıklardan ağacı kur
+        
+        Boş ağaçta ortadaki aralık kök seçilerek dengeli ağaç tek geçişte
+        kurulur; ağaç boş değilse aralıklar tek tek eklenir. Aynı başlangıçlı
+        aralıklar insert'teki gibi sağ alt ağaçta kalır.
+        
+        Args:
+            intervals: (start, end) sırasına göre artan aralıklar
+            
+        Zaman Karmaşıklığı: O(n) (boş ağaçta)
+        """
+        if self.root is not None:
+            for interval in intervals:
+                self.insert(interval)
+            return
+        
+        def _build(lo: int, hi: int) -> Optional[IntervalNode]:
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            start = intervals[mid].start
+            while mid > lo and intervals[mid - 1].start == start:
+                mid -= 1
+            node = IntervalNode(intervals[mid])
+            node.left = _build(lo, mid)
+            node.right = _build(mid + 1, hi)
+            self._update_height_and_max(node)
+            return node
+        
+        self.root = _build(0, len(intervals))
+        self.size = len(intervals)
+    
     def find_overlapping(self, query: Interval) -> List[Interval]:
         """
         Verilen aralık ile çakışan tüm aralıkları bul
@@ -196,34 +230,32 @@ class IntervalTree:
             query: Sorgulanacak aralık
             
         Returns:
-            Çakışan aralıkların listesi
+            Çakışan aralıkların listesi (başlangıç zamanına göre sıralı)
             
         Zaman Karmaşıklığı: O(log n + k) - k: çakışan aralık sayısı
         """
         result = []
+        q_start, q_end = query.start, query.end
+        
+        # Budamalı, yığın tabanlı in-order gezinti (sonuçlar başlangıca göre sıralı)
+        stack = []
+        node = self.root
+        while stack or node:
+            # max_end <= q_start olan alt ağaçlarda çakışan aralık olamaz
+            while node is not None and node.max_end > q_start:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                break
+            
+            node = stack.pop()
+            interval = node.interval
+            if interval.start < q_end and q_start < interval.end:
+                result.append(interval)
+            
+            # Sağ alt ağaç sadece başlangıç sorgu bitişinden önceyse gerekli
+            node = node.right if interval.start < q_end else None
         
-        def _search(node: Optional[IntervalNode]):
-            if not node:
-                return
-            
-            # Eğer bu düğümün max_end değeri query'nin başlangıcından küçükse,
-            # bu alt ağaçta çakışan aralık olamaz
-            if node.max_end <= query.start:
-                return
-            
-            # Sol alt ağacı kontrol et
-            if node.left:
-                _search(node.left)
-            
-            # Mevcut düğümü kontrol et
-            if node.interval.overlaps(query):
-                result.append(node.interval)
-            
-            # Sağ alt ağacı kontrol et (sadece gerekiyorsa)
-            if node.interval.start < query.end:
-                _search(node.right)
-        
-        _search(self.root)
         return result
     
     def has_overlap(self, query: Interval) -> bool:
@@ -396,6 +396,7 @@ class WaitingList:
         """
         self._list: LinkedList[WaitingEntry] = LinkedList()
         self._entry_nodes: dict = {}  # customer_id -> ListNode mapping
+        self._priority_tails: dict = {}  # priority -> o önceliğin son ListNode'u
         self._on_available = on_available
         self._served_count = 0
     
@@ -403,27 +404,40 @@ class WaitingList:
         """
         Bekleme listesine ekle (önceliğe göre)
         
-        Zaman Karmaşıklığı: O(n) - öncelik sıralaması için
+        Her öncelik grubunun son düğümü tutulduğu için liste taranmaz;
+        yeni giriş, önceliği kendisininkinden büyük olmayan son grubun arkasına eklenir.
+        
+        Zaman Karmaşıklığı: O(p) - p: farklı öncelik sayısı (pratikte O(1))
         """
         if entry.customer_id in self._entry_nodes:
             return False  # Zaten listede
         
-        # Önceliğe göre doğru pozisyonu bul
-        current = self._list._head
+        anchor = None
+        anchor_priority = None
+        for priority, tail in self._priority_tails.items():
+            if priority <= entry.priority and (anchor_priority is None or priority > anchor_priority):
+                anchor, anchor_priority = tail, priority
         
-        while current:
-            if current.data.priority > entry.priority:
-                # Bu düğümden önce ekle
-                node = self._list.insert_before(current, entry)
-                self._entry_nodes[entry.customer_id] = node
-                return True
-            current = current.next
-        
-        # Sona ekle
-        node = self._list.append(entry)
+        # anchor yoksa tüm bekleyenler daha düşük öncelikli: başa eklenir
+        node = self._list.insert_after(anchor, entry)
         self._entry_nodes[entry.customer_id] = node
+        self._priority_tails[entry.priority] = node
         return True
     
+    def _unlink(self, node: ListNode[WaitingEntry]) -> WaitingEntry:
+        """Düğümü listeden çıkar, öncelik grubunun son düğümünü güncelle"""
+        priority = node.data.priority
+        if self._priority_tails.get(priority) is node:
+            prev = node.prev
+            if prev is not None and prev.data.priority == priority:
+                self._priority_tails[priority] = prev
+            else:
+                del self._priority_tails[priority]
+        
+        entry = self._list.remove_node(node)
+        del self._entry_nodes[entry.customer_id]
+        return entry
+    
     def remove(self, customer_id: str) -> Optional[WaitingEntry]:
         """
         Müşteriyi listeden çıkar
@@ -433,11 +447,7 @@ class WaitingList:
         if customer_id not in self._entry_nodes:
             return None
         
-        node = self._entry_nodes[customer_id]
-        entry = self._list.remove_node(node)
-        del self._entry_nodes[customer_id]
-        
-        return entry
+        return self._unlink(self._entry_nodes[customer_id])
     
     def get_next(self) -> Optional[WaitingEntry]:
         """
@@ -456,10 +466,8 @@ class WaitingList:
         if self._list.is_empty():
             return None
         
-        entry = self._list.remove_first()
-        if entry:
-            del self._entry_nodes[entry.customer_id]
-            self._served_count += 1
+        entry = self._unlink(self._list._head)
+        self._served_count += 1
         
         return entry
     
@@ -63,6 +63,7 @@ Kullanım:
     python main.py --test       # Testleri çalıştır
     python main.py --benchmark  # Performans testi
     python main.py --demo       # Demo verileriyle çalıştır
+    python main.py --quiet      # Sessiz mod (betik/otomasyon için)
 """
 
 import sys
@@ -86,8 +87,8 @@ from performance_analysis import PerformanceAnalyzer
 
 # Veri yapıları
 from data_structures import (
-    AVLTree, IntervalTree,
-    MinHeap, MaxHeap, PriorityQueue,
+    AVLTree, AVLTreeSoA, IntervalTree,
+    MinHeap, MaxHeap, FourAryHeap, PriorityQueue,
     Graph,
     Stack, Queue, CircularQueue, Deque, UndoRedoManager,
     LinkedList, WaitingList,
@@ -119,14 +120,35 @@ def run_tests():
         assert tree.get_min() == 10, "Min deger hatali"
         assert tree.get_max() == 90, "Max deger hatali"
         
-        tree.delete(25)
+        assert tree.delete(25), "25 silme basarisiz"
         assert tree.search(25) is None, "25 silme basarisiz"
+        assert not tree.delete(25) and len(tree) == 6, "Olmayan anahtar silme hatali"
+        assert not tree.insert(50) and len(tree) == 6, "Tekrar ekleme boyutu degistirdi"
         
         range_result = tree.range_query(30, 75)
         keys = [k for k, v in range_result]
         assert 50 in keys and 60 in keys, f"Range query hatali: {range_result}"
         
-        print("  ✓ Insert, Search, Delete, Range Query - BAŞARILI")
+        bulk = AVLTree()
+        bulk.bulk_load([(x, x) for x in range(100)])
+        assert bulk.is_balanced() and len(bulk) == 100, "Toplu yükleme dengesiz"
+        assert bulk.search(42) == 42, "Toplu yükleme arama hatali"
+        
+        # Sıralı büyük ekleme: gezinti ve denge kontrolü özyinelemesiz olmalı
+        sequential = AVLTree()
+        for x in range(100000):
+            sequential.insert(x)
+        assert sequential.is_balanced(), "Sirali ekleme dengesiz"
+        assert len(sequential.inorder_traversal()) == 100000, "Sirali gezinti eksik"
+        
+        soa = AVLTreeSoA()
+        for x in data:
+            soa.insert(x)
+        soa.delete(25)
+        assert soa.is_balanced() and len(soa) == len(data) - 1, "AVLTreeSoA dengesiz"
+        assert [k for k, v in soa.range_query(30, 75)] == keys, "AVLTreeSoA aralik hatali"
+        
+        print("  ✓ Insert, Search, Delete, Range Query, Bulk Load, AVLTreeSoA - BAŞARILI")
     except Exception as e:
         print(f"  ✗ HATA: {e}")
         all_passed = False
@@ -180,7 +202,11 @@ def run_tests():
         item, priority = pq.dequeue()
         assert item == "high", f"PriorityQueue dequeue hatali: {item}"
         
-        print("  ✓ MinHeap, MaxHeap, PriorityQueue - BAŞARILI")
+        # 4'lü heap
+        four_ary = FourAryHeap([7, 3, 9, 1, 5, 8, 2, 6, 4])
+        assert four_ary.get_sorted() == list(range(1, 10)), "FourAryHeap sıralama hatalı"
+        
+        print("  ✓ MinHeap, MaxHeap, FourAryHeap, PriorityQueue - BAŞARILI")
     except Exception as e:
         print(f"  ✗ HATA: {e}")
         all_passed = False
@@ -200,6 +226,7 @@ def run_tests():
         # BFS
         bfs_result = graph.bfs('A')
         assert 'A' in bfs_result and 'E' in bfs_result, "BFS hatalı"
+        assert graph.bfs_levels('A') == {'A': 0, 'B': 1, 'C': 1, 'D': 2, 'E': 3}, "BFS düzeyleri hatalı"
         
         # DFS
         dfs_result = graph.dfs('A')
@@ -397,10 +424,47 @@ def run_tests():
         
         assert len(system2.get_all_rooms()) > 0, "Yükleme hatalı"
         
+        # Artımlı kayıt: değişiklik günlüğe yazılır, yüklemede uygulanır
+        res_id = next(iter(system2._reservations))
+        system2.cancel_reservation(res_id)
+        assert dm.save_system_state(system2), "Artımlı kaydetme hatalı"
+        assert dm.wal_file.exists(), "Değişiklik günlüğü yazılmadı"
+        
+        system3 = ReservationSystem()
+        DataManager(temp_dir).load_system_state(system3)
+        assert system3.get_reservation(res_id).status == ReservationStatus.CANCELLED, "Günlük uygulanmadı"
+        
+        # Başarısız kayıt: değişiklikler kaybolmaz, sonraki kayıt tam anlık görüntüdür
+        fail_dir = tempfile.mkdtemp()
+        fail_dm = DataManager(fail_dir)
+        fail_system = ReservationSystem()
+        fail_system.add_room(Room("F1", "Salon F1", 10, RoomType.MEETING))
+        save_rooms = fail_dm.save_rooms
+        fail_dm.save_rooms = lambda *args, **kwargs: False
+        assert not fail_dm.save_system_state(fail_system), "Başarısız kayıt başarılı döndü"
+        fail_dm.save_rooms = save_rooms
+        assert fail_system.dirty_count == 1, "Kaydedilemeyen değişiklik kayboldu"
+        fail_system.add_room(Room("F2", "Salon F2", 10, RoomType.MEETING))
+        assert fail_dm.save_system_state(fail_system), "Tekrar kaydetme hatalı"
+        fail_loaded = ReservationSystem()
+        DataManager(fail_dir).load_system_state(fail_loaded)
+        assert sorted(r.id for r in fail_loaded.get_all_rooms()) == ["F1", "F2"], "Başarısız kayıttan sonra veri kayboldu"
+        shutil.rmtree(fail_dir)
+        
+        # Dolu sisteme yükleme: önceden eklenen kayıtlar sonraki kayıtta yazılır
+        merged = ReservationSystem()
+        merged.add_room(Room("M1", "Salon M1", 10, RoomType.MEETING))
+        merged_dm = DataManager(temp_dir)
+        merged_dm.load_system_state(merged)
+        assert merged_dm.save_system_state(merged), "Birleşik kaydetme hatalı"
+        merged_loaded = ReservationSystem()
+        DataManager(temp_dir).load_system_state(merged_loaded)
+        assert merged_loaded.get_room("M1") is not None, "Yükleme öncesi eklenen salon kaydedilmedi"
+        
         # Temizle
         shutil.rmtree(temp_dir)
         
-        print("  ✓ Save, Load, Sample Data - BAŞARILI")
+        print("  ✓ Save, Load, WAL, Sample Data - BAŞARILI")
     except Exception as e:
         print(f"  ✗ HATA: {e}")
         all_passed = False
@@ -416,7 +480,7 @@ def run_tests():
     return all_passed
 
 
-def run_demo():
+def run_demo(quiet: bool = False, no_color: bool = False):
     """Demo verileriyle çalıştır"""
     print("\n" + "=" * 60)
     print(" DEMO MOD")
@@ -435,7 +499,7 @@ def run_demo():
     print(f"  - Rezervasyonlar: {stats['total_reservations']}")
     
     # CLI başlat
-    cli = CLI(system, data_manager)
+    cli = CLI(system, data_manager, quiet=quiet, no_color=no_color)
     cli.run()
 
 
@@ -456,6 +520,7 @@ def main():
   python main.py --test       # Testleri çalıştır
   python main.py --benchmark  # Performans testi
   python main.py --demo       # Demo verileriyle başlat
+  python main.py --quiet      # Sessiz mod (betik/otomasyon için)
         """
     )
     
@@ -467,6 +532,8 @@ def main():
                        help='Demo verileriyle başlat')
     parser.add_argument('--no-color', action='store_true',
                        help='Renksiz çıktı')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                       help='Sessiz mod (renk, mesaj ve çıkış onayı yok)')
     
     args = parser.parse_args()
     
@@ -476,7 +543,7 @@ def main():
     elif args.benchmark:
         run_benchmark()
     elif args.demo:
-        run_demo()
+        run_demo(quiet=args.quiet, no_color=args.no_color)
     else:
         # Normal CLI
         print("\n" + "=" * 60)
@@ -491,7 +558,7 @@ def main():
         data_manager.load_system_state(system)
         
         # CLI başlat
-        cli = CLI(system, data_manager)
+        cli = CLI(system, data_manager, quiet=args.quiet, no_color=args.no_color)
         
         try:
             cli.run()
@@ -12,11 +12,14 @@ Bu modül şunları içerir:
 """
 
 from datetime import datetime, timedelta, date
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass, field
 from enum import Enum
 import uuid
 import copy
+import heapq
+import itertools
+from collections import Counter, defaultdict
 
 # Veri yapılarını import et
 import sys
@@ -41,6 +44,20 @@ class ReservationStatus(Enum):
     NO_SHOW = "no_show"         # Gelmedi
 
 
+# Çakışma kontrolünde yok sayılan durumlar
+_INACTIVE_STATUSES = frozenset({ReservationStatus.CANCELLED, ReservationStatus.COMPLETED})
+# İstatistiklerde aktif sayılan durumlar
+_ACTIVE_STATUSES = frozenset({ReservationStatus.PENDING, ReservationStatus.CONFIRMED})
+
+# Salon/rezervasyon oluşturulduğunda ve sistem tarafından değiştirildiğinde verilen,
+# tekrar etmeyen revizyon numarası. Kayıt kaydedilirken to_dict çıktısının
+# önbellekten kullanılıp kullanılamayacağını belirler.
+_REVISIONS = itertools.count()
+
+# Aralık ağaçlarındaki dakika değerlerinin başlangıcı
+_EPOCH = datetime(1970, 1, 1)
+
+
 class RoomType(Enum):
     """Salon türü"""
     MEETING = "meeting"         # Toplantı odası
@@ -61,6 +78,7 @@ class Room:
     amenities: List[str] = field(default_factory=list)  # Projeksiyon, whiteboard vb.
     hourly_rate: float = 0.0
     is_active: bool = True
+    _rev: int = field(default_factory=_REVISIONS.__next__, init=False, repr=False, compare=False)
     
     def __hash__(self):
         return hash(self.id)
@@ -107,6 +125,7 @@ class Reservation:
     attendees: int = 1
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    _rev: int = field(default_factory=_REVISIONS.__next__, init=False, repr=False, compare=False)
     
     def __hash__(self):
         return hash(self.id)
@@ -182,6 +201,49 @@ class ReservationSystem:
         self._undo_manager = UndoRedoManager(max_history=100)
         self._waiting_list = WaitingList(on_available=self._notify_waiting_customer)
         self._action_log: List[dict] = []
+        
+        # Değişiklik sayacı (otomatik kaydetme için her değişiklikte artar)
+        self._version = 0
+        # Son kayıttan beri değişen kayıtların id'leri (artımlı kaydetme için)
+        self._dirty_rooms: Set[str] = set()
+        self._dirty_reservations: Set[str] = set()
+        
+        # Metin arama indeksi: id -> küçük harfli arama metni, 3-gram -> id kümesi
+        self._search_text: Dict[str, str] = {}
+        self._trigram_index: Dict[str, Set[str]] = {}
+        # Müşteri indeksi: küçük harfli e-posta -> id kümesi
+        self._by_customer: Dict[str, Set[str]] = {}
+        # Gün indeksi: başlangıç günü -> id kümesi (id -> indekslenen gün)
+        self._by_date: Dict[date, Set[str]] = {}
+        self._indexed_date: Dict[str, date] = {}
+        # Rezervasyonlar indekslenmeden toplu yüklendiyse True; ilk aramada indeks yeniden kurulur
+        self._search_index_stale = False
+        
+        # get_statistics sayım önbelleği: (anahtar, aktif salon, aktif rezervasyon)
+        self._stats_cache: Optional[Tuple[tuple, int, int]] = None
+        # Kullanım önbelleği: salon -> gün -> [dolu dakika, rezervasyon sayısı]
+        self._usage_cache: Optional[Tuple[tuple, Dict[str, Dict[date, List[int]]]]] = None
+    
+    @property
+    def version(self) -> int:
+        """Sistemde yapılan değişiklik sayısı"""
+        return self._version
+    
+    @property
+    def dirty_count(self) -> int:
+        """Son kayıttan beri değişen salon ve rezervasyon sayısı"""
+        return len(self._dirty_rooms) + len(self._dirty_reservations)
+    
+    def take_dirty_ids(self) -> Tuple[Set[str], Set[str]]:
+        """Değişen salon ve rezervasyon id'lerini al, işaretleri temizle"""
+        rooms, reservations = self._dirty_rooms, self._dirty_reservations
+        self._dirty_rooms, self._dirty_reservations = set(), set()
+        return rooms, reservations
+    
+    def restore_dirty_ids(self, rooms: Set[str], reservations: Set[str]) -> None:
+        """Kaydedilemeyen id'leri tekrar değişmiş olarak işaretle"""
+        self._dirty_rooms.update(rooms)
+        self._dirty_reservations.update(reservations)
     
     # ==================== SALON YÖNETİMİ ====================
     
@@ -203,6 +265,7 @@ class ReservationSystem:
         self._undo_manager.record_create("room", room.id, room.to_dict(), 
                                          f"Salon eklendi: {room.name}")
         
+        self._dirty_rooms.add(room.id)
         self._log_action("add_room", room.id, f"Salon eklendi: {room.name}")
         return True
     
@@ -225,10 +288,12 @@ class ReservationSystem:
         for key, value in kwargs.items():
             if hasattr(room, key):
                 setattr(room, key, value)
+        room._rev = next(_REVISIONS)
         
         self._undo_manager.record_update("room", room_id, old_state, room.to_dict(),
                                          f"Salon güncellendi: {room.name}")
         
+        self._dirty_rooms.add(room_id)
         self._log_action("update_room", room_id, f"Salon güncellendi: {room.name}")
         return True
     
@@ -253,6 +318,7 @@ class ReservationSystem:
         self._undo_manager.record_delete("room", room_id, old_state,
                                          f"Salon silindi: {room.name}")
         
+        self._dirty_rooms.add(room_id)
         self._log_action("delete_room", room_id, f"Salon silindi: {room.name}")
         return True
     
@@ -356,6 +422,7 @@ class ReservationSystem:
         # Rezervasyonu kaydet
         self._reservations[reservation.id] = reservation
         self._reservation_tree.insert(reservation.id, reservation)
+        self._index_reservation(reservation)
         
         # Interval Tree'ye ekle
         interval = Interval(
@@ -370,11 +437,58 @@ class ReservationSystem:
                                          reservation.to_dict(),
                                          f"Rezervasyon oluşturuldu: {reservation.title}")
         
+        self._dirty_reservations.add(reservation.id)
         self._log_action("create_reservation", reservation.id, 
                         f"Rezervasyon: {reservation.customer_name} - {room.name}")
         
         return True, f"Rezervasyon başarıyla oluşturuldu (ID: {reservation.id})"
     
+    def bulk_create_reservations(self, reservations: List[Reservation],
+                                 verify: bool = True) -> List[Reservation]:
+        """
+        Rezervasyonları toplu oluştur
+        
+        verify=True her biri için create_reservation kontrollerini çalıştırır.
+        verify=False çağıranın çakışma olmadığını garanti ettiği durum içindir:
+        salon dışındaki kontroller ve geri alma kayıtları atlanır, ağaçlar
+        sıralı listelerden toplu kurulur.
+        
+        Returns:
+            Oluşturulamayan rezervasyonlar
+        """
+        if verify:
+            return [res for res in reservations if not self.create_reservation(res)[0]]
+        
+        failed = []
+        added = []
+        intervals_by_room: Dict[str, List[Interval]] = defaultdict(list)
+        
+        for res in reservations:
+            if res.room_id not in self._rooms:
+                failed.append(res)
+                continue
+            self._reservations[res.id] = res
+            self._index_reservation(res)
+            self._dirty_reservations.add(res.id)
+            intervals_by_room[res.room_id].append(Interval(
+                self._datetime_to_minutes(res.start_time),
+                self._datetime_to_minutes(res.end_time),
+                res
+            ))
+            added.append(res)
+        
+        added.sort(key=lambda res: res.id)
+        self._reservation_tree.bulk_load([(res.id, res) for res in added])
+        for room_id, intervals in intervals_by_room.items():
+            intervals.sort(key=lambda interval: (interval.start, interval.end))
+            self._room_intervals[room_id].bulk_load(intervals)
+        
+        if added:
+            self._log_action("bulk_create_reservations", "",
+                             f"{len(added)} rezervasyon toplu oluşturuldu")
+        
+        return failed
+    
     def get_reservation(self, reservation_id: str) -> Optional[Reservation]:
         """
         Rezervasyon bilgisi al
@@ -408,6 +522,7 @@ class ReservationSystem:
                 setattr(reservation, key, value)
         
         reservation.updated_at = datetime.now()
+        reservation._rev = next(_REVISIONS)
         
         # Yeni zaman için çakışma kontrolü
         if 'start_time' in kwargs or 'end_time' in kwargs or 'room_id' in kwargs:
@@ -439,12 +554,14 @@ class ReservationSystem:
             reservation
         )
         self._room_intervals[reservation.room_id].insert(new_interval)
+        self._index_reservation(reservation)
         
         # Undo kaydı
         self._undo_manager.record_update("reservation", reservation_id,
                                          old_state, reservation.to_dict(),
                                          f"Rezervasyon güncellendi: {reservation.title}")
         
+        self._dirty_reservations.add(reservation_id)
         self._log_action("update_reservation", reservation_id, 
                         f"Güncellendi: {reservation.customer_name}")
         
@@ -463,6 +580,7 @@ class ReservationSystem:
         
         reservation.status = ReservationStatus.CANCELLED
         reservation.updated_at = datetime.now()
+        reservation._rev = next(_REVISIONS)
         
         # Interval'dan kaldır
         interval = Interval(
@@ -480,6 +598,7 @@ class ReservationSystem:
         # Bekleme listesine bildir
         self._waiting_list.notify_available(reservation.room_id)
         
+        self._dirty_reservations.add(reservation_id)
         self._log_action("cancel_reservation", reservation_id,
                         f"İptal: {reservation.customer_name} - {reason}")
         
@@ -504,11 +623,13 @@ class ReservationSystem:
         # Ağaçlardan kaldır
         del self._reservations[reservation_id]
         self._reservation_tree.delete(reservation_id)
+        self._unindex_reservation(reservation_id)
         
         # Undo kaydı
         self._undo_manager.record_delete("reservation", reservation_id, old_state,
                                          f"Rezervasyon silindi: {reservation.title}")
         
+        self._dirty_reservations.add(reservation_id)
         self._log_action("delete_reservation", reservation_id,
                         f"Silindi: {reservation.customer_name}")
         
@@ -533,15 +654,11 @@ class ReservationSystem:
         
         overlapping = self._room_intervals[room_id].find_overlapping(query_interval)
         
-        conflicts = []
-        for interval in overlapping:
-            reservation = interval.data
-            if reservation and (exclude_id is None or reservation.id != exclude_id):
-                if reservation.status not in [ReservationStatus.CANCELLED, 
-                                              ReservationStatus.COMPLETED]:
-                    conflicts.append(reservation)
-        
-        return conflicts
+        return [
+            reservation for reservation in (interval.data for interval in overlapping)
+            if reservation and reservation.status not in _INACTIVE_STATUSES
+            and (exclude_id is None or reservation.id != exclude_id)
+        ]
     
     def suggest_alternatives(self, room_id: str, start_time: datetime, 
                             duration_minutes: int, search_days: int = 7) -> List[dict]:
@@ -601,7 +718,7 @@ class ReservationSystem:
         """
         Belirtilen aralıkta müsait slotları bul
         
-        Zaman Karmaşıklığı: O(n log n) - sıralama dahil
+        Zaman Karmaşıklığı: O(log n + k) - interval tree sonuçları zaten sıralı
         """
         if room_id not in self._room_intervals:
             return []
@@ -612,22 +729,18 @@ class ReservationSystem:
             self._datetime_to_minutes(end)
         )
         
+        # Sonuçlar başlangıca göre sıralı geldiği için tek geçişte boşluklar bulunur
         existing = self._room_intervals[room_id].find_overlapping(query)
         
-        # Aktif rezervasyonları filtrele ve sırala
-        active = []
-        for interval in existing:
-            res = interval.data
-            if res and res.status not in [ReservationStatus.CANCELLED]:
-                active.append((res.start_time, res.end_time))
-        
-        active = quicksort(active, key=lambda x: x[0])
-        
-        # Boşlukları bul
         available = []
         current = start
         
-        for res_start, res_end in active:
+        for interval in existing:
+            res = interval.data
+            if not res or res.status == ReservationStatus.CANCELLED:
+                continue
+            res_start, res_end = res.start_time, res.end_time
+            
             if current < res_start:
                 gap = (res_start - current).total_seconds() / 60
                 if gap >= duration_minutes:
@@ -713,22 +826,25 @@ class ReservationSystem:
     
     def get_reservations_by_date(self, target_date: date) -> List[Reservation]:
         """Tarihe göre tüm rezervasyonları listele"""
+        self._ensure_search_index()
         results = []
         
-        for res in self._reservations.values():
-            if res.start_time.date() == target_date:
-                if res.status != ReservationStatus.CANCELLED:
-                    results.append(res)
+        for reservation_id in self._by_date.get(target_date, ()):
+            res = self._reservations[reservation_id]
+            if res.status != ReservationStatus.CANCELLED:
+                results.append(res)
         
         return quicksort(results, key=lambda r: (r.room_id, r.start_time))
     
     def get_reservations_by_customer(self, customer_email: str) -> List[Reservation]:
-        """Müşteriye göre rezervasyonları listele"""
-        results = []
+        """
+        Müşteriye göre rezervasyonları listele
         
-        for res in self._reservations.values():
-            if res.customer_email.lower() == customer_email.lower():
-                results.append(res)
+        Zaman Karmaşıklığı: O(1) indeks erişimi + O(k log k) sıralama
+        """
+        self._ensure_search_index()
+        ids = self._by_customer.get(customer_email.lower(), ())
+        results = [self._reservations[reservation_id] for reservation_id in ids]
         
         return quicksort(results, key=lambda r: r.start_time, reverse=True)
     
@@ -747,43 +863,137 @@ class ReservationSystem:
         
         return sorted_upcoming[:limit]
     
-    def search_reservations(self, query: str) -> List[Reservation]:
-        """Metin araması (müşteri adı, başlık, açıklama)"""
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        """Metnin 3 karakterlik parçaları"""
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    def _index_reservation(self, reservation: Reservation):
+        """Rezervasyonu arama indekslerine ekle (varsa eski kaydın yerine)"""
+        self._unindex_reservation(reservation.id)
+        
+        # Alanlar arasına girilemeyen bir ayraç konur, eşleşme alan sınırını aşmaz.
+        # E-posta son alandır; müşteri indeksinden çıkarırken buradan okunur.
+        text = "\x00".join((reservation.customer_name, reservation.title,
+                            reservation.description, reservation.customer_email)).lower()
+        self._search_text[reservation.id] = text
+        for gram in self._trigrams(text):
+            self._trigram_index.setdefault(gram, set()).add(reservation.id)
+        self._by_customer.setdefault(reservation.customer_email.lower(), set()).add(reservation.id)
+        day = reservation.start_time.date()
+        self._indexed_date[reservation.id] = day
+        self._by_date.setdefault(day, set()).add(reservation.id)
+    
+    def _unindex_reservation(self, reservation_id: str):
+        """Rezervasyonu arama indekslerinden çıkar"""
+        text = self._search_text.pop(reservation_id, None)
+        if text is None:
+            return
+        
+        email = text.rpartition("\x00")[2]
+        ids = self._by_customer.get(email)
+        if ids is not None:
+            ids.discard(reservation_id)
+            if not ids:
+                del self._by_customer[email]
+        
+        day = self._indexed_date.pop(reservation_id)
+        ids = self._by_date[day]
+        ids.discard(reservation_id)
+        if not ids:
+            del self._by_date[day]
+        
+        for gram in self._trigrams(text):
+            ids = self._trigram_index.get(gram)
+            if ids is not None:
+                ids.discard(reservation_id)
+                if not ids:
+                    del self._trigram_index[gram]
+    
+    def _clear_search_index(self):
+        """Arama, müşteri ve gün indekslerini boşalt"""
+        self._search_text.clear()
+        self._trigram_index.clear()
+        self._by_customer.clear()
+        self._by_date.clear()
+        self._indexed_date.clear()
+        self._search_index_stale = False
+    
+    def _ensure_search_index(self):
+        """Rezervasyonlar indekslenmeden toplu yüklendiyse indeksi yeniden kur"""
+        if not self._search_index_stale:
+            return
+        self._clear_search_index()
+        for res in self._reservations.values():
+            self._index_reservation(res)
+    
+    def iter_search_reservations(self, query: str) -> Iterator[Reservation]:
+        """
+        Metin araması - eşleşen rezervasyonları sırasız olarak üretir
+        
+        3 veya daha uzun sorgularda 3-gram kümeleri kesiştirilir, adaylar
+        alt dize kontrolüyle doğrulanır. Kısa sorgular indeks metnini tarar.
+        """
+        self._ensure_search_index()
         query_lower = query.lower()
-        results = []
         
-        for res in self._reservations.values():
-            if (query_lower in res.customer_name.lower() or
-                query_lower in res.title.lower() or
-                query_lower in res.description.lower() or
-                query_lower in res.customer_email.lower()):
-                results.append(res)
+        if len(query_lower) < 3:
+            candidates = self._search_text
+        else:
+            postings = []
+            for gram in self._trigrams(query_lower):
+                ids = self._trigram_index.get(gram)
+                if not ids:
+                    return
+                postings.append(ids)
+            postings.sort(key=len)
+            candidates = postings[0].intersection(*postings[1:])
+        
+        for reservation_id in candidates:
+            if query_lower in self._search_text[reservation_id]:
+                yield self._reservations[reservation_id]
+    
+    def search_reservations(self, query: str, limit: int = None) -> List[Reservation]:
+        """
+        Metin araması (müşteri adı, başlık, açıklama)
         
-        return quicksort(results, key=lambda r: r.start_time, reverse=True)
+        Args:
+            limit: Verilirse sadece en yeni `limit` sonuç döner - O(n log limit)
+        """
+        matches = self.iter_search_reservations(query)
+        if limit is not None:
+            return heapq.nlargest(limit, matches, key=lambda r: r.start_time)
+        return quicksort(list(matches), key=lambda r: r.start_time, reverse=True)
     
     def get_room_utilization(self, room_id: str, 
                              start_date: date, end_date: date) -> dict:
-        """Salon kullanım oranını hesapla"""
+        """
+        Salon kullanım oranını hesapla
+        
+        Günlük dolu dakikalar önbellekten okunur - O(gün sayısı)
+        """
         room = self.get_room(room_id)
         if not room:
             return {}
         
+        usage = self._get_daily_usage().get(room_id, {})
         total_minutes = 0
         used_minutes = 0
         reservation_count = 0
         
         current = start_date
+        one_day = timedelta(days=1)
         while current <= end_date:
             # Günlük çalışma saatleri (9 saat = 540 dakika)
             total_minutes += 540
             
             # O güne ait rezervasyonlar
-            for res in self.get_reservations_by_room(room_id, current):
-                if res.status != ReservationStatus.CANCELLED:
-                    used_minutes += res.duration_minutes
-                    reservation_count += 1
+            day_usage = usage.get(current)
+            if day_usage is not None:
+                used_minutes += day_usage[0]
+                reservation_count += day_usage[1]
             
-            current += timedelta(days=1)
+            current += one_day
         
         utilization = (used_minutes / total_minutes * 100) if total_minutes > 0 else 0
         
@@ -797,39 +1007,69 @@ class ReservationSystem:
             "reservation_count": reservation_count
         }
     
-    def get_daily_report(self, target_date: date) -> dict:
-        """Günlük rapor oluştur"""
-        reservations = self.get_reservations_by_date(target_date)
+    def _get_daily_usage(self) -> Dict[str, Dict[date, List[int]]]:
+        """
+        Salon ve başlangıç gününe göre dolu dakika / rezervasyon sayısı
+        
+        Tablo sadece sistem değiştiğinde (sürüm veya kayıt sayısı) yeniden kurulur.
+        """
+        key = (self._version, len(self._rooms), len(self._reservations))
+        if self._usage_cache is None or self._usage_cache[0] != key:
+            usage: Dict[str, Dict[date, List[int]]] = {}
+            for res in self._reservations.values():
+                if res.status == ReservationStatus.CANCELLED:
+                    continue
+                by_day = usage.setdefault(res.room_id, {})
+                day = res.start_time.date()
+                day_usage = by_day.get(day)
+                if day_usage is None:
+                    day_usage = by_day[day] = [0, 0]
+                day_usage[0] += res.duration_minutes
+                day_usage[1] += 1
+            self._usage_cache = (key, usage)
+        
+        return self._usage_cache[1]
+    
+    def get_daily_report(self, target_date: date,
+                         reservations: List[Reservation] = None) -> dict:
+        """
+        Günlük rapor oluştur
+        
+        Sadece o günün rezervasyonları (gün indeksi) tek geçişte toplanır.
+        Çağıran günün listesini zaten gruplamışsa reservations ile verebilir.
+        """
+        if reservations is None:
+            reservations = self.get_reservations_by_date(target_date)
+        rooms = self._rooms
         
         total_revenue = 0
-        by_room = {}
-        by_status = {}
+        by_room = defaultdict(lambda: {"count": 0, "minutes": 0, "revenue": 0})
+        by_status = Counter()
         
         for res in reservations:
-            room = self.get_room(res.room_id)
+            room = rooms.get(res.room_id)
             
-            # Gelir hesabı
+            # Gelir hesabı (süre rezervasyon başına bir kez hesaplanır)
             if room:
-                revenue = res.duration_hours * room.hourly_rate
+                minutes = res.duration_minutes
+                revenue = minutes / 60 * room.hourly_rate
                 total_revenue += revenue
                 
                 # Salon bazlı
-                if room.name not in by_room:
-                    by_room[room.name] = {"count": 0, "minutes": 0, "revenue": 0}
-                by_room[room.name]["count"] += 1
-                by_room[room.name]["minutes"] += res.duration_minutes
-                by_room[room.name]["revenue"] += revenue
+                room_stats = by_room[room.name]
+                room_stats["count"] += 1
+                room_stats["minutes"] += minutes
+                room_stats["revenue"] += revenue
             
             # Durum bazlı
-            status = res.status.value
-            by_status[status] = by_status.get(status, 0) + 1
+            by_status[res.status.value] += 1
         
         return {
             "date": target_date.isoformat(),
             "total_reservations": len(reservations),
             "total_revenue": round(total_revenue, 2),
-            "by_room": by_room,
-            "by_status": by_status
+            "by_room": dict(by_room),
+            "by_status": dict(by_status)
         }
     
     # ==================== BEKLEME LİSTESİ ====================
@@ -850,6 +1090,14 @@ class ReservationSystem:
         entry = self._waiting_list.remove(customer_id)
         return entry is not None
     
+    def get_next_waiting(self) -> Optional[WaitingEntry]:
+        """Sıradaki bekleyen müşteri (çıkarmadan) - O(1)"""
+        return self._waiting_list.get_next()
+    
+    def serve_next_waiting(self) -> Optional[WaitingEntry]:
+        """Sıradaki müşteriyi çağır ve listeden çıkar - O(1)"""
+        return self._waiting_list.serve_next()
+    
     def get_waiting_list_position(self, customer_id: str) -> int:
         """Bekleme listesindeki pozisyonu al"""
         return self._waiting_list.get_position(customer_id)
@@ -858,6 +1106,14 @@ class ReservationSystem:
         """Bekleme listesini al"""
         return self._waiting_list.get_all()
     
+    def iter_waiting_list(self) -> Iterator[WaitingEntry]:
+        """Bekleme listesini öncelik sırasıyla gez (liste kopyası oluşturmadan)"""
+        return iter(self._waiting_list)
+    
+    def get_waiting_list_size(self) -> int:
+        """Bekleme listesindeki kişi sayısı - O(1)"""
+        return len(self._waiting_list)
+    
     def _notify_waiting_customer(self, entry: WaitingEntry):
         """Bekleme listesindeki müşteriye bildirim (callback)"""
         print(f"[BİLDİRİM] {entry.customer_name} için yer açıldı!")
@@ -871,6 +1127,8 @@ class ReservationSystem:
         action = self._undo_manager.undo()
         if action:
             self._apply_undo_action(action)
+            self._mark_dirty(action)
+            self._version += 1
             return f"Geri alındı: {action.description}"
         return None
     
@@ -879,9 +1137,18 @@ class ReservationSystem:
         action = self._undo_manager.redo()
         if action:
             self._apply_redo_action(action)
+            self._mark_dirty(action)
+            self._version += 1
             return f"Yinelendi: {action.description}"
         return None
     
+    def _mark_dirty(self, action: Action):
+        """Geri alınan/yinelenen kaydı bir sonraki kayıt için işaretle"""
+        if action.entity_type == "reservation":
+            self._dirty_reservations.add(action.entity_id)
+        elif action.entity_type == "room":
+            self._dirty_rooms.add(action.entity_id)
+    
     def _apply_undo_action(self, action: Action):
         """Undo işlemini uygula"""
         if action.action_type == ActionType.CREATE:
@@ -942,6 +1209,7 @@ class ReservationSystem:
             
             del self._reservations[reservation_id]
             self._reservation_tree.delete(reservation_id)
+            self._unindex_reservation(reservation_id)
     
     def _force_delete_room(self, room_id: str):
         """Salonu zorla sil (undo/redo için)"""
@@ -971,6 +1239,8 @@ class ReservationSystem:
             
             self._reservations[reservation_id] = reservation
         
+        self._index_reservation(reservation)
+        
         # Interval ekle
         interval = Interval(
             self._datetime_to_minutes(reservation.start_time),
@@ -1008,11 +1278,19 @@ class ReservationSystem:
     # ==================== YARDIMCI METODLAR ====================
     
     def _datetime_to_minutes(self, dt: datetime) -> int:
-        """DateTime'ı dakikaya çevir (epoch'tan)"""
-        return int(dt.timestamp() / 60)
+        """
+        DateTime'ı dakikaya çevir (epoch'tan)
+        
+        Saat dilimsiz değerler timestamp() yerine doğrudan tarih aritmetiğiyle
+        çevrilir (yerel saat/mktime hesabı yapılmaz).
+        """
+        if dt.tzinfo is not None:
+            return int(dt.timestamp() / 60)
+        return (dt - _EPOCH).days * 1440 + dt.hour * 60 + dt.minute
     
     def _log_action(self, action: str, entity_id: str, description: str):
         """İşlem günlüğüne kaydet"""
+        self._version += 1
         self._action_log.append({
             "timestamp": datetime.now().isoformat(),
             "action": action,
@@ -1025,14 +1303,23 @@ class ReservationSystem:
         return self._action_log[-limit:]
     
     def get_statistics(self) -> dict:
-        """Genel sistem istatistikleri"""
-        active_reservations = sum(1 for r in self._reservations.values() 
-                                  if r.status in [ReservationStatus.PENDING, 
-                                                  ReservationStatus.CONFIRMED])
+        """
+        Genel sistem istatistikleri
+        
+        Sayımlar sadece sistem değiştiğinde (sürüm veya kayıt sayısı) yeniden yapılır.
+        """
+        key = (self._version, len(self._rooms), len(self._reservations))
+        if self._stats_cache is None or self._stats_cache[0] != key:
+            active_rooms = sum(1 for r in self._rooms.values() if r.is_active)
+            active_reservations = sum(1 for r in self._reservations.values()
+                                      if r.status in _ACTIVE_STATUSES)
+            self._stats_cache = (key, active_rooms, active_reservations)
+        
+        _, active_rooms, active_reservations = self._stats_cache
         
         return {
             "total_rooms": len(self._rooms),
-            "active_rooms": sum(1 for r in self._rooms.values() if r.is_active),
+            "active_rooms": active_rooms,
             "total_reservations": len(self._reservations),
             "active_reservations": active_reservations,
             "waiting_list_size": len(self._waiting_list),